@@ -28,3 +28,14 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if option in item.keywords:
                 item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def clear_docker_clients():
+    from timeeval.adapters.docker import _clear_docker_clients, _remove_warm_containers
+
+    # tests replace the Docker client with mocks, so they must not see the client of a previous test
+    _clear_docker_clients()
+    yield
+    _remove_warm_containers()
+    _clear_docker_clients()
@@ -0,0 +1,77 @@
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(".")
+
+from timeeval.utils.datasets import BINARY_DATASET_SUFFIX, load_dataset, save_binary_dataset
+
+
+def convert2tsbin(input: Path, output: Path) -> None:
+    df = load_dataset(input)
+    save_binary_dataset(df, output)
+
+
+def convert_dataset_folder(data_folder: Path, update_index: bool = False) -> None:
+    index_path = data_folder / "datasets.csv"
+    df_index = pd.read_csv(index_path)
+    for column in ["test_path", "train_path"]:
+        new_paths = []
+        for path in df_index[column]:
+            if pd.isna(path) or str(path).endswith(BINARY_DATASET_SUFFIX):
+                new_paths.append(path)
+                continue
+            input = Path(path)
+            output = input.parent / (input.name.rsplit(".", 1)[0] + BINARY_DATASET_SUFFIX)
+            print(f"Converting {input} -> {output}")
+            convert2tsbin(data_folder / input, data_folder / output)
+            new_paths.append(str(output))
+        df_index[column] = new_paths
+    if update_index:
+        df_index.to_csv(index_path, index=False)
+
+
+def _create_arg_parser():
+    argument_parser = argparse.ArgumentParser(
+        description=f"Converts datasets in TimeEval's canonical CSV format to the binary columnar format "
+                    f"({BINARY_DATASET_SUFFIX}-directories)."
+    )
+
+    argument_parser.add_argument(
+        "--input",
+        type=Path,
+        help="Path to a single CSV dataset."
+    )
+
+    argument_parser.add_argument(
+        "--output",
+        type=Path,
+        help=f"Output path for the single dataset (should end with {BINARY_DATASET_SUFFIX})."
+    )
+
+    argument_parser.add_argument(
+        "--data-folder",
+        type=Path,
+        help="Converts all datasets listed in the datasets.csv-file of this dataset folder."
+    )
+
+    argument_parser.add_argument(
+        "--update-index",
+        action="store_true",
+        help="Points the datasets.csv-file of the dataset folder to the converted datasets."
+    )
+
+    return argument_parser
+
+
+if __name__ == "__main__":
+    parser = _create_arg_parser()
+    args = parser.parse_args()
+    if args.data_folder:
+        convert_dataset_folder(args.data_folder, args.update_index)
+    elif args.input and args.output:
+        convert2tsbin(args.input, args.output)
+    else:
+        parser.error("either --data-folder or --input and --output are required")
@@ -15,6 +15,7 @@ from timeeval.data_types import ExecutionType
 from timeeval._core.experiments import Experiment as TimeEvalExperiment
 from timeeval.heuristics import inject_heuristic_values
 from timeeval.utils.datasets import load_labels_only
+from timeeval.utils.scores import find_scores_file, read_scores_file, save_scores
 from timeeval_experiments.algorithm_configurator import AlgorithmConfigurator
 
 # required to build a lookup-table for algorithm implementations
@@ -252,7 +253,7 @@ class ResultSummary:
         dataset_path = self.dmgr.get_dataset_path((exp.collection_name, exp.dataset_name), train=False)
 
         self._logger.info(f"Re-calculating quality metrics for {exp.name}")
-        y_scores = np.genfromtxt(exp.path / DOCKER_SCORES_FILE_NAME, delimiter=",")
+        y_scores = read_scores_file(exp.path / DOCKER_SCORES_FILE_NAME)
         if exp.algorithm.postprocess:
             dataset = self.dmgr.get(exp.collection_name, exp.dataset_name)
 
@@ -284,10 +285,10 @@ class ResultSummary:
         y_true = load_labels_only(dataset_path)
         y_true, y_scores = TimeEvalExperiment.scale_scores(y_true, y_scores)
 
-        if not (exp.path / ANOMALY_SCORES_TS).exists():
+        if find_scores_file(exp.path / ANOMALY_SCORES_TS) is None:
             self._logger.warning(f"{exp.name}: Anomaly scores are missing, recreating!")
             # persist scores to disk
-            y_scores.tofile(str(exp.path / ANOMALY_SCORES_TS), sep="\n")
+            save_scores(y_scores, exp.path / ANOMALY_SCORES_TS)
 
         results = {}
         errors = 0
@@ -10,6 +10,7 @@ import pandas as pd
 from timeeval.constants import ANOMALY_SCORES_TS, RESULTS_CSV
 from timeeval.datasets.datasets import Datasets
 from timeeval.utils.results_path import generate_experiment_path
+from timeeval.utils.scores import load_scores
 
 
 class Logger:
@@ -57,7 +58,7 @@ def get_experiment_path(args: argparse.Namespace) -> Path:
 def get_anomaly_scores(args: argparse.Namespace) -> np.ndarray:
     logger.log("Loading Anomaly Scores")
     directory = get_experiment_path(args)
-    return np.genfromtxt(directory / ANOMALY_SCORES_TS)
+    return load_scores(directory / ANOMALY_SCORES_TS)
 
 
 def get_dataset(args: argparse) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -4,8 +4,9 @@ import multiprocessing
 
 import multiprocessing_logging
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 
 import numpy as np
 import pandas as pd
@@ -14,8 +15,9 @@ from tqdm import tqdm
 
 from timeeval import Algorithm, Metric, DefaultMetrics, MultiDatasetManager
 from timeeval.constants import RESULTS_CSV, METRICS_CSV, ANOMALY_SCORES_TS
-from timeeval.metrics import FScoreAtK, PrecisionAtK
+from timeeval.metrics import FScoreAtK, PrecisionAtK, LabelContext
 from timeeval.utils.datasets import load_labels_only
+from timeeval.utils.scores import find_scores_file, load_scores
 from timeeval.utils.tqdm_joblib import tqdm_joblib
 
 
@@ -42,6 +44,18 @@ def init_logging():
         multiprocessing_logging.install_mp_handler()
 
 
+@dataclass
+class _Task:
+    index: int
+    s_exp: pd.Series
+    metrics_path: Path
+    metric_scores: Dict[str, Any]
+    metric_list: List[str]
+    y_scores: np.ndarray
+    results: Dict[str, float] = field(default_factory=dict)
+    errors: int = 0
+
+
 def path_is_empty(path: Path) -> bool:
     return not any(path.iterdir())
 
@@ -89,34 +103,65 @@ class MetricComputor:
         return algos
 
     def recompute(self, recompute_existing: bool = False):
-        exp_indices = self.df.index.values
-        self._logger.info(f"Re-computing the metrics of {len(exp_indices)} experiments from folder {self.results_path}")
-        with tqdm_joblib(tqdm(desc="Re-computing metrics", total=len(exp_indices))):
-            updated_entries: List[pd.Series] = Parallel(n_jobs=self._n_jobs)(
-                delayed(self._process_entry)(self.df.iloc[i].copy(), i, recompute_existing) for i in exp_indices
+        # all experiments on the same dataset share the labels, so that their metrics can be computed in a batch
+        dataset_groups = list(self.df.groupby(["collection", "dataset"], dropna=False).indices.values())
+        self._logger.info(f"Re-computing the metrics of {len(self.df)} experiments on {len(dataset_groups)} datasets "
+                          f"from folder {self.results_path}")
+        with tqdm_joblib(tqdm(desc="Re-computing metrics", total=len(dataset_groups))):
+            updated_groups: List[List[pd.Series]] = Parallel(n_jobs=self._n_jobs)(
+                delayed(self._process_dataset)([self.df.iloc[i].copy() for i in indices], indices, recompute_existing)
+                for indices in dataset_groups
             )
+        updated_entries: List[pd.Series] = [pd.Series(dtype=object)] * len(self.df)
+        for indices, entries in zip(dataset_groups, updated_groups):
+            for i, s_exp in zip(indices, entries):
+                updated_entries[i] = s_exp
         self.df = pd.DataFrame(updated_entries)
         self._logger.info(f"Overwriting results file at {self.results_path / RESULTS_CSV}")
         self.df.to_csv(self.results_path / RESULTS_CSV, index=False)
 
-    def _process_entry(self, s_exp: pd.Series, i: int, recompute_existing: bool = False) -> pd.Series:
+    def _process_dataset(self, s_exps: List[pd.Series], indices: np.ndarray,
+                         recompute_existing: bool = False) -> List[pd.Series]:
         init_logging()
         logger = logging.getLogger(f"{MetricComputor.__name__}.{multiprocessing.current_process().pid}")
+
+        tasks: List[_Task] = []
+        for s_exp, i in zip(s_exps, indices):
+            task = self._prepare_entry(s_exp, i, logger, recompute_existing)
+            if task is not None:
+                tasks.append(task)
+        if len(tasks) == 0:
+            return s_exps
+
+        s_exp = tasks[0].s_exp
+        logger.info(f"Computing metrics for {len(tasks)} experiments on dataset {s_exp.collection}/{s_exp.dataset}")
+        labels = LabelContext(load_labels_only(self.dmgr.get_dataset_path((s_exp.collection, s_exp.dataset))))
+        for metric in self.metrics:
+            metric_tasks = [task for task in tasks if metric.name in task.metric_list]
+            if len(metric_tasks) == 0:
+                continue
+            self._compute_metric(metric, labels, metric_tasks, logger)
+
+        for task in tasks:
+            self._finish_entry(task, logger)
+        return s_exps
+
+    def _prepare_entry(self, s_exp: pd.Series, i: int, logger: logging.Logger,
+                       recompute_existing: bool = False) -> Optional[_Task]:
         if s_exp.status in ["Status.ERROR", "Status.TIMEOUT"]:
             logger.info(f"Exp-{i:06d}: Skipping because experiment was not successful.")
-            return s_exp
+            return None
 
         exp_path = self._exp_path(s_exp)
         processed_scores_path = exp_path / ANOMALY_SCORES_TS
         metrics_path = exp_path / METRICS_CSV
 
-        if not processed_scores_path.exists():
+        if find_scores_file(processed_scores_path) is None:
             logger.error(f"Exp-{i:06d}: Skipping because no anomaly scores found!")
-            return s_exp
+            return None
 
         logger.info(f"Exp-{i:06d}: Starting processing ...")
-        y_true = load_labels_only(self.dmgr.get_dataset_path((s_exp.collection, s_exp.dataset)))
-        y_scores = np.genfromtxt(processed_scores_path, delimiter=",")
+        y_scores = load_scores(processed_scores_path)
 
         if not metrics_path.exists():
             metric_scores = {}
@@ -134,35 +179,46 @@ class MetricComputor:
             metric_list = [m.name for m in self.metrics if m.name not in metric_scores]
             if len(metric_list) == 0:
                 logger.info(f"Exp-{i:06d}: ... skipping re-assessment of metrics, they are all present.")
-                return s_exp
+                return None
+        return _Task(i, s_exp, metrics_path, metric_scores, metric_list, y_scores)
 
-        results = {}
-        errors = 0
-        for metric in self.metrics:
-            if metric.name not in metric_list:
-                continue
+    @staticmethod
+    def _compute_metric(metric: Metric, labels: LabelContext, tasks: List[_Task], logger: logging.Logger) -> None:
+        try:
+            # all scorings of the dataset in a single batch
+            scores = metric.score_many(labels, np.vstack([task.y_scores for task in tasks]))
+            for task, score in zip(tasks, scores):
+                task.results[metric.name] = score
+            return
+        except Exception as e:
+            logger.debug(f"Batch computation of metric {metric.name} failed, scoring experiments separately!",
+                         exc_info=e)
+
+        for task in tasks:
             try:
-                score = metric(y_true, y_scores)
-                results[metric.name] = score
+                task.results[metric.name] = metric.score_many(labels, task.y_scores[np.newaxis, :])[0]
             except Exception as e:
-                logger.warning(f"Exp-{i:06d}: Exception while computing metric {metric.name}!", exc_info=e)
-                errors += 1
-                continue
+                logger.warning(f"Exp-{task.index:06d}: Exception while computing metric {metric.name}!", exc_info=e)
+                task.errors += 1
+
+    def _finish_entry(self, task: _Task, logger: logging.Logger) -> None:
+        i = task.index
+        s_exp = task.s_exp
+        metric_scores = task.metric_scores
 
         # update metrics and write them to disk
-        metric_scores.update(results)
+        metric_scores.update(task.results)
         if metric_scores and self._save_to_dir:
-            logger.debug(f"Exp-{i:06d}: Writing updated metrics to {metrics_path}!")
-            pd.DataFrame([metric_scores]).to_csv(metrics_path, index=False)
+            logger.debug(f"Exp-{i:06d}: Writing updated metrics to {task.metrics_path}!")
+            pd.DataFrame([metric_scores]).to_csv(task.metrics_path, index=False)
 
-        if metric_scores and errors == 0:
+        if metric_scores and task.errors == 0:
             logger.debug(f"Exp-{i:06d}: Updating metrics in index file.")
             for metric_name in metric_scores:
                 s_exp[metric_name] = metric_scores[metric_name]
         else:
             logger.warning(f"Exp-{i:06d}: No metrics computed!")
         logger.info(f"Exp-{i:06d}: ... finished processing.")
-        return s_exp
 
     def _exp_path(self, exp: pd.Series) -> Path:
         return (self.results_path
@@ -2,6 +2,7 @@ import argparse
 import json
 import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -13,8 +14,9 @@ from timeeval.adapters.docker import SCORES_FILE_NAME as DOCKER_SCORES_FILE_NAME
 from timeeval.constants import RESULTS_CSV, HYPER_PARAMETERS, METRICS_CSV, ANOMALY_SCORES_TS
 from timeeval.data_types import ExecutionType
 from timeeval._core.experiments import Experiment as TimeEvalExperiment
-from timeeval.metrics import FScoreAtK, PrecisionAtK
+from timeeval.metrics import FScoreAtK, PrecisionAtK, LabelContext
 from timeeval.utils.datasets import load_labels_only
+from timeeval.utils.scores import find_scores_file, load_scores, read_scores_file, save_scores
 
 # required to build a lookup-table for algorithm implementations
 import timeeval_experiments.algorithms as algorithms
@@ -88,13 +90,14 @@ class Evaluator:
                                    "does not contain any results to start with (scores or hyper params are missing)!")
                 continue
 
-            y_true = load_labels_only(self.dmgr.get_dataset_path((s_exp.collection, s_exp.dataset)))
-            if not evaluate_successful and processed_scores_path.exists():
+            labels = self._labels(s_exp.collection, s_exp.dataset)
+            y_true = labels.y_true
+            if not evaluate_successful and find_scores_file(processed_scores_path) is not None:
                 self._logger.debug(f"Exp-{i:06d}: Skipping reprocessing of anomaly scores, they are present.")
-                y_scores = np.genfromtxt(processed_scores_path, delimiter=",")
+                y_scores = load_scores(processed_scores_path)
             else:
                 self._logger.debug(f"Exp-{i:06d}: Processing anomaly scores.")
-                y_scores = np.genfromtxt(docker_scores_path, delimiter=",")
+                y_scores = read_scores_file(docker_scores_path)
                 post_fn = self.algos[s_exp.algorithm].postprocess
                 if post_fn is not None:
                     with params_path.open("r") as fh:
@@ -109,7 +112,7 @@ class Evaluator:
                     y_scores = post_fn(y_scores, args)
                 _, y_scores = TimeEvalExperiment.scale_scores(y_true, y_scores)
                 self._logger.info(f"Exp-{i:06d}: Writing anomaly scores to {processed_scores_path}.")
-                y_scores.tofile(str(processed_scores_path), sep="\n")
+                save_scores(y_scores, processed_scores_path)
 
             if not metrics_path.exists():
                 metric_scores = {}
@@ -125,7 +128,7 @@ class Evaluator:
                 errors = 0
                 for metric_name in self.metrics:
                     try:
-                        score = metric_name(y_true, y_scores)
+                        score = metric_name.score_many(labels, y_scores[np.newaxis, :])[0]
                         results[metric_name.name] = score
                     except Exception as e:
                         self._logger.warning(f"Exp-{i:06d}: Exception while computing metric {metric_name}!", exc_info=e)
@@ -154,6 +157,11 @@ class Evaluator:
         self._logger.info(f"Overwriting results file at {self.results_path / RESULTS_CSV}")
         self.df.to_csv(self.results_path / RESULTS_CSV, index=False)
 
+    @lru_cache(maxsize=8)
+    def _labels(self, collection: str, dataset: str) -> LabelContext:
+        # the label context shares the label-side structures of the metrics between experiments on the same dataset
+        return LabelContext(load_labels_only(self.dmgr.get_dataset_path((collection, dataset))))
+
     def _exp_path(self, exp: pd.Series) -> Path:
         return (self.results_path
                 / exp.algorithm
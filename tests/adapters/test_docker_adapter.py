@@ -1,28 +1,42 @@
+import io
+import json
 import tempfile
+import time
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
 from typing import List
 from unittest.mock import patch
 
 import docker
 import numpy as np
+import pandas as pd
 import psutil
 import pytest
 from docker.models.containers import Container
 from durations import Duration
 
-from tests.fixtures.docker_mocks import MockDockerClient, TEST_DOCKER_IMAGE
+from tests.fixtures.docker_mocks import MockDockerClient, MockImages, TEST_DOCKER_IMAGE
 from timeeval import ResourceConstraints
 from timeeval.adapters import DockerAdapter
 from timeeval.adapters.docker import (
     DATASET_TARGET_PATH,
     RESULTS_TARGET_PATH,
     SCORES_FILE_NAME,
+    BINARY_SCORES_FILE_NAME,
     MODEL_FILE_NAME,
+    BATCH_EXECUTION_LABEL,
+    BATCH_TIME_FILE_NAME,
+    WARM_CONTAINER_ENTRYPOINT,
+    CONTAINER_LOG_FILE_NAME,
+    RESOURCE_USAGE_FILE_NAME,
     DockerTimeoutError,
     DockerMemoryError,
     DockerAlgorithmFailedError,
-    AlgorithmInterface
+    AlgorithmInterface,
+    _LogPump,
+    _WARM_CONTAINERS,
+    _clear_docker_clients
 )
 from timeeval.data_types import ExecutionType
 
@@ -80,6 +94,27 @@ class TestDockerAdapter(unittest.TestCase):
             result = adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
         np.testing.assert_array_equal(result, np.arange(10, dtype=np.float64))
 
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_binary_scores(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image", binary_scores=True)
+            result = adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+            self.assertTrue((Path(tmp_path) / BINARY_SCORES_FILE_NAME).is_file())
+        self.assertIn('"binaryOutput": true', docker_mock.containers.cmd)
+        self.assertIn(f'"dataOutput": "{RESULTS_TARGET_PATH / BINARY_SCORES_FILE_NAME}"', docker_mock.containers.cmd)
+        np.testing.assert_array_equal(result, np.arange(10, dtype=np.float64))
+
+    def test_binary_scores_fallback_to_text(self):
+        # algorithms that do not support the binaryOutput flag write text to the output file
+        with tempfile.TemporaryDirectory() as tmp_path:
+            np.arange(10, dtype=np.float64).tofile(Path(tmp_path) / BINARY_SCORES_FILE_NAME, sep="\n")
+            adapter = DockerAdapter("test-image", binary_scores=True)
+            result = adapter._read_results({"results_path": Path(tmp_path)})
+        np.testing.assert_array_equal(result, np.arange(10, dtype=np.float64))
+
     @patch("timeeval.adapters.docker.docker.from_env")
     def test_assertion_error(self, mock_client):
         mock_docker_client = MockDockerClient()
@@ -132,6 +167,376 @@ class TestDockerAdapter(unittest.TestCase):
         self.assertEqual(run_kwargs["memswap_limit"], mem_overwrite)
         self.assertEqual(run_kwargs["nano_cpus"], cpu_overwrite * 1e9)
 
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_reuses_docker_client(self, mock_client):
+        mock_client.return_value = MockDockerClient(write_scores_file=True)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image")
+            adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+            adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+        mock_client.assert_called_once()
+
+    def test_prepare_fn_equality(self):
+        prepare_fn = DockerAdapter("test-image", tag="1.0").get_prepare_fn()
+        self.assertEqual(prepare_fn, DockerAdapter("test-image", tag="1.0", timeout=Duration("1 second")).get_prepare_fn())
+        self.assertNotEqual(prepare_fn, DockerAdapter("test-image", tag="2.0").get_prepare_fn())
+        self.assertEqual(len({prepare_fn, DockerAdapter("test-image", tag="1.0").get_prepare_fn()}), 1)
+        self.assertIsNone(DockerAdapter("test-image", skip_pull=True).get_prepare_fn())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_prepare_skips_current_image(self, mock_client):
+        mock_docker_client = MockDockerClient()
+        mock_docker_client.images = MockImages(local_digest="sha256:abc", registry_digest="sha256:abc")
+        mock_client.return_value = mock_docker_client
+
+        DockerAdapter("test-image", tag="1.0").get_prepare_fn()()
+        self.assertListEqual(mock_docker_client.images.pulled, [])
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_prepare_pulls_outdated_image(self, mock_client):
+        for images in [MockImages(local_digest="sha256:abc", registry_digest="sha256:def"),
+                       MockImages(registry_digest="sha256:def"),
+                       MockImages(local_digest="sha256:abc")]:
+            mock_docker_client = MockDockerClient()
+            mock_docker_client.images = images
+            mock_client.return_value = mock_docker_client
+            _clear_docker_clients()
+
+            DockerAdapter("test-image", tag="1.0").get_prepare_fn()()
+            self.assertListEqual(images.pulled, ["test-image:1.0"])
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_warm_container(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            tmp_path = Path(tmp_path)
+            (tmp_path / MODEL_FILE_NAME).touch()
+            adapter = DockerAdapter("test-image", warm_container=True)
+            for _ in range(2):
+                result = adapter(Path("tests/example_data/data.txt"), {"results_path": tmp_path})
+                np.testing.assert_array_equal(result, np.arange(10, dtype=np.float64))
+                self.assertListEqual(sorted(p.name for p in tmp_path.iterdir()), [SCORES_FILE_NAME, MODEL_FILE_NAME])
+            scratch_path = docker_mock.containers.results_path
+            self.assertListEqual(list(scratch_path.iterdir()), [])
+
+        self.assertEqual(docker_mock.containers.started, 1)
+        self.assertListEqual(docker_mock.containers.run_kwargs["entrypoint"], WARM_CONTAINER_ENTRYPOINT)
+        first, second = docker_mock.api.exec_cmds
+        self.assertListEqual(first[:2], ["/entrypoint.sh", "execute-algorithm"])
+        # each run uses its own folder in the scratch volume
+        self.assertNotEqual(first[-1], second[-1])
+        self.assertRegex(first[-1], f'"dataOutput": "{RESULTS_TARGET_PATH}/[0-9a-f]+/{SCORES_FILE_NAME}"')
+
+        adapter.get_finalize_fn()()
+        self.assertTrue(docker_mock.containers.removed)
+        self.assertFalse(scratch_path.exists())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_warm_container_restarts_stale_container(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image", warm_container=True)
+            adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+            scratch_path = docker_mock.containers.results_path
+
+            # the finalize step of the driver removes the containers but not the ones known to the worker process
+            docker_mock.containers.remove(force=True)
+            adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+            self.assertEqual(docker_mock.containers.started, 2)
+            self.assertFalse(scratch_path.exists())
+            scratch_path = docker_mock.containers.results_path
+
+            # the scratch folders of other processes are removed using the container labels
+            _WARM_CONTAINERS.clear()
+            adapter.get_finalize_fn()()
+            self.assertFalse(scratch_path.exists())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_warm_container_oom(self, mock_client):
+        docker_mock = MockDockerClient(exec_exit_code=137)
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image", warm_container=True)
+            with self.assertRaises(DockerMemoryError):
+                adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+        # the container survives failing algorithms
+        self.assertFalse(docker_mock.containers.removed)
+
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_warm_container_timeout(self, mock_client):
+        docker_mock = MockDockerClient()
+        mock_client.return_value = docker_mock
+
+        def running_algorithm():
+            # the output stream ends when the container is killed
+            while not docker_mock.containers.stopped:
+                time.sleep(0.01)
+            yield b""
+
+        docker_mock.api.exec_start = lambda exec_id, stream: running_algorithm()
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image", timeout=Duration("100 miliseconds"), warm_container=True)
+            with self.assertRaises(DockerTimeoutError):
+                adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+        self.assertTrue(docker_mock.containers.removed)
+        self.assertFalse(docker_mock.containers.results_path.exists())
+
+
+    def _batch_args(self, tmp_path: Path, n: int = 3) -> List[dict]:
+        for i in range(n):
+            (tmp_path / str(i)).mkdir(exist_ok=True)
+        return [{"results_path": tmp_path / str(i), "hyper_params": {"a": i}, "executionType": ExecutionType.EXECUTE}
+                for i in range(n)]
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_batch_execution(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True, image_labels={BATCH_EXECUTION_LABEL: "true"})
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            tmp_path = Path(tmp_path)
+            adapter = DockerAdapter("test-image", batch_size=3)
+            self.assertEqual(adapter.get_batch_size(), 3)
+            results = adapter.call_batch(Path("tests/example_data/data.txt"), self._batch_args(tmp_path))
+            for i in range(3):
+                self.assertTrue((tmp_path / str(i) / SCORES_FILE_NAME).is_file())
+
+        self.assertEqual(docker_mock.containers.started, 1)
+        batch = json.loads(docker_mock.containers.cmd.split("'")[1])["batch"]
+        self.assertListEqual([config["customParameters"] for config in batch], [{"a": 0}, {"a": 1}, {"a": 2}])
+        self.assertEqual(batch[1]["dataOutput"], str(RESULTS_TARGET_PATH / "1" / SCORES_FILE_NAME))
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertEqual(result.duration, 0.5)
+            np.testing.assert_array_equal(result.result, np.arange(10, dtype=np.float64))
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_batch_execution_fallback(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            adapter = DockerAdapter("test-image", batch_size=3)
+            results = adapter.call_batch(Path("tests/example_data/data.txt"), self._batch_args(Path(tmp_path)))
+
+        # images without the label get one container per configuration
+        self.assertEqual(docker_mock.containers.started, 3)
+        self.assertNotIn("batch", docker_mock.containers.cmd)
+        for result in results:
+            self.assertIsNone(result.error)
+            np.testing.assert_array_equal(result.result, np.arange(10, dtype=np.float64))
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_batch_execution_oom(self, mock_client):
+        docker_mock = MockDockerClient(image_labels={BATCH_EXECUTION_LABEL: "true"})
+        docker_mock.containers.exit_code = 137
+        docker_mock.containers.oom_killed = True
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            tmp_path = Path(tmp_path)
+            # the first configuration completed before the container ran out of memory
+            adapter = DockerAdapter("test-image", batch_size=3)
+            args = self._batch_args(tmp_path)
+            original_run = docker_mock.containers.run
+
+            def run(*run_args, **kwargs):
+                container = original_run(*run_args, **kwargs)
+                np.arange(10, dtype=np.float64).tofile(tmp_path / "0" / SCORES_FILE_NAME, sep="\n")
+                (tmp_path / "0" / BATCH_TIME_FILE_NAME).write_text("1.5")
+                return container
+
+            docker_mock.containers.run = run
+            results = adapter.call_batch(Path("tests/example_data/data.txt"), args)
+
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[0].duration, 1.5)
+        for result in results[1:]:
+            self.assertIsInstance(result.error, DockerMemoryError)
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_batch_execution_timeout(self, mock_client):
+        docker_mock = MockDockerClient(image_labels={BATCH_EXECUTION_LABEL: "true"})
+        docker_mock.containers.exit_code = None
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            tmp_path = Path(tmp_path)
+            adapter = DockerAdapter("test-image", timeout=Duration("100 miliseconds"), batch_size=3)
+            args = self._batch_args(tmp_path)
+            args[2]["resource_constraints"] = ResourceConstraints(use_preliminary_scores_on_execute_timeout=False)
+            original_run = docker_mock.containers.run
+
+            def run(*run_args, **kwargs):
+                # the first configuration reports an unreadable runtime, the others store preliminary scores only
+                container = original_run(*run_args, **kwargs)
+                for i in range(3):
+                    np.arange(10, dtype=np.float64).tofile(tmp_path / str(i) / SCORES_FILE_NAME, sep="\n")
+                (tmp_path / "0" / BATCH_TIME_FILE_NAME).write_text("")
+                return container
+
+            docker_mock.containers.run = run
+            results = adapter.call_batch(Path("tests/example_data/data.txt"), args)
+
+        for result in results[:2]:
+            self.assertIsNone(result.error)
+            self.assertGreater(result.duration, 0)
+            np.testing.assert_array_equal(result.result, np.arange(10, dtype=np.float64))
+        self.assertIsInstance(results[2].error, DockerTimeoutError)
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_streams_container_logs(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        docker_mock.containers.output = [b"first line\n", b"second \xc3", b"\xa4 line\n"]
+        mock_client.return_value = docker_mock
+
+        stdout = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(stdout):
+            DockerAdapter("test-image")(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+            self.assertFalse((Path(tmp_path) / CONTAINER_LOG_FILE_NAME).exists())
+        self.assertIn("first line\nsecond \u00e4 line\n", stdout.getvalue())
+        self.assertTrue(docker_mock.containers.stopped)
+
+    def test_log_pump_size_cap_and_rotation(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            overflow_path = Path(tmp_path) / CONTAINER_LOG_FILE_NAME
+            target = io.StringIO()
+            pump = _LogPump(iter([b"0123456", b"789abcdef", b"ghijklmnopqrstuvwxyz"]), target, overflow_path,
+                            max_bytes=10, backups=1)
+            pump.start()
+            pump.join()
+
+            self.assertTrue(target.getvalue().startswith("0123456789\n[container output exceeds 10 bytes"))
+            # the output is rotated every 10 bytes, keeping the latest backup only
+            self.assertEqual(overflow_path.read_text(), "uvwxyz")
+            self.assertEqual(overflow_path.with_name(f"{CONTAINER_LOG_FILE_NAME}.1").read_text(), "klmnopqrst")
+            self.assertFalse(overflow_path.with_name(f"{CONTAINER_LOG_FILE_NAME}.2").exists())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_timeout_from_events(self, mock_client):
+        docker_mock = MockDockerClient()
+        docker_mock.containers.exit_code = None
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            with self.assertRaises(DockerTimeoutError):
+                adapter = DockerAdapter("test-image", timeout=Duration("5 seconds"))
+                adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+        self.assertGreaterEqual(docker_mock.events_kwargs["until"] - docker_mock.events_kwargs["since"], 5)
+        self.assertEqual(docker_mock.events_kwargs["filters"]["container"], docker_mock.containers.id)
+        self.assertTrue(docker_mock.containers.stopped)
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_oom_from_events(self, mock_client):
+        docker_mock = MockDockerClient()
+        docker_mock.containers.exit_code = 1
+        docker_mock.containers.oom_killed = True
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            with self.assertRaises(DockerMemoryError):
+                adapter = DockerAdapter("test-image")
+                adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_wait_without_events(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+
+        def events(*args, **kwargs):
+            raise docker.errors.APIError("events not supported")
+
+        docker_mock.events = events
+        docker_mock.containers.wait = lambda timeout=None: {"Error": None, "StatusCode": 1}
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            with self.assertRaises(DockerAlgorithmFailedError):
+                adapter = DockerAdapter("test-image")
+                adapter(Path("tests/example_data/data.txt"), {"results_path": Path(tmp_path)})
+
+    @staticmethod
+    def _stats(memory: int, cpu_seconds: float, read: int) -> dict:
+        return {
+            "memory_stats": {"usage": memory + 10, "stats": {"inactive_file": 10}},
+            "cpu_stats": {"cpu_usage": {"total_usage": int(cpu_seconds * 1e9)},
+                          "throttling_data": {"throttled_time": int(cpu_seconds * 1e8)}},
+            "blkio_stats": {"io_service_bytes_recursive": [{"op": "read", "value": read}, {"op": "write", "value": 5}]},
+        }
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_resource_usage(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        # the last sample of a stopped container does not contain memory statistics
+        docker_mock.containers.stats_samples = [self._stats(100, 1, 0), self._stats(300, 2, 50),
+                                                self._stats(200, 4, 100), {"memory_stats": {}}]
+        docker_mock.containers.exit_after_stats = True
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            constraints = ResourceConstraints(resource_usage_interval=Duration("0 seconds"), resource_usage_series=True)
+            args = {"results_path": Path(tmp_path), "resource_constraints": constraints}
+            adapter = DockerAdapter("test-image")
+            adapter(Path("tests/example_data/data.txt"), args)
+            series = pd.read_csv(Path(tmp_path) / RESOURCE_USAGE_FILE_NAME)
+
+        usage = adapter.pop_resource_usage()
+        self.assertIsNotNone(usage)
+        # the usage is reported only once
+        self.assertIsNone(adapter.pop_resource_usage())
+        self.assertNotIn("resource_usage", args)
+        self.assertEqual(usage.peak_memory, 300)
+        self.assertEqual(usage.mean_memory, 200)
+        self.assertEqual(usage.cpu_time, 4)
+        self.assertAlmostEqual(usage.cpu_throttled_time, 0.4)
+        self.assertGreater(usage.cpu_utilization, 0)
+        self.assertEqual(usage.block_io_read, 100)
+        self.assertEqual(usage.block_io_write, 5)
+        np.testing.assert_array_equal(series["memory"], [100, 300, 200])
+        self.assertTrue((series["execution_type"] == "execute").all())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_no_resource_usage_per_default(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True)
+        docker_mock.containers.stats_samples = [self._stats(100, 1, 0)]
+        mock_client.return_value = docker_mock
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            args = {"results_path": Path(tmp_path)}
+            adapter = DockerAdapter("test-image")
+            adapter(Path("tests/example_data/data.txt"), args)
+            self.assertFalse((Path(tmp_path) / RESOURCE_USAGE_FILE_NAME).exists())
+        self.assertIsNone(adapter.pop_resource_usage())
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_no_resource_usage_for_warm_containers_and_batches(self, mock_client):
+        docker_mock = MockDockerClient(write_scores_file=True, image_labels={BATCH_EXECUTION_LABEL: "true"})
+        docker_mock.containers.stats_samples = [self._stats(100, 1, 0)]
+        mock_client.return_value = docker_mock
+        constraints = ResourceConstraints(resource_usage_interval=Duration("0 seconds"))
+
+        with tempfile.TemporaryDirectory() as tmp_path, redirect_stdout(io.StringIO()):
+            tmp_path = Path(tmp_path)
+            adapter = DockerAdapter("test-image", warm_container=True)
+            adapter(Path("tests/example_data/data.txt"), {"results_path": tmp_path, "resource_constraints": constraints})
+            self.assertIsNone(adapter.pop_resource_usage())
+            adapter.get_finalize_fn()()
+
+            args = self._batch_args(tmp_path)
+            for config_args in args:
+                config_args["resource_constraints"] = constraints
+            adapter = DockerAdapter("test-image", batch_size=3)
+            results = adapter.call_batch(Path("tests/example_data/data.txt"), args)
+        self.assertEqual(docker_mock.containers.started, 2)
+        self.assertListEqual([r.resource_usage for r in results], [None] * 3)
+        self.assertIsNone(adapter.pop_resource_usage())
+
 
 class TestDockerAdapterDocker(unittest.TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,121 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from timeeval import Algorithm, DatasetManager, Status, TimeEval, TrainingType
+from timeeval.adapters import FunctionAdapter
+from timeeval.datasets.custom import CustomDatasets
+from timeeval.utils.dataset_cache import DatasetCache
+from timeeval.utils.datasets import (
+    CSV_DATASET_CACHE, ensure_csv_dataset, is_binary_dataset, load_binary_dataset, load_dataset, load_labels_only,
+    save_binary_dataset
+)
+
+
+class TestBinaryDatasets(unittest.TestCase):
+    def setUp(self) -> None:
+        self.csv_path = Path("./tests/example_data/dataset.train.csv")
+        self.df = load_dataset(self.csv_path)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "dataset.train.tsbin"
+        save_binary_dataset(self.df, self.path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_roundtrip(self):
+        self.assertTrue(is_binary_dataset(self.path))
+        self.assertFalse(is_binary_dataset(self.csv_path))
+        df = load_dataset(self.path)
+        # integer timestamps are stored as numbers
+        pd.testing.assert_frame_equal(df, pd.read_csv(self.csv_path))
+        np.testing.assert_array_equal(load_labels_only(self.path), load_labels_only(self.csv_path))
+
+    def test_datetime_index(self):
+        df = self.df.copy()
+        df["timestamp"] = pd.date_range("2021-01-01", periods=len(df), freq="s")
+        path = Path(self.tmp_dir.name) / "datetime.tsbin"
+        save_binary_dataset(df, path)
+        pd.testing.assert_frame_equal(load_binary_dataset(path), df)
+
+    def test_columns_are_memory_mapped(self):
+        df = load_binary_dataset(self.path)
+        values = df["value"].values
+        self.assertIsInstance(values.base, np.memmap)
+        self.assertFalse(values.flags.writeable)
+
+        df = load_binary_dataset(self.path, columns=["is_anomaly"], mmap=False)
+        self.assertListEqual(df.columns.tolist(), ["is_anomaly"])
+        self.assertTrue(df["is_anomaly"].values.flags.writeable)
+
+    def test_ensure_csv_dataset(self):
+        cache_dir = Path(self.tmp_dir.name) / "cache"
+        self.assertEqual(ensure_csv_dataset(self.csv_path, cache_dir), self.csv_path)
+
+        csv_path = ensure_csv_dataset(self.path, cache_dir)
+        self.assertEqual(csv_path.parent.parent, cache_dir)
+        self.assertEqual(csv_path.name, "dataset.train.csv")
+        pd.testing.assert_frame_equal(pd.read_csv(csv_path), pd.read_csv(self.csv_path))
+        # the dataset directory is not modified
+        self.assertListEqual(list(self.path.glob("*.csv")), [])
+
+        # reuses the existing CSV file
+        mtime = csv_path.stat().st_mtime_ns
+        self.assertEqual(ensure_csv_dataset(self.path, cache_dir).stat().st_mtime_ns, mtime)
+        self.assertListEqual([p.name for p in csv_path.parent.iterdir()], [csv_path.name])
+
+    def test_ensure_csv_dataset_removes_partial_file(self):
+        cache_dir = Path(self.tmp_dir.name) / "cache"
+        with patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                ensure_csv_dataset(self.path, cache_dir)
+        self.assertListEqual([p for p in cache_dir.rglob("*") if p.is_file()], [])
+
+    def test_dataset_cache(self):
+        cache = DatasetCache()
+        labels = cache.load_labels(self.path)
+        self.assertIs(cache.load_labels(self.path), labels)
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_custom_dataset(self):
+        config_path = Path(self.tmp_dir.name) / "datasets.json"
+        with config_path.open("w") as fh:
+            json.dump({"binary": {"test_path": str(self.path.resolve()), "train_path": str(self.path.resolve())}}, fh)
+        custom = CustomDatasets(config_path)
+        dataset = custom.get("binary")
+        self.assertEqual(dataset.training_type, TrainingType.SUPERVISED)
+        self.assertEqual(dataset.length, len(self.df))
+
+    def test_data_as_file(self):
+        config_path = Path(self.tmp_dir.name) / "datasets.json"
+        with config_path.open("w") as fh:
+            json.dump({"binary": {"test_path": str(self.path.resolve())}}, fh)
+        results_path = Path(self.tmp_dir.name) / "results"
+        received = []
+
+        def algorithm(data: Path, args: dict) -> np.ndarray:
+            received.append(data)
+            return pd.read_csv(data)["is_anomaly"].to_numpy(dtype=np.float64)
+
+        timeeval = TimeEval(DatasetManager(self.tmp_dir.name, custom_datasets_file=config_path), [("custom", "binary")],
+                            [Algorithm(name="test", main=FunctionAdapter(algorithm), data_as_file=True)],
+                            results_path=results_path, skip_invalid_combinations=False, disable_progress_bar=True)
+        timeeval.run()
+
+        self.assertListEqual(timeeval.results["status"].tolist(), [Status.OK])
+        self.assertEqual(received[0].parent.parent, timeeval.results_path / CSV_DATASET_CACHE)
+        # the CSV copies are removed at the end of the run
+        self.assertFalse((timeeval.results_path / CSV_DATASET_CACHE).exists())
+        self.assertListEqual(list(self.path.glob("*.csv")), [])
+
+    def test_unsupported_column(self):
+        df = self.df.copy()
+        df["value"] = "a"
+        with self.assertRaises(ValueError) as ex:
+            save_binary_dataset(df, Path(self.tmp_dir.name) / "invalid.tsbin")
+        self.assertIn("Column 'value'", str(ex.exception))
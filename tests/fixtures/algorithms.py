@@ -1,9 +1,9 @@
-from typing import Callable, Optional
+from typing import Callable, Optional, List
 
 import numpy as np
 import pandas as pd
 
-from timeeval.adapters.base import Adapter
+from timeeval.adapters.base import Adapter, BatchResult
 from timeeval.data_types import AlgorithmParameter, ExecutionType
 
 
@@ -69,3 +69,22 @@ class ErroneousAlgorithm(Adapter):
         else:
             self.count -= 1
             return self.fn(dataset, args)
+
+
+class BatchedDeviatingFromMean(Adapter):
+    """Reports the size of its batch as runtime of each configuration and fails for the parameter ``fail=True``."""
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+
+    def _call(self, dataset: AlgorithmParameter, args: Optional[dict] = None) -> AlgorithmParameter:
+        return deviating_from(dataset, np.mean)  # type: ignore
+
+    def get_batch_size(self) -> int:
+        return self.batch_size
+
+    def call_batch(self, dataset: AlgorithmParameter, args: List[dict]) -> List[BatchResult]:
+        return [
+            BatchResult(None, np.nan, ValueError("failing configuration")) if a["hyper_params"].get("fail", False)
+            else BatchResult(deviating_from(dataset, np.mean), len(args))
+            for a in args
+        ]
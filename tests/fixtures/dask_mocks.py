@@ -35,9 +35,14 @@ class MockDaskClient:
         self.did_shutdown = False
 
     def submit(self, task, *args, workers: Optional[List] = None, **kwargs) -> Future:
-        result = task(*args, **kwargs)
+        # like dask, resolve futures in the arguments and do not pass dask's options to the task
+        args = tuple(a.result() if isinstance(a, Future) else a for a in args)
+        kwargs = {k: v for k, v in kwargs.items() if k not in ["pure", "key"]}
         f = Future()  # type: ignore
-        f.set_result(result)
+        try:
+            f.set_result(task(*args, **kwargs))
+        except Exception as e:
+            f.set_exception(e)
         return f
 
     def run(self, task, *args, **kwargs):
@@ -1,18 +1,53 @@
-from pathlib import Path
-from typing import List
+import json
+import threading
+import time
+from pathlib import Path, PurePosixPath
+from typing import List, Optional
 
 import numpy as np
+from docker.errors import APIError, NotFound
 from docker.models.containers import Container
 
-from timeeval.adapters.docker import SCORES_FILE_NAME
-
 
 TEST_DOCKER_IMAGE = "ghcr.io/timeeval/timeeval-test-algorithm"
 
 
+def _host_path(container_path: str, volumes: dict) -> Path:
+    # resolves a path within the container to the bind-mounted host path
+    path = PurePosixPath(container_path)
+    for host_path, bind in sorted(volumes.items(), key=lambda v: len(v[1]["bind"]), reverse=True):
+        if path == PurePosixPath(bind["bind"]) or PurePosixPath(bind["bind"]) in path.parents:
+            return Path(host_path).resolve() / path.relative_to(bind["bind"])
+    raise ValueError(f"{container_path} is not mounted")
+
+
+def _write_scores(interface: dict, volumes: dict) -> None:
+    for config in interface.get("batch", [interface]):
+        scores_path = _host_path(config["dataOutput"], volumes)
+        if config.get("binaryOutput", False):
+            with scores_path.open("wb") as fh:
+                np.save(fh, np.arange(10, dtype=np.float64))
+        else:
+            np.arange(10, dtype=np.float64).tofile(scores_path, sep="\n")
+        if "timeOutput" in config:
+            _host_path(config["timeOutput"], volumes).write_text("0.5")
+
+
 class MockDockerContainer:
     def __init__(self, write_scores_file: bool = False):
+        self.id = "mock-container"
         self.stopped = True
+        self.removed = False
+        self.started = 0
+        self.exit_code = 0
+        self.oom_killed = False
+        self.output = [b"algorithm output\n"]
+        self.stats_samples: List[dict] = []
+        # if set, the container does not exit before the resource monitor received all stats samples
+        self.exit_after_stats = False
+        self.stats_consumed = threading.Event()
+        self.status = "created"
+        self.labels: Optional[dict] = None
         self._write_scores_file = write_scores_file
 
     def wait(self, timeout=None) -> dict:
@@ -20,38 +55,133 @@ class MockDockerContainer:
 
     def run(self, image: str, cmd: str, volumes: dict, **kwargs):
         self.stopped = False
+        self.removed = False
+        self.status = "running"
+        self.labels = kwargs.get("labels")
         self.image = image
         self.cmd = cmd
         self.volumes = volumes
         self.run_kwargs = kwargs
+        self.started += 1
 
-        real_path = Path(list(volumes.items())[1][0]).resolve()
-        if self._write_scores_file:
-            np.arange(10, dtype=np.float64).tofile(real_path / SCORES_FILE_NAME, sep="\n")
+        if self._write_scores_file and cmd is not None:
+            _write_scores(json.loads(cmd.split("'")[1]), self.volumes)
         return self
 
+    @property
+    def results_path(self) -> Path:
+        return Path(list(self.volumes.items())[1][0]).resolve()
+
     def prune(self, *args, **kwargs) -> None:
         pass
 
+    def reload(self) -> None:
+        if self.removed:
+            raise NotFound("No such container")
+
     def remove(self, *args, **kwargs) -> None:
-        pass
+        self.removed = True
 
     def stop(self, *args, **kwargs) -> None:
         self.stopped = True
 
-    def logs(self) -> bytes:
-        return "".encode("utf-8")
+    def kill(self, *args, **kwargs) -> None:
+        self.stopped = True
+
+    def logs(self, stream: bool = False, follow: bool = False):
+        if stream:
+            return iter(self.output)
+        return b"".join(self.output)
+
+    def stats(self, stream: bool = True, decode: bool = False):
+        yield from self.stats_samples
+        self.stats_consumed.set()
 
     def list(self, *args, **kwargs) -> List[Container]:
         return [self]
 
 
+class MockImage:
+    def __init__(self, labels: Optional[dict] = None, digest: Optional[str] = None):
+        self.attrs = {
+            "Config": {"Entrypoint": ["/entrypoint.sh"], "Labels": labels},
+            "RepoDigests": [f"test-image@{digest}"] if digest else [],
+        }
+
+
+class MockRegistryData:
+    def __init__(self, digest: str):
+        self.id = digest
+
+
 class MockImages:
+    def __init__(self, labels: Optional[dict] = None, local_digest: Optional[str] = None,
+                 registry_digest: Optional[str] = None):
+        self._labels = labels
+        self._local_digest = local_digest
+        self._registry_digest = registry_digest
+        self.pulled: List[str] = []
+
     def pull(self, image, tag):
-        pass
+        self.pulled.append(f"{image}:{tag}")
+
+    def get(self, name):
+        return MockImage(self._labels, self._local_digest)
+
+    def get_registry_data(self, name):
+        if self._registry_digest is None:
+            raise APIError("registry not reachable")
+        return MockRegistryData(self._registry_digest)
+
+
+class MockDockerAPI:
+    def __init__(self, containers: MockDockerContainer, exit_code: int = 0):
+        self._containers = containers
+        self._exit_code = exit_code
+        self.exec_cmds: List[List[str]] = []
+
+    def exec_create(self, container: str, cmd: List[str], **kwargs) -> dict:
+        self.exec_cmds.append(cmd)
+        self.exec_kwargs = kwargs
+        return {"Id": f"exec-{len(self.exec_cmds)}"}
+
+    def exec_start(self, exec_id: str, stream: bool = False):
+        if self._containers._write_scores_file:
+            _write_scores(json.loads(self.exec_cmds[-1][-1]), self._containers.volumes)
+        return iter([b"algorithm output\n"])
+
+    def exec_inspect(self, exec_id: str) -> dict:
+        return {"Running": False, "ExitCode": self._exit_code}
+
+
+class MockEventStream:
+    def __init__(self, events: List[dict]):
+        self._events = iter(events)
+        self.closed = False
+
+    def __iter__(self):
+        return self._events
+
+    def close(self) -> None:
+        self.closed = True
 
 
 class MockDockerClient:
-    def __init__(self, write_scores_file: bool = False):
+    def __init__(self, write_scores_file: bool = False, exec_exit_code: int = 0, image_labels: Optional[dict] = None):
         self.containers = MockDockerContainer(write_scores_file)
-        self.images = MockImages()
+        self.images = MockImages(image_labels)
+        self.api = MockDockerAPI(self.containers, exec_exit_code)
+
+    def events(self, since=None, until=None, filters=None, decode=False) -> MockEventStream:
+        # a container without exit code is still running when the events stream ends
+        self.events_kwargs = {"since": since, "until": until, "filters": filters}
+        if self.containers.exit_after_stats:
+            self.containers.stats_consumed.wait(timeout=5)
+        events = []
+        if self.containers.oom_killed:
+            events.append({"Type": "container", "Action": "oom", "Actor": {"ID": self.containers.id}})
+        if self.containers.exit_code is not None:
+            events.append({"Type": "container", "Action": "die", "timeNano": int(time.time() * 1e9),
+                           "Actor": {"ID": self.containers.id,
+                                     "Attributes": {"exitCode": str(self.containers.exit_code)}}})
+        return MockEventStream(events)
@@ -1,13 +1,23 @@
 import unittest
 import warnings
+from unittest.mock import patch
 
 import numpy as np
+import pytest
+from sklearn.metrics import roc_curve, precision_recall_curve, auc, average_precision_score
 
 from timeeval import DefaultMetrics
 from timeeval.metrics import (RangeFScore, RangePrecision, RangeRecall, F1Score, Precision, Recall, FScoreAtK,
-                              PrecisionAtK, RangePrAUC, RangeRocAUC, RangePrVUS, RangeRocVUS)
+                              PrecisionAtK, RangePrAUC, RangeRocAUC, RangePrVUS, RangeRocVUS, RocAUC, PrAUC,
+                              AveragePrecision, Metric, MetricContext, MetricSuite)
 from timeeval.metrics.thresholding import FixedValueThresholding, NoThresholding
 
+try:
+    import prts
+    _skip_prts_test = False
+except ImportError:
+    _skip_prts_test = True
+
 
 class TestMetrics(unittest.TestCase):
 
@@ -41,6 +51,59 @@ class TestMetrics(unittest.TestCase):
         result = DefaultMetrics.ROC_AUC(y_true, y_scores, neginf_is_0=False)
         self.assertEqual(0.5, result)
 
+    def test_validation_copies_only_for_substitutions(self):
+        y_true = np.array([0, 0, 1, 1])
+        y_scores = np.array([0.1, 0.2, 0.9, 0.8])
+        metric = DefaultMetrics.ROC_AUC
+        validated_true, validated_scores = metric._validate_scores(y_true, y_scores)
+        self.assertTrue(np.shares_memory(y_true, validated_true))
+        self.assertTrue(np.shares_memory(y_scores, validated_scores))
+
+        y_scores[1] = np.nan
+        _, validated_scores = metric._validate_scores(y_true, y_scores)
+        self.assertFalse(np.shares_memory(y_scores, validated_scores))
+        self.assertTrue(np.isnan(y_scores[1]))
+        np.testing.assert_array_equal([0.1, 0., 0.9, 0.8], validated_scores)
+
+    def test_score_gets_copies_of_inputs(self):
+        class InPlaceMetric(Metric):
+            name = "in-place"
+
+            def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+                y_score[y_score < 0.5] = 0.
+                return float(np.sum(y_score[y_true == 1]) / np.sum(y_score))
+
+            def supports_continuous_scorings(self) -> bool:
+                return True
+
+        y_true = np.array([0, 0, 1, 1])
+        y_scores = np.array([0.1, 0.2, 0.9, 0.8])
+        self.assertEqual(InPlaceMetric()(y_true, y_scores), 1.)
+        self.assertEqual(InPlaceMetric().score_many(y_true, y_scores.reshape(1, -1))[0], 1.)
+        # the inputs are not affected
+        np.testing.assert_array_equal(y_scores, [0.1, 0.2, 0.9, 0.8])
+        self.assertTrue(y_scores.flags.writeable)
+
+    def test_score_context_gets_views_of_inputs(self):
+        y_true = np.array([0, 0, 1, 1])
+        y_scores = np.array([0.1, 0.2, 0.9, 0.8])
+
+        class ViewMetric(Metric):
+            name = "view"
+
+            def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+                raise AssertionError("score_context() is used instead")
+
+            def score_context(self, context: MetricContext) -> float:
+                assert np.shares_memory(context.y_score, y_scores)
+                assert not context.y_score.flags.writeable
+                return 1.
+
+            def supports_continuous_scorings(self) -> bool:
+                return True
+
+        self.assertEqual(ViewMetric()(y_true, y_scores), 1.)
+
     def test_continuous_metric_requires_scores(self):
         y_scores = np.array([1, 0, 1, 0, 0])
         y_true = np.array([0, 0, 1, 0, 0])
@@ -235,6 +298,91 @@ class TestMetrics(unittest.TestCase):
         self.assertEqual(result, 1)
 
 
+class TestAucMetrics(unittest.TestCase):
+
+    def test_same_as_sklearn_curves(self):
+        rng = np.random.default_rng(42)
+        for _ in range(200):
+            n = int(rng.integers(2, 200))
+            y_true = (rng.random(n) > rng.random()).astype(np.int_)
+            if y_true.sum() in [0, n]:
+                continue
+            # rounding creates ties in the scores
+            y_score = np.round(rng.random(n), int(rng.integers(0, 4)))
+            if np.unique(y_score).shape[0] == 1:
+                continue
+            fpr, tpr, _ = roc_curve(y_true, y_score)
+            precision, recall, _ = precision_recall_curve(y_true, y_score)
+            self.assertAlmostEqual(auc(fpr, tpr), RocAUC()(y_true, y_score), places=12)
+            self.assertAlmostEqual(auc(recall, precision), PrAUC()(y_true, y_score), places=12)
+            self.assertAlmostEqual(average_precision_score(y_true, y_score), AveragePrecision()(y_true, y_score),
+                                   places=12)
+
+    def test_float32(self):
+        rng = np.random.default_rng(42)
+        y_true = (rng.random(1000) > 0.9).astype(np.int_)
+        y_score = rng.random(1000) + y_true * 0.2
+        self.assertAlmostEqual(RocAUC()(y_true, y_score), RocAUC(float32=True)(y_true, y_score), places=6)
+        self.assertAlmostEqual(PrAUC()(y_true, y_score), PrAUC(float32=True)(y_true, y_score), places=6)
+        # scores that are equal in single precision are ties
+        y_true = np.array([0, 1, 0, 1])
+        y_score = np.array([0.1, 1 + 1e-12, 1., 0.5])
+        self.assertEqual(0.75, RocAUC()(y_true, y_score))
+        self.assertEqual(0.625, RocAUC(float32=True)(y_true, y_score))
+
+    def test_single_class_labels(self):
+        y_true = np.zeros(4, dtype=np.int_)
+        y_score = np.array([0.1, 0.4, 0.35, 0.8])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertTrue(np.isnan(RocAUC()(y_true, y_score)))
+        self.assertTrue(any("No positive samples" in str(warning.message) for warning in w))
+
+
+class TestRangeMetrics(unittest.TestCase):
+
+    def test_no_predicted_ranges(self):
+        y_true = np.array([0, 1, 1, 0])
+        y_pred = np.zeros_like(y_true)
+        self.assertEqual(0, RangePrecision()(y_true, y_pred))
+        self.assertEqual(0, RangeRecall()(y_true, y_pred))
+        self.assertEqual(0, RangeFScore()(y_true, y_pred))
+
+    def test_invalid_parameters(self):
+        y_true = np.array([0, 1, 1, 0])
+        with self.assertRaises(ValueError):
+            RangePrecision(cardinality="two")(y_true, y_true)
+        with self.assertRaises(ValueError):
+            RangeRecall(bias="center")(y_true, y_true)
+        with self.assertRaises(ValueError):
+            RangeRecall(alpha=2)(y_true, y_true)
+
+    @pytest.mark.skipif(_skip_prts_test, reason="prts is not installed!")
+    def test_same_as_prts(self):
+        from prts import ts_precision, ts_recall, ts_fscore
+
+        rng = np.random.default_rng(42)
+        for _ in range(200):
+            n = int(rng.integers(5, 100))
+            y_true = (rng.random(n) > rng.random()).astype(np.int_)
+            y_pred = (rng.random(n) > rng.random()).astype(np.int_)
+            if y_true.sum() == 0 or y_pred.sum() in [0, n]:
+                # prts does not support labels without anomalies and TimeEval returns 0 for constant predictions
+                continue
+            alpha = float(rng.choice([0, 0.5, 1]))
+            cardinality = str(rng.choice(["one", "reciprocal", "udf_gamma"]))
+            bias = str(rng.choice(["flat", "front", "middle", "back"]))
+            params = dict(alpha=alpha, cardinality=cardinality, bias=bias)
+            self.assertAlmostEqual(ts_precision(y_true, y_pred, **params),
+                                   RangePrecision(**params)(y_true, y_pred), places=12, msg=params)
+            self.assertAlmostEqual(ts_recall(y_true, y_pred, **params),
+                                   RangeRecall(**params)(y_true, y_pred), places=12, msg=params)
+            self.assertAlmostEqual(ts_fscore(y_true, y_pred, beta=2, p_alpha=0, r_alpha=alpha, cardinality=cardinality,
+                                             p_bias=bias, r_bias=bias),
+                                   RangeFScore(beta=2, p_alpha=0, r_alpha=alpha, cardinality=cardinality, p_bias=bias,
+                                               r_bias=bias)(y_true, y_pred), places=12, msg=params)
+
+
 class TestVUSMetrics(unittest.TestCase):
     def setUp(self) -> None:
         y_true = np.zeros(200)
@@ -274,6 +422,38 @@ class TestVUSMetrics(unittest.TestCase):
         result = RangeRocVUS(max_buffer_size=200, compatibility_mode=True)(self.y_true, self.y_score)
         self.assertAlmostEqual(result, self.expected_range_roc_volume, places=10)
 
+    def test_range_auc_all_thresholds(self):
+        n = self.y_score.shape[0]
+        for metric_cls in [RangePrAUC, RangeRocAUC]:
+            result = metric_cls(max_samples=None)(self.y_true, self.y_score)
+            expected = metric_cls(max_samples=n)(self.y_true, self.y_score)
+            self.assertEqual(result, expected)
+            self.assertNotAlmostEqual(result, metric_cls(max_samples=10)(self.y_true, self.y_score), places=4)
+
+    def test_range_volume_shares_work(self):
+        from timeeval.metrics import vus_metrics
+
+        metrics = [RangePrVUS(max_buffer_size=20), RangeRocVUS(max_buffer_size=20)]
+        with patch.object(vus_metrics, "_RangeCurveEngine", wraps=vus_metrics._RangeCurveEngine) as engine_mock:
+            pr_volume, roc_volume = [r.score for r in MetricSuite(metrics).evaluate(self.y_true, self.y_score)]
+            self.assertEqual(engine_mock.call_count, 1)
+
+        expected_pr = np.mean([RangePrAUC(buffer_size=bs)(self.y_true, self.y_score) for bs in range(21)])
+        expected_roc = np.mean([RangeRocAUC(buffer_size=bs)(self.y_true, self.y_score) for bs in range(21)])
+        self.assertAlmostEqual(pr_volume, expected_pr, places=10)
+        self.assertAlmostEqual(roc_volume, expected_roc, places=10)
+
+    def test_label_slopes_match_extended_labels(self):
+        y_true = np.r_[1, np.zeros(5), 1, 1, 0, 0, 1, np.zeros(12), 1].astype(np.int_)
+        for compatibility_mode in [False, True]:
+            metric = RangePrAUC(compatibility_mode=compatibility_mode)
+            for buffer_size in range(12):
+                y_true_cont, anomalies = metric._extend_anomaly_labels(y_true, buffer_size)
+                slopes = metric._label_slopes(y_true, buffer_size)
+                np.testing.assert_array_equal(slopes.changed, np.flatnonzero(y_true_cont != y_true))
+                np.testing.assert_allclose(slopes.weights, y_true_cont[slopes.changed])
+                np.testing.assert_array_equal(slopes.anomalies, anomalies)
+
     def test_range_pr_auc(self):
         y_pred = np.array([0.05, 0.2, 1., 0.2, 0.1, 0.05, 0.1, 0.05, 0.1, 0.07])
         y_true = np.array([0, 1, 1, 1, 0, 0, 0, 0, 0, 0])
@@ -0,0 +1,104 @@
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from timeeval.metrics import (RocAUC, PrAUC, Precision, Recall, F1Score, StreamingRocAUC, StreamingPrAUC,
+                              StreamingPrecision, StreamingRecall, StreamingF1Score, MetricSuite)
+from timeeval.metrics.thresholding import FixedValueThresholding, NoThresholding, PercentileThresholding
+from timeeval.utils.scores import ScoresFormat, load_scores, save_scores
+
+
+class TestStreamingMetrics(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.y_true = np.zeros(2000, dtype=np.int_)
+        self.y_true[100:150] = 1
+        self.y_true[900:960] = 1
+        self.y_true[1500:1510] = 1
+        self.y_score = rng.random(2000) * 0.8
+        self.y_score[self.y_true == 1] += 0.2
+
+    def test_exact_for_few_distinct_scores(self):
+        # each distinct score falls into its own bin
+        y_score = np.round(self.y_score * 10)
+        for binning in ["uniform", "quantile"]:
+            self.assertAlmostEqual(RocAUC()(self.y_true, y_score),
+                                   StreamingRocAUC(bins=1000, binning=binning, chunk_size=333)(self.y_true, y_score),
+                                   places=12)
+            self.assertAlmostEqual(PrAUC()(self.y_true, y_score),
+                                   StreamingPrAUC(bins=1000, binning=binning, chunk_size=333)(self.y_true, y_score),
+                                   places=12)
+
+    def test_approximation(self):
+        for binning in ["uniform", "quantile"]:
+            self.assertAlmostEqual(RocAUC()(self.y_true, self.y_score),
+                                   StreamingRocAUC(binning=binning, chunk_size=128)(self.y_true, self.y_score),
+                                   places=4)
+            self.assertAlmostEqual(PrAUC()(self.y_true, self.y_score),
+                                   StreamingPrAUC(binning=binning, chunk_size=128)(self.y_true, self.y_score),
+                                   places=3)
+
+    def test_classification_metrics(self):
+        pairs = [(Precision, StreamingPrecision), (Recall, StreamingRecall), (F1Score, StreamingF1Score)]
+        for metric_cls, streaming_cls in pairs:
+            expected = metric_cls(FixedValueThresholding(0.7))(self.y_true, self.y_score)
+            result = streaming_cls(FixedValueThresholding(0.7), chunk_size=100)(self.y_true, self.y_score)
+            self.assertEqual(expected, result)
+
+            y_pred = (self.y_score > 0.5).astype(np.int_)
+            expected = metric_cls(NoThresholding())(self.y_true, y_pred)
+            result = streaming_cls(NoThresholding(), chunk_size=100)(self.y_true, y_pred)
+            self.assertEqual(expected, result)
+
+    def test_requires_fixed_threshold(self):
+        with self.assertRaises(ValueError):
+            StreamingF1Score(PercentileThresholding())
+
+    def test_nan_handling(self):
+        y_score = self.y_score.copy()
+        y_score[[10, 120]] = np.nan
+        for kwargs in [{}, {"nan_is_0": False}]:
+            self.assertEqual(F1Score(FixedValueThresholding(0.5))(self.y_true, y_score, **kwargs),
+                             StreamingF1Score(FixedValueThresholding(0.5), chunk_size=7)(self.y_true, y_score,
+                                                                                         **kwargs))
+
+    def test_constant_scores(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = StreamingRocAUC()(self.y_true, np.full(self.y_true.shape[0], 0.5))
+        self.assertEqual(0, result)
+        self.assertTrue(any("constant value" in str(warning.message) for warning in w))
+
+    def test_single_class_labels(self):
+        with self.assertRaises(ValueError):
+            StreamingPrAUC()(np.zeros(self.y_true.shape[0]), self.y_score)
+
+    def test_empty_inputs(self):
+        for metric in [StreamingRocAUC(), StreamingPrAUC(binning="quantile"), StreamingRecall(FixedValueThresholding())]:
+            with self.assertRaises(ValueError) as ex:
+                metric(np.array([], dtype=np.int_), np.array([], dtype=np.float_))
+            self.assertIn("empty", str(ex.exception))
+
+    def test_inconsistent_lengths(self):
+        with self.assertRaises(ValueError):
+            StreamingRecall(FixedValueThresholding())(self.y_true, self.y_score[:-1])
+
+    def test_memory_mapped_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = save_scores(self.y_score.astype(np.float32), Path(tmp_dir) / "anomaly_scores.ts",
+                               ScoresFormat(binary=True, dtype="float32"))
+            y_score = load_scores(path, mmap=True)
+            self.assertIsInstance(y_score, np.memmap)
+            expected = StreamingRocAUC()(self.y_true, np.array(y_score, dtype=np.float64))
+            self.assertEqual(expected, StreamingRocAUC(chunk_size=256)(self.y_true, y_score))
+            del y_score
+
+    def test_metric_suite(self):
+        metrics = [StreamingRocAUC(chunk_size=100), StreamingF1Score(FixedValueThresholding(0.7))]
+        for metric, result in zip(metrics, MetricSuite(metrics).evaluate(self.y_true, self.y_score)):
+            self.assertIsNone(result.exception)
+            self.assertEqual(metric(self.y_true, self.y_score), result.score)
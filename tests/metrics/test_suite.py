@@ -0,0 +1,193 @@
+import unittest
+import warnings
+from unittest.mock import patch
+
+import numpy as np
+from sklearn.metrics import roc_curve, precision_recall_curve
+
+from timeeval import DefaultMetrics
+from timeeval.metrics import (MetricSuite, MetricContext, LabelContext, RocAUC, PrAUC, AveragePrecision, RangePrAUC, RangeRocAUC,
+                              RangePrVUS, RangeRocVUS, F1Score, FScoreAtK, RangePrecisionRangeRecallAUC, Precision, Recall,
+                              RangePrecision, RangeRecall, RangeFScore, PrecisionAtK)
+from timeeval.metrics.thresholding import NoThresholding, PercentileThresholding, FixedValueThresholding
+from timeeval.metrics.range_metrics import _anomaly_ranges
+from timeeval.metrics.vus_metrics import RangeAucMetric
+
+
+class TestMetricSuite(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.y_true = np.zeros(1000, dtype=np.int_)
+        self.y_true[100:120] = 1
+        self.y_true[500:530] = 1
+        self.y_true[900:905] = 1
+        # rounding creates ties in the scores
+        self.y_score = np.round(rng.random(1000), 2)
+        self.y_score[self.y_true == 1] += 0.3
+
+    def test_same_results_as_metrics(self):
+        metrics = [
+            RocAUC(), PrAUC(), AveragePrecision(), DefaultMetrics.RANGE_PR_AUC,
+            RangePrAUC(buffer_size=10), RangeRocAUC(buffer_size=10), RangePrAUC(compatibility_mode=True),
+            RangePrVUS(max_buffer_size=20), RangeRocVUS(max_buffer_size=20), RangeRocVUS(max_buffer_size=20,
+                                                                                         max_samples=None),
+            F1Score(PercentileThresholding(95)), FScoreAtK(),
+        ]
+        results = list(MetricSuite(metrics).evaluate(self.y_true, self.y_score))
+        self.assertEqual(len(metrics), len(results))
+        for metric, result in zip(metrics, results):
+            self.assertIs(metric, result.metric)
+            self.assertIsNone(result.exception)
+            self.assertAlmostEqual(metric(self.y_true, self.y_score), result.score, places=12, msg=metric.name)
+
+    def test_parallel(self):
+        metrics = [RocAUC(), PrAUC(), AveragePrecision(), RangePrAUC(), RangeRocAUC(), RangePrVUS(max_buffer_size=10),
+                   RangeRocVUS(max_buffer_size=10), F1Score(NoThresholding())]
+        expected = list(MetricSuite(metrics).evaluate(self.y_true, self.y_score))
+        results = list(MetricSuite(metrics, n_jobs=4).evaluate(self.y_true, self.y_score))
+        self.assertListEqual([r.metric for r in expected], [r.metric for r in results])
+        self.assertListEqual([r.score for r in expected], [r.score for r in results])
+        self.assertListEqual([type(r.exception) for r in expected], [type(r.exception) for r in results])
+        for r in results[:-1]:
+            self.assertGreaterEqual(r.time, 0)
+
+    def test_does_not_modify_inputs(self):
+        y_score = self.y_score.copy()
+        y_score[3] = np.nan
+        expected = y_score.copy()
+        list(MetricSuite([RocAUC(), RangePrAUC()]).evaluate(self.y_true, y_score))
+        np.testing.assert_array_equal(expected, y_score)
+        self.assertTrue(y_score.flags.writeable)
+        self.assertTrue(self.y_true.flags.writeable)
+
+    def test_label_context(self):
+        metrics = [RocAUC(), RangePrAUC(), F1Score(PercentileThresholding(95)), F1Score(NoThresholding())]
+        expected = list(MetricSuite(metrics).evaluate(self.y_true, self.y_score))
+        results = list(MetricSuite(metrics).evaluate(LabelContext(self.y_true), self.y_score))
+        self.assertListEqual([r.score for r in expected], [r.score for r in results])
+        self.assertListEqual([type(r.exception) for r in expected], [type(r.exception) for r in results])
+
+    def test_reports_errors_per_metric(self):
+        metrics = [RocAUC(), F1Score(NoThresholding()), RangePrecisionRangeRecallAUC(max_samples=10)]
+        results = list(MetricSuite(metrics).evaluate(self.y_true, self.y_score))
+        self.assertIsNone(results[0].exception)
+        self.assertIsNone(results[1].score)
+        self.assertIsInstance(results[1].exception, ValueError)
+        self.assertIsNone(results[2].exception)
+
+    def test_shares_thresholding(self):
+        metrics = [Precision(PercentileThresholding(90)), Recall(PercentileThresholding(90)),
+                   F1Score(PercentileThresholding(90)), RangePrecision(PercentileThresholding(90)),
+                   RangeRecall(PercentileThresholding(90)), RangeFScore(PercentileThresholding(90)),
+                   F1Score(PercentileThresholding(95)), F1Score(FixedValueThresholding(0.5))]
+        expected = [metric(self.y_true, self.y_score) for metric in metrics]
+        with patch.object(PercentileThresholding, "find_threshold", autospec=True,
+                          side_effect=lambda _, y_true, y_score: np.nanpercentile(y_score, 90)) as find_threshold:
+            results = list(MetricSuite(metrics[:6]).evaluate(self.y_true, self.y_score))
+        find_threshold.assert_called_once()
+        results += list(MetricSuite(metrics[6:]).evaluate(self.y_true, self.y_score))
+        self.assertListEqual(expected, [r.score for r in results])
+        self.assertEqual(np.nanpercentile(self.y_score, 90), metrics[1]._thresholding_strategy.threshold)
+
+    def test_shares_top_k_thresholding(self):
+        metrics = [PrecisionAtK(), FScoreAtK(), PrecisionAtK(k=5)]
+        expected = [metric(self.y_true, self.y_score) for metric in metrics]
+        context = MetricContext(self.y_true.copy(), self.y_score.copy())
+        self.assertListEqual(expected, [metric.score_context(context) for metric in metrics])
+        self.assertEqual(2, sum(1 for key in context._cache if key[0] == "predictions"))
+
+    def test_shares_anomaly_ranges(self):
+        metrics = [RangePrecision(PercentileThresholding(90)), RangeRecall(PercentileThresholding(90)),
+                   RangeFScore(PercentileThresholding(90)), RangePrecisionRangeRecallAUC(max_samples=10),
+                   RangePrAUC(buffer_size=10), RangePrVUS(max_buffer_size=5)]
+        expected = [metric(self.y_true, self.y_score) for metric in metrics]
+        labels = LabelContext(self.y_true)
+        with patch("timeeval.metrics.suite._anomaly_ranges", wraps=_anomaly_ranges) as ranges_mock:
+            results = list(MetricSuite(metrics).evaluate(labels, self.y_score))
+        # only the real anomaly ranges are cached, the predicted ranges are computed by each metric
+        ranges_mock.assert_called_once()
+        np.testing.assert_array_equal(labels.anomaly_ranges, [[100, 119], [500, 529], [900, 904]])
+        self.assertListEqual(expected, [r.score for r in results])
+
+    def test_constant_scores(self):
+        y_score = np.full(self.y_true.shape[0], 0.5)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            results = list(MetricSuite([RocAUC(), RangeRocVUS(max_buffer_size=5)]).evaluate(self.y_true, y_score))
+        self.assertListEqual([0., 0.], [r.score for r in results])
+        self.assertTrue(any("constant value" in str(warning.message) for warning in w))
+
+
+class TestScoreMany(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.y_true = np.zeros(500, dtype=np.int_)
+        self.y_true[50:70] = 1
+        self.y_true[300:340] = 1
+        self.y_scores = np.round(rng.random((5, 500)), 2)
+        self.y_scores[:, self.y_true == 1] += 0.2
+        self.y_scores[1, 10] = np.nan
+        self.y_scores[2, 20] = np.inf
+
+    def test_same_results_as_metrics(self):
+        metrics = [
+            RocAUC(), PrAUC(), AveragePrecision(), RangePrAUC(buffer_size=10), RangeRocAUC(),
+            RangePrVUS(max_buffer_size=20), RangeRocVUS(max_buffer_size=20, compatibility_mode=True),
+            F1Score(PercentileThresholding(95)), FScoreAtK(), RangePrecisionRangeRecallAUC(max_samples=10),
+        ]
+        for metric in metrics:
+            expected = [metric(self.y_true, y_score, nan_is_0=False) for y_score in self.y_scores]
+            result = metric.score_many(self.y_true, self.y_scores, nan_is_0=False)
+            np.testing.assert_allclose(expected, result, rtol=0, atol=1e-12, err_msg=metric.name)
+
+    def test_constant_scores(self):
+        self.y_scores[3] = 0.5
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = RocAUC().score_many(self.y_true, self.y_scores)
+        self.assertEqual(0, result[3])
+        self.assertTrue(any("constant value" in str(warning.message) for warning in w))
+
+    def test_shares_label_context(self):
+        labels = LabelContext(self.y_true)
+        metric = RangePrVUS(max_buffer_size=5)
+        first = metric.score_many(labels, self.y_scores[:2])
+        with patch.object(RangeAucMetric, "_slope_windows", side_effect=AssertionError("labels not cached")):
+            second = metric.score_many(labels, self.y_scores[:2])
+            # labels are also shared between metrics with the same range parameters
+            RangeRocVUS(max_buffer_size=5).score_many(labels, self.y_scores[2:])
+        np.testing.assert_array_equal(first, second)
+
+    def test_requires_2d_scores(self):
+        with self.assertRaises(ValueError):
+            RocAUC().score_many(self.y_true, self.y_scores[0])
+
+
+class TestMetricContext(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(7)
+        self.y_true = (rng.random(500) > 0.9).astype(np.int_)
+        self.y_score = np.round(rng.random(500), 1)
+        self.context = MetricContext(self.y_true.copy(), self.y_score.copy())
+
+    def test_roc_curve(self):
+        for actual, expected in zip(self.context.roc_curve(), roc_curve(self.y_true, self.y_score)):
+            np.testing.assert_array_equal(expected, actual)
+
+    def test_precision_recall_curve(self):
+        for actual, expected in zip(self.context.precision_recall_curve(),
+                                    precision_recall_curve(self.y_true, self.y_score)):
+            np.testing.assert_array_equal(expected, actual)
+
+    def test_caches_results(self):
+        self.assertIs(self.context.argsort, self.context.argsort)
+        self.assertIs(self.context.roc_curve(), self.context.roc_curve())
+        self.assertEqual(1, self.context.cached("key", lambda: 1))
+        self.assertEqual(1, self.context.cached("key", lambda: 2))
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.context.y_score[0] = 1.
@@ -1,4 +1,6 @@
+import contextlib
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -14,6 +16,24 @@ except ImportError:
     _skip_pythresh_test = True
 
 
+class CountingThresholder:
+    def __init__(self, factor, random_state=42):
+        self.factor = factor
+        self.random_state = random_state
+        self.calls = 0
+
+    def get_params(self, deep=True):
+        return {"factor": self.factor, "random_state": self.random_state}
+
+    def eval(self, y_score):
+        self.calls += 1
+        self.thresh_ = np.mean(y_score) * self.factor
+        return (y_score >= self.thresh_).astype(np.int_)
+
+    def __repr__(self):
+        return f"CountingThresholder(factor={self.factor})"
+
+
 class TestThresholding(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -61,6 +81,19 @@ class TestThresholding(unittest.TestCase):
         strategy = TopKRangesThresholding(k=2)
         self._test_strategy(strategy, 0.60, [0, 0, 1, 0, 1, 0, 0, 0, 0])
 
+    def test_top_k_ranges_thresholding_same_as_scan(self):
+        rng = np.random.default_rng(42)
+        for _ in range(100):
+            y_scores = np.round(rng.random(50), rng.integers(1, 3))
+            k = int(rng.integers(1, 10))
+            thresholds = np.unique(y_scores)[::-1]
+            # reference: scan all thresholds from high to low (excluding maximum and minimum)
+            expected = thresholds[0]
+            for expected in thresholds[1:-1]:
+                if TopKRangesThresholding._count_anomaly_ranges((y_scores >= expected).astype(np.int_)) >= k:
+                    break
+            self.assertEqual(expected, TopKRangesThresholding(k=k).find_threshold(self.y_true, y_scores))
+
     def test_sigma_thresholding(self):
         strategy = SigmaThresholding(factor=1)
         self._test_strategy(strategy, 0.70, [0, 0, 1, 0, 0, 0, 0, 0, 0])
@@ -91,3 +124,44 @@ class TestThresholding(unittest.TestCase):
         if pythresh_version >= [0, 2, 8]:
             strategy = PyThreshThresholding(pythresh_thresholder=REGR(method="theil", random_state=42))
             self._test_strategy(strategy, 0.72, [0, 0, 1, 0, 0, 0, 0, 0, 0])
+
+    def test_pythresh_thresholding_memoized(self):
+        thresholder = CountingThresholder(factor=2)
+        with patch("timeeval.metrics.thresholding.tmp_np_random_seed_pythresh",
+                   lambda *args: contextlib.nullcontext()):
+            first = PyThreshThresholding(thresholder).fit_transform(self.y_true, self.y_scores)
+            # same configuration and scores: the thresholder is not evaluated again
+            second_strategy = PyThreshThresholding(CountingThresholder(factor=2))
+            second = second_strategy.fit_transform(self.y_true, self.y_scores)
+            self.assertEqual(1, thresholder.calls)
+            self.assertEqual(thresholder.thresh_, second_strategy.threshold)
+            np.testing.assert_array_equal(first, second)
+
+            # other configuration or scores
+            PyThreshThresholding(CountingThresholder(factor=1)).fit(self.y_true, self.y_scores)
+            PyThreshThresholding(thresholder).fit(self.y_true, self.y_scores + 0.1)
+            self.assertEqual(2, thresholder.calls)
+
+    def test_pythresh_thresholding_keyed_on_parameters(self):
+        # both thresholders have the same repr, but different parameters
+        first = CountingThresholder(factor=2, random_state=1)
+        second = CountingThresholder(factor=2, random_state=2)
+        with patch("timeeval.metrics.thresholding.tmp_np_random_seed_pythresh",
+                   lambda *args: contextlib.nullcontext()):
+            PyThreshThresholding(first).fit(self.y_true, self.y_scores)
+            PyThreshThresholding(second).fit(self.y_true, self.y_scores)
+        self.assertEqual(1, first.calls)
+        self.assertEqual(1, second.calls)
+
+    def test_pythresh_thresholding_unseeded_not_memoized(self):
+        thresholder = CountingThresholder(factor=2, random_state=None)
+        with patch("timeeval.metrics.thresholding.tmp_np_random_seed_pythresh",
+                   lambda *args: contextlib.nullcontext()):
+            PyThreshThresholding(thresholder).fit(self.y_true, self.y_scores)
+            PyThreshThresholding(thresholder).fit(self.y_true, self.y_scores)
+            self.assertEqual(2, thresholder.calls)
+
+            # a seed passed to the strategy makes the evaluation deterministic
+            PyThreshThresholding(thresholder, random_state=7).fit(self.y_true, self.y_scores)
+            PyThreshThresholding(thresholder, random_state=7).fit(self.y_true, self.y_scores)
+            self.assertEqual(3, thresholder.calls)
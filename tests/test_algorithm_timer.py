@@ -5,6 +5,7 @@ import numpy as np
 
 from timeeval import Algorithm, AlgorithmParameter, TrainingType
 from timeeval.adapters import FunctionAdapter
+from timeeval.adapters.base import Adapter, ResourceUsage
 from timeeval.data_types import ExecutionType
 from timeeval._core.times import Times
 
@@ -45,3 +46,38 @@ class TestAlgorithmTimer(unittest.TestCase):
         self.assertDictEqual(times.to_dict(), {"execute_preprocess_time": pre,
                                                "execute_main_time": main,
                                                "execute_postprocess_time": post})
+
+    def test_resource_usage(self):
+        usage = ResourceUsage(peak_memory=100, mean_memory=50, cpu_time=2, cpu_utilization=1, cpu_throttled_time=0.5,
+                              block_io_read=10, block_io_write=20)
+
+        class ReportingAdapter(Adapter):
+            def __init__(self):
+                self.usage = None
+
+            def _call(self, dataset: AlgorithmParameter, args) -> AlgorithmParameter:
+                self.usage = usage
+                return dataset
+
+            def pop_resource_usage(self):
+                result, self.usage = self.usage, None
+                return result
+
+        algorithm = Algorithm(main=ReportingAdapter(), name="test")
+        _, times = Times.from_execute_algorithm(algorithm, np.random.rand(10), {"hyper_params": {}})
+        result = times.to_dict()
+        self.assertEqual(result["execute_peak_memory"], 100)
+        self.assertEqual(result["execute_cpu_throttled_time"], 0.5)
+        self.assertEqual(set(result) - {"execute_preprocess_time", "execute_main_time", "execute_postprocess_time"},
+                         {k for k in ResourceUsage.result_keys() if k.startswith("execute_")})
+
+        # the default batch implementation reports the usage of each configuration
+        batch_results = algorithm.execute_batch(np.random.rand(10), [{"hyper_params": {}}] * 2)
+        self.assertListEqual([r.resource_usage for r in batch_results], [usage] * 2)
+        _, times = Times.from_batch_result(algorithm, batch_results[0], {"hyper_params": {}})
+        self.assertEqual(times.to_dict()["execute_peak_memory"], 100)
+
+        merged = usage.merge(ResourceUsage(peak_memory=80, mean_memory=70, cpu_time=1, cpu_utilization=0.5,
+                                           cpu_throttled_time=0, block_io_read=5, block_io_write=0))
+        self.assertEqual(merged, ResourceUsage(peak_memory=100, mean_memory=60, cpu_time=3, cpu_utilization=0.75,
+                                               cpu_throttled_time=0.5, block_io_read=15, block_io_write=20))
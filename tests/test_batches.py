@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from tests.fixtures.algorithms import BatchedDeviatingFromMean, SupervisedDeviatingFromMean
+from tests.fixtures.call_mocks import MockProcess, MockRsync
+from tests.fixtures.dask_mocks import MockDaskClient, MockDaskSSHCluster
+from timeeval import (TimeEval, Algorithm, DatasetManager, ResourceConstraints, Status, RemoteConfiguration,
+                      TrainingType)
+from timeeval._core.experiments import batch_experiments
+from timeeval.params import FullParameterGrid
+
+
+class TestBatches(unittest.TestCase):
+    def setUp(self) -> None:
+        self.datasets = DatasetManager("./tests/example_data",
+                                       custom_datasets_file=Path("./tests/example_data/datasets.json"))
+        self.dataset_ids = [("custom", "dataset.1"), ("custom", "dataset.1.train")]
+        self.algorithm = Algorithm(name="batched", main=BatchedDeviatingFromMean(batch_size=3),
+                                   param_config=FullParameterGrid({"a": [1, 2, 3], "fail": [False, True]}))
+
+    def _run(self, algorithms, **kwargs) -> pd.DataFrame:
+        kwargs.setdefault("disable_progress_bar", True)
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = TimeEval(self.datasets, self.dataset_ids, algorithms, results_path=Path(tmp_path), **kwargs)
+            timeeval.run()
+            return timeeval.get_results(aggregated=False)
+
+    def _assert_batched_results(self, results: pd.DataFrame) -> None:
+        # per dataset, 6 configurations form two batches of 3
+        self.assertEqual(len(results), 12)
+        # remote errors do not report the hyperparameters, thus, we rely on the status
+        failed = results["status"] == Status.ERROR
+        self.assertEqual(failed.sum(), 6)
+        self.assertTrue(results.loc[failed, "error_message"].str.contains("failing configuration").all())
+        self.assertTrue((results.loc[~failed, "status"] == Status.OK).all())
+        self.assertFalse(results.loc[~failed, "hyper_params"].str.contains('"fail": true').any())
+        np.testing.assert_array_equal(results.loc[~failed, "execute_main_time"], 3)
+        self.assertFalse(results.loc[~failed, "ROC_AUC"].isna().any())
+
+    def test_batch_experiments(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            supervised = Algorithm(name="supervised", main=SupervisedDeviatingFromMean(),
+                                   training_type=TrainingType.SUPERVISED,
+                                   param_config=FullParameterGrid({"a": [1, 2]}))
+            timeeval = TimeEval(self.datasets, self.dataset_ids, [self.algorithm, supervised], repetitions=2,
+                                results_path=Path(tmp_path), disable_progress_bar=True)
+            batches = list(batch_experiments(timeeval.exps))
+        # batches do not mix datasets and supervised algorithms are not batched
+        self.assertListEqual([len(b) for b in batches if b[0].algorithm is self.algorithm], [3] * 8)
+        self.assertTrue(all(len(b) == 1 for b in batches if b[0].algorithm is supervised))
+        for batch in batches:
+            self.assertEqual(len({(exp.algorithm.name, exp.dataset_name) for exp in batch}), 1)
+
+    def test_failing_heuristic_is_not_batched(self):
+        heuristic = "heuristic:ParameterDependenceHeuristic(source_parameter='a', fn=lambda a: 1 / a)"
+        algorithm = Algorithm(name="batched", main=BatchedDeviatingFromMean(batch_size=3),
+                              param_config=FullParameterGrid({"a": [1, 0, 2, 3], "b": [heuristic]}))
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = TimeEval(self.datasets, self.dataset_ids[:1], [algorithm], results_path=Path(tmp_path),
+                                disable_progress_bar=True)
+            self.assertListEqual([len(b) for b in batch_experiments(timeeval.exps)], [1, 1, 2])
+            timeeval.run()
+        results = timeeval.get_results(aggregated=False)
+        self.assertListEqual(results["status"].tolist(), [Status.OK, Status.ERROR, Status.OK, Status.OK])
+
+    def test_sequential(self):
+        self._assert_batched_results(self._run([self.algorithm]))
+
+    def test_parallel(self):
+        sequential = self._run([self.algorithm])
+        parallel = self._run([self.algorithm], resource_constraints=ResourceConstraints(tasks_per_host=2))
+        self._assert_batched_results(parallel)
+        compare_columns = ["algorithm", "collection", "dataset", "hyper_params_id", "status", "ROC_AUC"]
+        pd.testing.assert_frame_equal(parallel[compare_columns], sequential[compare_columns])
+
+    @patch("timeeval._core.remote.Popen")
+    @patch("timeeval.timeeval.subprocess.call")
+    @patch("timeeval._core.remote.Client")
+    @patch("timeeval._core.remote.SSHCluster")
+    def test_distributed(self, mock_cluster, mock_client, mock_call, mock_popen):
+        mock_client.return_value = MockDaskClient()
+        mock_cluster.return_value = MockDaskSSHCluster(workers=1)
+        mock_call.side_effect = MockRsync()
+        mock_popen.return_value = MockProcess()
+        # the progress bar tracks the remote results
+        results = self._run([self.algorithm], distributed=True, disable_progress_bar=False,
+                            remote_config=RemoteConfiguration(scheduler_host="localhost", worker_hosts=["localhost"]))
+        self._assert_batched_results(results)
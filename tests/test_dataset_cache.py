@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from timeeval.utils.dataset_cache import DatasetCache, DEFAULT_MAX_SIZE
+from timeeval.utils.datasets import load_dataset, load_labels_only
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = Path("./tests/example_data/dataset.train.csv")
+
+    def test_labels_are_cached_and_read_only(self):
+        cache = DatasetCache()
+        labels = cache.load_labels(self.path)
+        np.testing.assert_array_equal(labels, load_labels_only(self.path))
+        self.assertFalse(labels.flags.writeable)
+        with self.assertRaises(ValueError):
+            labels[0] = 1
+
+        self.assertIs(cache.load_labels(self.path), labels)
+        info = cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.entries, 1)
+
+    def test_labels_from_cached_dataset(self):
+        cache = DatasetCache()
+        df = cache.load_dataset(self.path)
+        with patch("timeeval.utils.dataset_cache.load_labels_only") as mock_load:
+            labels = cache.load_labels(self.path)
+            mock_load.assert_not_called()
+        np.testing.assert_array_equal(labels, df["is_anomaly"].values)
+
+    def test_reload_changed_file(self):
+        cache = DatasetCache()
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / "dataset.csv"
+            shutil.copy(self.path, path)
+            df = cache.load_dataset(path)
+
+            # simulate a changed file
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            df2 = cache.load_dataset(path)
+        self.assertIsNot(df, df2)
+        self.assertEqual(cache.info().misses, 2)
+        self.assertEqual(cache.info().entries, 1)
+
+    def test_lru_eviction(self):
+        size = int(load_dataset(self.path).memory_usage(index=True).sum())
+        cache = DatasetCache(max_size=size)
+        cache.load_dataset(self.path)
+        cache.load_labels(self.path)
+
+        info = cache.info()
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.entries, 1)
+        self.assertLessEqual(info.size, size)
+
+        # entries exceeding the limit are not cached
+        cache = DatasetCache(max_size=1)
+        cache.load_dataset(self.path)
+        self.assertEqual(cache.info().entries, 0)
+
+    def test_resize_default_cache(self):
+        size = int(load_dataset(self.path).memory_usage(index=True).sum())
+        cache = DatasetCache.default()
+        try:
+            cache.clear()
+            cache.load_dataset(self.path)
+            self.assertIs(DatasetCache.default(max_size=size), cache)
+            self.assertEqual(cache.info().entries, 1)
+
+            DatasetCache.default(max_size=size - 1)
+            info = cache.info()
+            self.assertEqual(info.max_size, size - 1)
+            self.assertEqual(info.entries, 0)
+            self.assertEqual(info.size, 0)
+        finally:
+            cache.resize(DEFAULT_MAX_SIZE)
+            cache.clear()
@@ -1,6 +1,7 @@
 import os
 import socket
 import tempfile
+import threading
 import time
 import unittest
 from itertools import cycle
@@ -21,6 +22,7 @@ from tests.fixtures.docker_mocks import MockDockerClient, TEST_DOCKER_IMAGE
 from timeeval import TimeEval, Algorithm, DatasetManager, RemoteConfiguration, Status, ResourceConstraints
 from timeeval.adapters import DockerAdapter
 from timeeval.params import FullParameterGrid
+from timeeval.timeeval import _run_prepare_steps
 from timeeval.utils.hash_dict import hash_dict
 
 
@@ -124,6 +126,33 @@ class TestDistributedTimeEval(unittest.TestCase):
                 (timeeval.results_path / "docker" / hash_dict({}) / "custom" / "dataset.1" / "1").exists()
             )
 
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_prepare_pulls_each_image_once(self, mock_docker):
+        mock_docker.return_value = MockDockerClient()
+
+        datasets_config = Path("./tests/example_data/datasets.json")
+        datasets = DatasetManager("./tests/example_data", custom_datasets_file=datasets_config)
+        algorithms = [
+            Algorithm(name="docker-1", main=DockerAdapter("test-image"), data_as_file=True),
+            Algorithm(name="docker-2", main=DockerAdapter("test-image", timeout=Duration("1 minute")),
+                      data_as_file=True),
+            Algorithm(name="docker-3", main=DockerAdapter("test-image", tag="1.0"), data_as_file=True),
+            Algorithm(name="docker-4", main=DockerAdapter("other-image", skip_pull=True), data_as_file=True),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = TimeEval(datasets, [("custom", "dataset.1")], algorithms, results_path=Path(tmp_path),
+                                disable_progress_bar=True)
+            timeeval._prepare()
+
+        self.assertListEqual(sorted(mock_docker.return_value.images.pulled), ["test-image:1.0", "test-image:latest"])
+
+    def test_prepare_steps_run_concurrently(self):
+        # each step waits for the other one, which would time out if they ran sequentially
+        barrier = threading.Barrier(2, timeout=5)
+        durations = _run_prepare_steps([lambda: barrier.wait(), lambda: barrier.wait()], n_jobs=2)
+        self.assertEqual(len(durations), 2)
+
     @patch("timeeval._core.remote.Popen")
     @patch("timeeval.timeeval.subprocess.call")
     @patch("timeeval.adapters.docker.docker.from_env")
@@ -5,8 +5,15 @@ from pathlib import Path
 
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    _pyarrow_available = True
+except ImportError:
+    _pyarrow_available = False
+
 from tests.fixtures.algorithms import DeviatingFromMean, DeviatingFromMedian
 from timeeval import TimeEval, Algorithm, DatasetManager
+from timeeval._core.experiments import _load_experiment_combinations
 
 
 class TestExperimentCombinations(unittest.TestCase):
@@ -40,3 +47,40 @@ class TestExperimentCombinations(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results.iloc[0].algorithm, "deviating_from_mean")
         self.assertEqual(results.iloc[0].dataset, "dataset.3")
+
+    def _write_combinations(self, path: Path) -> None:
+        df = pd.DataFrame({
+            "algorithm": ["deviating_from_mean", "deviating_from_median"],
+            "collection": ["custom", "custom"],
+            "dataset": ["dataset.1", "dataset.3"],
+            "hyper_params_id": ["abc", "123"],
+            "status": ["Status.ERROR", "Status.OK"],
+        })
+        if path.suffix == ".parquet":
+            df.to_parquet(path)
+        elif path.suffix == ".feather":
+            df.to_feather(path)
+        else:
+            df.to_csv(path, index=False)
+
+    def _assert_loaded_combinations(self, suffix: str) -> None:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / f"combinations{suffix}"
+            self._write_combinations(path)
+            combinations = _load_experiment_combinations(path)
+        self.assertSetEqual(set(combinations), {
+            ("deviating_from_mean", "custom", "dataset.1", "abc"),
+            # numeric IDs are compared as strings
+            ("deviating_from_median", "custom", "dataset.3", "123"),
+        })
+
+    def test_load_csv(self):
+        self._assert_loaded_combinations(".csv")
+
+    @unittest.skipUnless(_pyarrow_available, "requires pyarrow")
+    def test_load_parquet(self):
+        self._assert_loaded_combinations(".parquet")
+
+    @unittest.skipUnless(_pyarrow_available, "requires pyarrow")
+    def test_load_feather(self):
+        self._assert_loaded_combinations(".feather")
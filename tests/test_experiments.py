@@ -1,6 +1,7 @@
 import unittest
 from copy import deepcopy
 from pathlib import Path
+from unittest.mock import patch
 
 from tests.fixtures.algorithms import SupervisedDeviatingFromMean
 from timeeval import Algorithm, TrainingType, InputDimensionality, DefaultMetrics, DatasetManager
@@ -74,3 +75,53 @@ class TestExperiments(unittest.TestCase):
         params_ids = [exp.params_id for exp in exps]
         self.assertEqual(params_ids[0], params_ids[2])
         self.assertEqual(params_ids[1], params_ids[3])
+
+    def test_lazy_heuristic_evaluation(self):
+        datasets = [self.dmgr.get(d) for d in self.dmgr.select()]
+        exps = Experiments(
+            dmgr=self.dmgr,
+            datasets=datasets,
+            algorithms=self.algorithms,
+            repetitions=2,
+            metrics=DefaultMetrics.default_list(),
+            base_result_path=Path("tmp_path"),
+            skip_invalid_combinations=True
+        )
+        with patch("timeeval._core.experiments.inject_heuristic_values") as mock_inject:
+            mock_inject.side_effect = lambda params, *args: params
+            self.assertEqual(len(exps), 12)
+            paths = list(exps.results_paths())
+            mock_inject.assert_not_called()
+
+            stream = iter(exps)
+            first = next(stream)
+            # repetitions share the parameters with heuristic values
+            self.assertEqual(mock_inject.call_count, 1)
+            next(stream)
+            self.assertEqual(mock_inject.call_count, 1)
+            self.assertEqual(first.results_path, paths[0])
+
+            self.assertListEqual([exp.results_path for exp in exps], paths)
+
+    def test_heuristics_are_evaluated_once_per_configuration(self):
+        datasets = [self.dmgr.get(d) for d in self.dmgr.select()]
+        exps = Experiments(
+            dmgr=self.dmgr,
+            datasets=datasets,
+            algorithms=self.algorithms,
+            repetitions=2,
+            metrics=DefaultMetrics.default_list(),
+            base_result_path=Path("tmp_path"),
+            skip_invalid_combinations=True
+        )
+        with patch("timeeval._core.experiments.inject_heuristic_values") as mock_inject:
+            mock_inject.side_effect = lambda params, *args: dict(params)
+            first = list(exps)
+            # e.g. the results paths of PREPARE, the scheduling loop, and the resume checks iterate again
+            second = list(exps)
+            list(exps)
+            self.assertEqual(mock_inject.call_count, 6)
+        configs = [(call.args[0], call.args[2].datasetId) for call in mock_inject.call_args_list]
+        self.assertEqual(len(configs), len({(tuple(sorted(p.items())), d) for p, d in configs}))
+        self.assertListEqual([exp.params for exp in first], [exp.params for exp in second])
+        self.assertIs(first[0].params, second[0].params)
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from itertools import cycle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from tests.fixtures.algorithms import DeviatingFromMean, DeviatingFromMedian, ErroneousAlgorithm
+from timeeval import TimeEval, Algorithm, DatasetManager, ResourceConstraints, Status
+
+
+class TestLocalParallelTimeEval(unittest.TestCase):
+    def setUp(self) -> None:
+        self.results = pd.read_csv("tests/example_data/results.csv")
+        self.datasets = DatasetManager("./tests/example_data",
+                                       custom_datasets_file=Path("./tests/example_data/datasets.json"))
+        self.dataset_ids = list(zip(cycle(["custom"]), self.results.dataset.unique()))
+        self.algorithms = [
+            Algorithm(name="deviating_from_mean", main=DeviatingFromMean()),
+            Algorithm(name="deviating_from_median", main=DeviatingFromMedian())
+        ]
+
+    def _run(self, algorithms, tasks_per_host: int) -> pd.DataFrame:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = TimeEval(self.datasets, self.dataset_ids, algorithms,
+                                repetitions=2,
+                                results_path=Path(tmp_path),
+                                resource_constraints=ResourceConstraints(tasks_per_host=tasks_per_host),
+                                disable_progress_bar=True)
+            timeeval.run()
+            return timeeval.get_results(aggregated=False)
+
+    def test_same_results_and_order_as_sequential(self):
+        sequential = self._run(self.algorithms, tasks_per_host=1)
+        parallel = self._run(self.algorithms, tasks_per_host=2)
+
+        compare_columns = ["algorithm", "collection", "dataset", "repetition", "status", "ROC_AUC"]
+        pd.testing.assert_frame_equal(parallel[compare_columns], sequential[compare_columns])
+
+        results = parallel.groupby(["algorithm", "collection", "dataset"])["ROC_AUC"].mean()
+        np.testing.assert_array_almost_equal(results.values, self.results["ROC_AUC"].values)
+
+    def test_records_exceptions_of_workers(self):
+        algorithms = [
+            Algorithm(name="exception", main=ErroneousAlgorithm(error_message="error in worker")),
+            self.algorithms[0],
+        ]
+        results = self._run(algorithms, tasks_per_host=2)
+
+        failed = results[results.algorithm == "exception"]
+        self.assertTrue((failed.status == Status.ERROR).all())
+        self.assertTrue(failed.error_message.str.contains("error in worker").all())
+        self.assertTrue((results[results.algorithm == "deviating_from_mean"].status == Status.OK).all())
@@ -7,11 +7,13 @@ import numpy as np
 import pandas as pd
 from freezegun import freeze_time
 
-from timeeval import TimeEval, Algorithm, Datasets, DatasetManager, AlgorithmParameter, DefaultMetrics
+from timeeval import (TimeEval, Algorithm, Datasets, DatasetManager, AlgorithmParameter, DefaultMetrics, ScoresFormat,
+                      ResourceConstraints)
 from timeeval.adapters import FunctionAdapter
 from timeeval.constants import RAW_ANOMALY_SCORES_TS, ANOMALY_SCORES_TS, METRICS_CSV, EXECUTION_LOG, HYPER_PARAMETERS, RESULTS_CSV
 from timeeval.params import FixedParameters
 from timeeval.utils.hash_dict import hash_dict
+from timeeval.utils.scores import load_scores
 
 
 def deviating_from_mean(X: AlgorithmParameter, args: dict):
@@ -48,6 +50,20 @@ class TestOutputData(unittest.TestCase):
             self.assertTrue((parent_path / HYPER_PARAMETERS).exists())
             self.assertTrue((tmp_path / "2021_01_01_00_00_00" / RESULTS_CSV).exists())
 
+    def test_binary_scores(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            tmp_path = Path(tmp_path)
+            timeeval = TimeEval(self.datasets, [self.DATASET], self.algorithms, results_path=tmp_path,
+                                scores_format=ScoresFormat(binary=True, dtype="float32"))
+            timeeval.run()
+            parent_path = tmp_path / "2021_01_01_00_00_00" / "deviating_from_mean" / self.hash / "test" / "dataset-int" / "1"
+
+            self.assertFalse((parent_path / ANOMALY_SCORES_TS).exists())
+            self.assertTrue((parent_path / "raw_anomaly_scores.npy").exists())
+            scores = np.load(parent_path / "anomaly_scores.npy")
+            self.assertEqual(scores.dtype, np.float32)
+            np.testing.assert_array_equal(load_scores(parent_path / ANOMALY_SCORES_TS), scores)
+
     def test_log_exists_and_is_correct(self):
         with tempfile.TemporaryDirectory() as tmp_path:
             tmp_path = Path(tmp_path)
@@ -95,3 +111,22 @@ class TestOutputData(unittest.TestCase):
 
             self.assertAlmostEqual(0.8102, results.loc[0, "ROC_AUC"], places=4)
             self.assertAlmostEqual(0.0004, results.loc[0, "RANGE_PR_AUC"], places=4)
+
+    def test_metric_times(self):
+        for parallel_metrics in [False, True]:
+            with self.subTest(parallel_metrics=parallel_metrics), tempfile.TemporaryDirectory() as tmp_path:
+                tmp_path = Path(tmp_path)
+                timeeval = TimeEval(self.datasets, [("custom", "dataset.1")], self.algorithms,
+                                    results_path=tmp_path,
+                                    metrics=[DefaultMetrics.ROC_AUC, DefaultMetrics.RANGE_PR_AUC],
+                                    resource_constraints=ResourceConstraints(parallel_metrics=parallel_metrics))
+                timeeval.run()
+
+                parent_path = tmp_path / "2021_01_01_00_00_00" / "deviating_from_mean" / self.hash / "custom" / "dataset.1" / "1"
+                metrics = pd.read_csv(parent_path / METRICS_CSV)
+                results = pd.read_csv(tmp_path / "2021_01_01_00_00_00" / RESULTS_CSV)
+                for df in [metrics, results]:
+                    self.assertAlmostEqual(0.8102, df.loc[0, "ROC_AUC"], places=4)
+                    self.assertAlmostEqual(0.0004, df.loc[0, "RANGE_PR_AUC"], places=4)
+                    self.assertGreaterEqual(df.loc[0, "ROC_AUC_time"], 0)
+                    self.assertGreaterEqual(df.loc[0, "RANGE_PR_AUC_time"], 0)
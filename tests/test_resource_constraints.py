@@ -1,12 +1,19 @@
+import io
+import tempfile
 import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import psutil
 from durations import Duration
 from tests.fixtures.algorithms import DeviatingFromMean
+from tests.fixtures.docker_mocks import MockDockerClient
 
 from timeeval import TimeEval, DatasetManager, ResourceConstraints, Algorithm
 from timeeval.adapters import DockerAdapter
-from timeeval.resource_constraints import GB, DEFAULT_TIMEOUT
+from timeeval.resource_constraints import GB, DEFAULT_TIMEOUT, DEFAULT_DATASET_CACHE_SIZE
 
 
 class TestResourceConstraints(unittest.TestCase):
@@ -45,6 +52,13 @@ class TestResourceConstraints(unittest.TestCase):
         self.assertEqual(mem, self.usable_memory)
         self.assertEqual(cpu, cpu_limit)
 
+    def test_dataset_cache_size(self):
+        self.assertEqual(ResourceConstraints(dataset_cache_size=1325).get_dataset_cache_size(), 1325)
+        self.assertEqual(ResourceConstraints(task_memory_limit=1 * GB).get_dataset_cache_size(), GB // 4)
+        self.assertEqual(ResourceConstraints(task_memory_limit=64 * GB).get_dataset_cache_size(),
+                         DEFAULT_DATASET_CACHE_SIZE)
+        self.assertLessEqual(ResourceConstraints(tasks_per_host=4).get_dataset_cache_size(), self.usable_memory // 16)
+
     def test_overwrites(self):
         tasks = 2
         mem_overwrite = 1325
@@ -58,14 +72,68 @@ class TestResourceConstraints(unittest.TestCase):
         self.assertEqual(mem, mem_overwrite)
         self.assertEqual(cpu, cpu_overwrite)
 
-    def test_tasks_per_node_overwrite_when_non_distributed(self):
+    def test_tasks_per_node_kept_when_non_distributed(self):
         limits = ResourceConstraints(tasks_per_host=4)
         algorithm = Algorithm(name="dummy", main=DockerAdapter(image_name="dummy", skip_pull=True))
 
         timeeval = TimeEval(DatasetManager("./tests/example_data"), [("test", "dataset-int")], [algorithm],
                             distributed=False,
                             resource_constraints=limits)
-        self.assertEqual(1, timeeval.exps.resource_constraints.tasks_per_host)
+        self.assertEqual(4, timeeval.exps.resource_constraints.tasks_per_host)
+
+    def test_tasks_per_node_allowed_for_non_docker_algorithms(self):
+        limits = ResourceConstraints(tasks_per_host=2)
+        algorithm = Algorithm(name="deviating_from_mean", main=DeviatingFromMean())
+
+        timeeval = TimeEval(DatasetManager("./tests/example_data"), [("test", "dataset-int")], [algorithm],
+                            resource_constraints=limits)
+        self.assertEqual(2, timeeval.exps.resource_constraints.tasks_per_host)
+
+    def test_metric_workers(self):
+        self.assertEqual(1, ResourceConstraints(task_cpu_limit=4).get_metric_workers())
+        self.assertEqual(4, ResourceConstraints(task_cpu_limit=4.5, parallel_metrics=True).get_metric_workers())
+        self.assertEqual(1, ResourceConstraints(task_cpu_limit=0.5, parallel_metrics=True).get_metric_workers())
+
+    def test_parallel_metrics_allowed_for_non_docker_algorithms(self):
+        limits = ResourceConstraints(parallel_metrics=True)
+        algorithm = Algorithm(name="deviating_from_mean", main=DeviatingFromMean())
+
+        timeeval = TimeEval(DatasetManager("./tests/example_data"), [("test", "dataset-int")], [algorithm],
+                            resource_constraints=limits)
+        self.assertTrue(timeeval.exps.resource_constraints.parallel_metrics)
+
+    def test_resource_usage_allowed_for_non_docker_algorithms(self):
+        limits = ResourceConstraints(resource_usage_interval=Duration("1 second"), resource_usage_series=True)
+        algorithm = Algorithm(name="deviating_from_mean", main=DeviatingFromMean())
+
+        timeeval = TimeEval(DatasetManager("./tests/example_data"), [("test", "dataset-int")], [algorithm],
+                            resource_constraints=limits)
+        self.assertEqual(timeeval.exps.resource_constraints.resource_usage_interval.to_seconds(), 1)
+
+    @patch("timeeval.adapters.docker.docker.from_env")
+    def test_resource_usage_results(self, mock_docker):
+        mock_docker.return_value = MockDockerClient(write_scores_file=True)
+        mock_docker.return_value.containers.stats_samples = [
+            {"memory_stats": {"usage": 1000}, "cpu_stats": {"cpu_usage": {"total_usage": 10 ** 9}}}
+        ]
+        mock_docker.return_value.containers.exit_after_stats = True
+        limits = ResourceConstraints(resource_usage_interval=Duration("1 second"))
+        # the mock container produces just 10 scores
+        algorithm = Algorithm(name="docker", main=DockerAdapter(image_name="dummy", skip_pull=True), data_as_file=True,
+                              postprocess=lambda scores, args: np.linspace(0, 1, 3600))
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            datasets = DatasetManager("./tests/example_data",
+                                      custom_datasets_file=Path("./tests/example_data/datasets.json"))
+            timeeval = TimeEval(datasets, [("custom", "dataset.1")], [algorithm], results_path=Path(tmp_path),
+                                resource_constraints=limits, disable_progress_bar=True)
+            with redirect_stdout(io.StringIO()):
+                timeeval.run()
+            results = timeeval.get_results(aggregated=False)
+
+        self.assertEqual(results.loc[0, "execute_peak_memory"], 1000)
+        self.assertEqual(results.loc[0, "execute_cpu_time"], 1)
+        self.assertTrue(results["train_peak_memory"].isna().all())
 
     def test_timeout(self):
         self.assertEqual(ResourceConstraints.default_constraints().get_train_timeout(), DEFAULT_TIMEOUT)
@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from timeeval import Status
+from timeeval._core.results import ResultsStore
+
+
+class TestResultsStore(unittest.TestCase):
+    def test_materializes_rows_with_extra_columns(self):
+        store = ResultsStore(["algorithm", "dataset", "status"])
+        store.append({"algorithm": "a", "dataset": "d1", "status": Status.OK, "ROC_AUC": 0.5})
+        store.append({"algorithm": "b", "dataset": "d2", "status": Status.ERROR, "error_message": None})
+
+        df = store.to_frame()
+        self.assertListEqual(df.columns.tolist(), ["algorithm", "dataset", "status", "ROC_AUC", "error_message"])
+        self.assertEqual(len(store), 2)
+        self.assertTrue(np.isnan(df.loc[1, "ROC_AUC"]))
+        self.assertTrue(pd.isna(df.loc[1, "error_message"]))
+
+    def test_caches_frame_until_modified(self):
+        store = ResultsStore(["algorithm"])
+        store.append({"algorithm": "a"})
+        df = store.to_frame()
+        cached = store._df
+        store.to_frame()
+        self.assertIs(cached, store._df)
+
+        store.append({"algorithm": "b"})
+        self.assertIsNot(cached, store._df)
+        self.assertEqual(len(store.to_frame()), 2)
+        self.assertEqual(len(df), 1)
+
+    def test_frame_modifications_do_not_change_the_store(self):
+        store = ResultsStore(["algorithm"])
+        store.append({"algorithm": "a"})
+        df = store.to_frame()
+        df.loc[0, "algorithm"] = "b"
+        df["new"] = 1
+        self.assertListEqual(store.to_frame().algorithm.tolist(), ["a"])
+        self.assertListEqual(store.to_frame().columns.tolist(), ["algorithm"])
+
+    def test_streams_complete_rows(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / "results.csv"
+            store = ResultsStore(["algorithm", "status", "ROC_AUC"], stream_path=path,
+                                 transient_columns=["future_result"])
+            store.append({"algorithm": "a", "status": Status.OK, "ROC_AUC": 0.5, "future_result": None})
+            store.append({"algorithm": "b", "status": Status.ERROR, "ROC_AUC": np.nan})
+            store.append({"algorithm": "c", "future_result": object()}, stream=False)
+
+            df = pd.read_csv(path)
+        self.assertListEqual(df.columns.tolist(), ["algorithm", "status", "ROC_AUC"])
+        self.assertListEqual(df.algorithm.tolist(), ["a", "b"])
+        self.assertListEqual(df.status.tolist(), ["Status.OK", "Status.ERROR"])
+        self.assertTrue(np.isnan(df.loc[1, "ROC_AUC"]))
+
+    def test_streaming_unknown_columns_fails(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / "results.csv"
+            store = ResultsStore(["algorithm"], stream_path=path)
+            with self.assertRaises(ValueError):
+                store.append({"algorithm": "a", "extra": 1})
+
+    def test_streams_resolved_rows(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / "results.csv"
+            store = ResultsStore(["algorithm", "status"], stream_path=path, transient_columns=["future_result"])
+            store.append({"algorithm": "a", "status": None, "future_result": object()}, stream=False)
+            store.append({"algorithm": "b", "status": Status.ERROR})
+
+            for row in store.rows():
+                if row["status"] is None:
+                    row.update({"status": Status.OK})
+                    store.stream(row)
+            df = pd.read_csv(path)
+        self.assertListEqual(df.algorithm.tolist(), ["b", "a"])
+        self.assertListEqual(df.status.tolist(), ["Status.ERROR", "Status.OK"])
+
+    def test_drop_column(self):
+        store = ResultsStore(["algorithm"])
+        store.append({"algorithm": "a", "future_result": None})
+        store.drop_column("future_result")
+        self.assertListEqual(store.to_frame().columns.tolist(), ["algorithm"])
@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+from itertools import cycle
+from pathlib import Path
+
+import pandas as pd
+
+from tests.fixtures.algorithms import DeviatingFromMean, ErroneousAlgorithm
+from timeeval import TimeEval, Algorithm, DatasetManager, DefaultMetrics, Status
+from timeeval.constants import ANOMALY_SCORES_TS, METRICS_CSV, RESULTS_CSV
+from timeeval.utils.datasets import load_labels_only
+from timeeval.utils.scores import load_scores
+
+
+class TestResume(unittest.TestCase):
+    def setUp(self) -> None:
+        self.results = pd.read_csv("tests/example_data/results.csv")
+        self.datasets = DatasetManager("./tests/example_data",
+                                       custom_datasets_file=Path("./tests/example_data/datasets.json"))
+        self.dataset_ids = list(zip(cycle(["custom"]), self.results.dataset.unique()))
+
+    def _timeeval(self, main, **kwargs) -> TimeEval:
+        return TimeEval(self.datasets, self.dataset_ids, [Algorithm(name="deviating_from_mean", main=main)],
+                        repetitions=2, disable_progress_bar=True, **kwargs)
+
+    def test_resume_skips_completed_experiments(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = self._timeeval(DeviatingFromMean(), results_path=Path(tmp_path))
+            timeeval.run()
+            first_results = timeeval.get_results(aggregated=False)
+
+            exps = list(timeeval.exps)
+            (exps[1].results_path / METRICS_CSV).unlink()
+
+            # all experiments that are executed again fail
+            resumed = self._timeeval(ErroneousAlgorithm(), resume_from=timeeval.results_path)
+            resumed.run()
+            self.assertEqual(resumed.results_path, timeeval.results_path)
+            results = resumed.get_results(aggregated=False)
+            results_file = pd.read_csv(resumed.results_path / RESULTS_CSV)
+
+        self.assertEqual(len(results), len(exps))
+        self.assertEqual(len(results_file), len(exps))
+        self.assertListEqual(results.status.tolist(), [Status.OK, Status.ERROR] + [Status.OK] * (len(exps) - 2))
+        pd.testing.assert_series_equal(results.loc[results.status == Status.OK, "ROC_AUC"],
+                                       first_results.loc[results.status == Status.OK, "ROC_AUC"])
+        self.assertListEqual(results.hyper_params_id.tolist(), first_results.hyper_params_id.tolist())
+
+    def test_resume_reruns_incomplete_experiments(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = self._timeeval(DeviatingFromMean(), results_path=Path(tmp_path))
+            timeeval.run()
+            exp = list(timeeval.exps)[0]
+            metrics = pd.read_csv(exp.results_path / METRICS_CSV)
+            # simulate a crash before the scores were stored
+            metrics.drop(columns=["ROC_AUC"]).to_csv(exp.results_path / METRICS_CSV, index=False)
+            (exp.results_path / ANOMALY_SCORES_TS).unlink()
+
+            self.assertIsNone(exp.load_previous_result())
+
+            resumed = self._timeeval(DeviatingFromMean(), resume_from=timeeval.results_path)
+            resumed.run()
+            self.assertIsNotNone(exp.load_previous_result())
+        self.assertTrue((resumed.results.status == Status.OK).all())
+
+    def test_resume_computes_added_metrics_from_scores(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = self._timeeval(DeviatingFromMean(), results_path=Path(tmp_path),
+                                      metrics=[DefaultMetrics.ROC_AUC])
+            timeeval.run()
+            first_results = timeeval.get_results(aggregated=False)
+
+            # the algorithm is not executed again
+            resumed = self._timeeval(ErroneousAlgorithm(), resume_from=timeeval.results_path,
+                                     metrics=[DefaultMetrics.ROC_AUC, DefaultMetrics.PR_AUC])
+            resumed.run()
+            results = resumed.get_results(aggregated=False)
+            exp = list(resumed.exps)[0]
+            metrics = pd.read_csv(exp.results_path / METRICS_CSV)
+            y_true = load_labels_only(exp.resolved_test_dataset_path)
+            y_scores = load_scores(exp.results_path / ANOMALY_SCORES_TS)
+
+        self.assertTrue((results.status == Status.OK).all())
+        pd.testing.assert_series_equal(results.ROC_AUC, first_results.ROC_AUC)
+        pd.testing.assert_series_equal(results.execute_main_time, first_results.execute_main_time)
+        self.assertFalse(results.PR_AUC.isna().any())
+        self.assertFalse(results.PR_AUC_time.isna().any())
+        self.assertAlmostEqual(results.PR_AUC[0], DefaultMetrics.PR_AUC(y_true, y_scores))
+        # the computed metrics are stored for later runs
+        self.assertAlmostEqual(metrics.PR_AUC[0], results.PR_AUC[0])
+
+    def test_resume_from_missing_directory(self):
+        with self.assertRaises(AssertionError) as ex:
+            self._timeeval(DeviatingFromMean(), resume_from=Path("nonexistent-results-dir"))
+        self.assertIn("run to resume not found", str(ex.exception))
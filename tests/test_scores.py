@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from timeeval import ScoresFormat
+from timeeval.utils.scores import find_scores_file, load_scores, read_scores_file, save_scores
+
+
+class TestScores(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scores = np.array([0.1, 0.5, np.nan, 0.25, 1.0])
+
+    def _roundtrip(self, scores_format: ScoresFormat) -> np.ndarray:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = save_scores(self.scores, Path(tmp_path) / "anomaly_scores.ts", scores_format)
+            self.assertEqual(path.suffix, scores_format.suffix)
+            self.assertEqual(find_scores_file(Path(tmp_path) / "anomaly_scores.ts"), path)
+            return load_scores(Path(tmp_path) / "anomaly_scores.ts")
+
+    def test_text_format(self):
+        np.testing.assert_array_equal(self._roundtrip(ScoresFormat()), self.scores)
+
+    def test_binary_formats(self):
+        np.testing.assert_array_equal(self._roundtrip(ScoresFormat(binary=True)), self.scores)
+        np.testing.assert_array_equal(self._roundtrip(ScoresFormat(binary=True, compressed=True)), self.scores)
+
+        scores = self._roundtrip(ScoresFormat(binary=True, dtype="float32"))
+        self.assertEqual(scores.dtype, np.float32)
+        np.testing.assert_array_equal(scores, self.scores.astype(np.float32))
+
+    def test_missing_scores(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            self.assertIsNone(find_scores_file(Path(tmp_path) / "anomaly_scores.ts"))
+            with self.assertRaises(FileNotFoundError):
+                load_scores(Path(tmp_path) / "anomaly_scores.ts")
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            ScoresFormat(dtype="int32")
+        with self.assertRaises(ValueError):
+            ScoresFormat(compressed=True)
+
+    def test_read_scores_file(self):
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = Path(tmp_path) / "scores.csv"
+            self.scores.tofile(str(path), sep="\n")
+            np.testing.assert_allclose(read_scores_file(path), self.scores)
+
+            path.write_text("0.5,1.0,0.25\n")
+            np.testing.assert_array_equal(read_scores_file(path), np.array([0.5, 1.0, 0.25]))
+
+            # malformed values become NaN
+            path.write_text("0.5\nfoo\n1.0\n")
+            np.testing.assert_array_equal(read_scores_file(path), np.array([0.5, np.nan, 1.0]))
+
+            # binary content is detected independent of the file name
+            with path.open("wb") as fh:
+                np.save(fh, self.scores)
+            np.testing.assert_array_equal(read_scores_file(path), self.scores)
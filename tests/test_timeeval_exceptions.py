@@ -19,6 +19,8 @@ from timeeval import (
 )
 from timeeval.adapters import FunctionAdapter
 from timeeval.metrics import DefaultMetrics
+from timeeval.params import FullParameterGrid
+from timeeval.utils.dataset_cache import DatasetCache
 
 
 class TestTimeEvalExceptions(unittest.TestCase):
@@ -31,7 +33,11 @@ class TestTimeEvalExceptions(unittest.TestCase):
             name="test", main=FunctionAdapter.identity(), data_as_file=False
         )
 
-    @patch("timeeval._core.experiments.load_dataset")
+    def tearDown(self) -> None:
+        # remove mocked datasets from the cache
+        DatasetCache.default().clear()
+
+    @patch("timeeval.utils.dataset_cache.load_dataset")
     def test_wrong_df_shape(self, mock_load):
         df = pd.DataFrame(np.random.rand(10, 2))
         mock_load.side_effect = [df]
@@ -137,6 +143,26 @@ class TestTimeEvalExceptions(unittest.TestCase):
             ERROR_MESSAGE, r[r.algorithm == "exception"].iloc[0].error_message
         )
 
+    def test_evaluation_continues_after_exception_in_heuristic(self):
+        algo = deepcopy(self.identity_algorithm)
+        algo.param_config = FullParameterGrid({
+            "x": [0, 1],
+            "y": ["heuristic:ParameterDependenceHeuristic(source_parameter='x', fn=lambda x: 1 / x)"],
+        })
+        with tempfile.TemporaryDirectory() as tmp_path:
+            timeeval = TimeEval(
+                self.datasets,
+                [("custom", "dataset.1")],
+                [algo],
+                results_path=Path(tmp_path),
+                repetitions=2,
+            )
+            timeeval.run()
+
+        r = timeeval.results
+        self.assertListEqual(r.status.tolist(), [Status.ERROR, Status.ERROR, Status.OK, Status.OK])
+        self.assertIn("Applying heuristic ParameterDependenceHeuristic", r.iloc[0].error_message)
+
     def test_no_experiments(self):
         algo = deepcopy(self.identity_algorithm)
         algo.training_type = TrainingType.SUPERVISED
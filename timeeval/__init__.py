@@ -26,3 +26,4 @@ from .metrics import Metric, DefaultMetrics
 from .remote_configuration import RemoteConfiguration
 from .resource_constraints import ResourceConstraints
 from .timeeval import TimeEval, Status
+from .utils.scores import ScoresFormat
@@ -1,7 +1,7 @@
 from contextlib import redirect_stdout
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,15 +12,45 @@ from ..constants import ANOMALY_SCORES_TS, EXECUTION_LOG, HYPER_PARAMETERS, METR
 from ..data_types import AlgorithmParameter, InputDimensionality, TrainingType
 from ..datasets import Dataset, Datasets
 from ..heuristics import inject_heuristic_values
-from ..metrics import Metric
+from ..metrics import LabelContext, Metric, MetricSuite
 from ..params import Params
 from ..resource_constraints import ResourceConstraints
-from ..utils.datasets import extract_features, load_dataset, load_labels_only
+from ..utils.dataset_cache import DatasetCache
+from ..utils.datasets import CSV_DATASET_CACHE, ensure_csv_dataset, extract_features
 from ..utils.encode_params import dump_params, dumps_params
 from ..utils.results_path import generate_experiment_path
+from ..utils.scores import ScoresFormat, find_scores_file, load_scores, save_scores
 from .times import Times
 
 
+COMBINATION_COLUMNS = ["algorithm", "collection", "dataset", "hyper_params_id"]
+
+
+def _load_experiment_combinations(path: Path) -> FrozenSet[Tuple[str, str, str, str]]:
+    """Loads the experiment combinations file (CSV, Parquet, or Feather) into a set for fast membership checks."""
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        df = pd.read_parquet(path, columns=COMBINATION_COLUMNS)
+    elif suffix in (".feather", ".ftr"):
+        df = pd.read_feather(path, columns=COMBINATION_COLUMNS)
+    else:
+        df = pd.read_csv(path, usecols=COMBINATION_COLUMNS, dtype=str)
+    df = df[COMBINATION_COLUMNS].astype(str)
+    return frozenset(zip(df["algorithm"], df["collection"], df["dataset"], df["hyper_params_id"]))
+
+
+@dataclass
+class _ExperimentConfig:
+    algorithm: Algorithm
+    dataset: Dataset
+    params: Params
+    params_id: str
+    test_path: Path
+    train_path: Optional[Path]
+    # the parameters with the values of the heuristics (or the exception of a failing heuristic), evaluated only once
+    injected_params: Optional[Tuple[Params, Optional[Exception]]] = None
+
+
 @dataclass
 class Experiment:
     dataset: Dataset
@@ -33,6 +63,9 @@ class Experiment:
     metrics: List[Metric]
     resolved_train_dataset_path: Optional[Path]
     resolved_test_dataset_path: Path
+    scores_format: ScoresFormat = ScoresFormat()
+    # exception of a parameter heuristic; the experiment fails with it when it is evaluated
+    heuristics_error: Optional[Exception] = None
 
     @property
     def name(self) -> str:
@@ -60,6 +93,15 @@ class Experiment:
             self.repetition,
         )
 
+    @property
+    def csv_dataset_cache(self) -> Path:
+        return self.base_results_dir / CSV_DATASET_CACHE
+
+    @property
+    def dataset_cache(self) -> DatasetCache:
+        """The dataset cache of this process, sized according to the resource constraints of the task."""
+        return DatasetCache.default(self.resource_constraints.get_dataset_cache_size())
+
     def build_args(self) -> Dict[str, Any]:
         return {
             "results_path": self.results_path,
@@ -90,20 +132,12 @@ class Experiment:
         """
         Using TimeEval distributed, this method is executed on the remote node.
         """
-        # materialize and persist hyper parameters to disk
-        self.params = self.params.materialize()
-        dump_params(self.params, self.results_path / HYPER_PARAMETERS)
-        hyper_params = dumps_params(
-            self.params
-        )  # must be loaded before assess() or fail() will be called!
+        hyper_params = self._materialize_params()  # must be loaded before assess() or fail() will be called!
 
         try:
-            with (self.results_path / EXECUTION_LOG).open("a") as logs_file:
-                print(
-                    f"Starting evaluation of experiment {self.name}\n"
-                    "=============================================\n",
-                    file=logs_file,
-                )
+            self._log_start()
+            if self.heuristics_error is not None:
+                raise self.heuristics_error
 
             # perform training if necessary
             result = self._perform_training()
@@ -111,52 +145,7 @@ class Experiment:
             # perform execution
             y_scores, execution_times = self._perform_execution()
             result.update(execution_times)
-            # backup results to disk
-            pd.DataFrame([result]).to_csv(self.results_path / METRICS_CSV, index=False)
-            # persist raw scores to disk
-            y_scores.tofile(str(self.results_path / RAW_ANOMALY_SCORES_TS), sep="\n")
-
-            y_true = load_labels_only(self.resolved_test_dataset_path)
-            y_true, y_scores = self.scale_scores(y_true, y_scores)
-            # persist scores to disk
-            y_scores.tofile(str(self.results_path / ANOMALY_SCORES_TS), sep="\n")
-
-            with (self.results_path / EXECUTION_LOG).open("a") as logs_file:
-                print(
-                    f"Scoring algorithm {self.algorithm.name} with "
-                    f"{','.join([m.name for m in self.metrics])} metrics",
-                    file=logs_file,
-                )
-
-                # calculate quality metrics
-                errors = 0
-                last_exception = None
-                for metric in self.metrics:
-                    print(f"Calculating {metric.name}", file=logs_file)
-                    try:
-                        score = metric(y_true, y_scores)
-                        result[metric.name] = score
-                        print(f"  = {score}", file=logs_file)
-                        logs_file.flush()
-                    except Exception as e:
-                        print(
-                            f"Exception while computing metric {metric}: {e}",
-                            file=logs_file,
-                        )
-                        errors += 1
-                        if str(e):
-                            last_exception = e
-                        continue
-
-            # write all results to disk (overwriting backup)
-            pd.DataFrame([result]).to_csv(self.results_path / METRICS_CSV, index=False)
-
-            # potentially update parameter search space
-            self.params.assess(y_true, y_scores)
-
-            # rethrow exception if no metric could be calculated
-            if errors == len(self.metrics) and last_exception is not None:
-                raise last_exception
+            self._assess(result, y_scores)
 
         except Exception as e:
             # on any exception, tell the parameter search process that this trial failed
@@ -167,6 +156,118 @@ class Experiment:
         result["hyper_params"] = hyper_params
         return result
 
+    def _materialize_params(self) -> str:
+        # materialize and persist hyper parameters to disk
+        self.params = self.params.materialize()
+        dump_params(self.params, self.results_path / HYPER_PARAMETERS)
+        return dumps_params(self.params)
+
+    def _log_start(self) -> None:
+        with (self.results_path / EXECUTION_LOG).open("a") as logs_file:
+            print(
+                f"Starting evaluation of experiment {self.name}\n"
+                "=============================================\n",
+                file=logs_file,
+            )
+
+    def _assess(self, result: Dict[str, Any], y_scores: np.ndarray) -> None:
+        """Stores the scores and computes the quality metrics; the metrics are added to ``result``."""
+        # backup results to disk
+        pd.DataFrame([result]).to_csv(self.results_path / METRICS_CSV, index=False)
+        # persist raw scores to disk
+        save_scores(y_scores, self.results_path / RAW_ANOMALY_SCORES_TS, self.scores_format)
+
+        dataset_cache = self.dataset_cache
+        y_true = dataset_cache.load_labels(self.resolved_test_dataset_path)
+        y_true, y_scores = self.scale_scores(y_true, y_scores)
+        # persist scores to disk
+        save_scores(y_scores, self.results_path / ANOMALY_SCORES_TS, self.scores_format)
+
+        with (self.results_path / EXECUTION_LOG).open("a") as logs_file:
+            print(f"Dataset cache: {dataset_cache.info()}", file=logs_file)
+        errors, last_exception = self._calculate_metrics(result, y_true, y_scores, self.metrics)
+
+        # write all results to disk (overwriting backup)
+        pd.DataFrame([result]).to_csv(self.results_path / METRICS_CSV, index=False)
+
+        # potentially update parameter search space
+        self.params.assess(y_true, y_scores)
+
+        # rethrow exception if no metric could be calculated
+        if errors == len(self.metrics) and last_exception is not None:
+            raise last_exception
+
+    def _calculate_metrics(self, result: Dict[str, Any], y_true: np.ndarray, y_scores: np.ndarray,
+                           metrics: List[Metric]) -> Tuple[int, Optional[Exception]]:
+        """Computes the ``metrics`` for the scaled scores and adds them to ``result``; returns the number of failed
+        metrics and the last (non-empty) exception."""
+        with (self.results_path / EXECUTION_LOG).open("a") as logs_file:
+            print(
+                f"Scoring algorithm {self.algorithm.name} with "
+                f"{','.join([m.name for m in metrics])} metrics",
+                file=logs_file,
+            )
+
+            # calculate quality metrics
+            errors = 0
+            last_exception = None
+            suite = MetricSuite(metrics, n_jobs=self.resource_constraints.get_metric_workers())
+            # the labels are validated only once for all metrics
+            for metric, score, e, duration in suite.evaluate(LabelContext(y_true), y_scores):
+                print(f"Calculating {metric.name}", file=logs_file)
+                result[f"{metric.name}_time"] = duration
+                if e is None:
+                    result[metric.name] = score
+                    print(f"  = {score} ({duration:.3f} s)", file=logs_file)
+                    logs_file.flush()
+                else:
+                    print(
+                        f"Exception while computing metric {metric}: {e}",
+                        file=logs_file,
+                    )
+                    errors += 1
+                    if str(e):
+                        last_exception = e
+        return errors, last_exception
+
+    def load_previous_result(self) -> Optional[Dict[str, Any]]:
+        """Loads the result of a previous evaluation of this experiment from its results directory.
+
+        Metrics that are missing in the previous result (e.g. because they were added to the resumed run) are computed
+        from the stored anomaly scores, so that the algorithm does not have to be executed again. Returns ``None`` if
+        the experiment was not evaluated before, or if the previous evaluation did not complete (e.g. it failed or not
+        all metrics can be calculated).
+        """
+        metrics_path = self.results_path / METRICS_CSV
+        params_path = self.results_path / HYPER_PARAMETERS
+        if not metrics_path.exists() or not params_path.exists():
+            return None
+
+        try:
+            result: Dict[str, Any] = pd.read_csv(metrics_path).iloc[0].to_dict()
+        except (pd.errors.EmptyDataError, IndexError):
+            return None
+        if "execute_main_time" not in result:
+            return None
+
+        missing_metrics = [m for m in self.metrics if m.name not in result]
+        if missing_metrics:
+            scores_path = find_scores_file(self.results_path / ANOMALY_SCORES_TS)
+            if scores_path is None:
+                return None
+            try:
+                y_scores = load_scores(scores_path)
+                y_true = self.dataset_cache.load_labels(self.resolved_test_dataset_path)
+            except (OSError, ValueError):
+                return None
+            self._calculate_metrics(result, np.asarray(y_true, dtype=np.int_), y_scores, missing_metrics)
+            if any(m.name not in result for m in missing_metrics):
+                return None
+            pd.DataFrame([result]).to_csv(metrics_path, index=False)
+
+        result["hyper_params"] = params_path.read_text(encoding="utf-8")
+        return result
+
     def _perform_training(self) -> Dict[str, Any]:
         if self.algorithm.training_type == TrainingType.UNSUPERVISED:
             return {}
@@ -177,9 +278,10 @@ class Experiment:
             )
 
         if self.algorithm.data_as_file:
-            X: AlgorithmParameter = self.resolved_train_dataset_path
+            X: AlgorithmParameter = ensure_csv_dataset(self.resolved_train_dataset_path, self.csv_dataset_cache)
         else:
-            X = load_dataset(self.resolved_train_dataset_path).values
+            # copy the data, so that the algorithm cannot alter the cached dataset
+            X = self.dataset_cache.load_dataset(self.resolved_train_dataset_path).to_numpy(copy=True)
 
         with (self.results_path / EXECUTION_LOG).open(
             "a"
@@ -191,18 +293,22 @@ class Experiment:
             times = Times.from_train_algorithm(self.algorithm, X, self.build_args())
         return times.to_dict()
 
-    def _perform_execution(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+    def _load_test_data(self) -> AlgorithmParameter:
         if self.algorithm.data_as_file:
-            X: AlgorithmParameter = self.resolved_test_dataset_path
+            return ensure_csv_dataset(self.resolved_test_dataset_path, self.csv_dataset_cache)
+
+        dataset = self.dataset_cache.load_dataset(self.resolved_test_dataset_path)
+        if dataset.shape[1] >= 3:
+            # copy the data, so that the algorithm cannot alter the cached dataset
+            return np.array(extract_features(dataset))
         else:
-            dataset = load_dataset(self.resolved_test_dataset_path)
-            if dataset.shape[1] >= 3:
-                X = extract_features(dataset)
-            else:
-                raise ValueError(
-                    f"Dataset '{self.resolved_test_dataset_path.name}' has a shape "
-                    f"that was not expected: {dataset.shape}"
-                )
+            raise ValueError(
+                f"Dataset '{self.resolved_test_dataset_path.name}' has a shape "
+                f"that was not expected: {dataset.shape}"
+            )
+
+    def _perform_execution(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        X = self._load_test_data()
 
         with (self.results_path / EXECUTION_LOG).open(
             "a"
@@ -217,6 +323,91 @@ class Experiment:
         return y_scores, times.to_dict()
 
 
+def _batch_size(exp: Experiment) -> int:
+    # only the execution of unsupervised algorithms is batched; the preprocessing could depend on the parameters
+    if exp.algorithm.training_type != TrainingType.UNSUPERVISED or exp.algorithm.preprocess is not None:
+        return 1
+    if exp.heuristics_error is not None:
+        return 1
+    return max(1, exp.algorithm.main.get_batch_size())
+
+
+def batch_experiments(experiments: Iterable[Experiment]) -> Iterator[List[Experiment]]:
+    """Groups consecutive experiments of the same algorithm and dataset (i.e., that differ only in their parameters or
+    repetition) into batches of at most the adapter's batch size (see
+    :func:`~timeeval.adapters.base.Adapter.get_batch_size`). All other experiments form batches of a single
+    experiment. Full batches are emitted immediately without looking ahead in ``experiments``.
+    """
+    batch: List[Experiment] = []
+    for exp in experiments:
+        if batch and (exp.algorithm is not batch[0].algorithm or exp.dataset.datasetId != batch[0].dataset.datasetId
+                      or exp.heuristics_error is not None):
+            yield batch
+            batch = []
+        batch.append(exp)
+        if len(batch) >= _batch_size(batch[0]):
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@dataclass
+class ExperimentBatch:
+    """Experiments of an algorithm on the same dataset that are executed with a single batched algorithm call (see
+    :func:`~timeeval.Algorithm.execute_batch`). The scores, runtimes, and metrics are recorded for each experiment in
+    its own results directory.
+    """
+    experiments: List[Experiment]
+
+    @property
+    def name(self) -> str:
+        return f"batch-{self.experiments[0].name}-{len(self.experiments)}"
+
+    def evaluate(self) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Using TimeEval distributed, this method is executed on the remote node.
+
+        Returns the result or the exception of each experiment (in the same order as ``experiments``).
+        """
+        first = self.experiments[0]
+        algorithm = first.algorithm
+        try:
+            hyper_params = [exp._materialize_params() for exp in self.experiments]
+            for exp in self.experiments:
+                exp._log_start()
+                if exp is not first:
+                    with (exp.results_path / EXECUTION_LOG).open("a") as logs_file:
+                        print(f"Executed in a batch with other experiments, see the execution log of experiment "
+                              f"{first.name} ({first.results_path}) for the algorithm output", file=logs_file)
+
+            X = first._load_test_data()
+            with (first.results_path / EXECUTION_LOG).open("a") as logs_file, redirect_stdout(logs_file):
+                print(f"Performing batched execution of {len(self.experiments)} configurations for "
+                      f"{algorithm.training_type.name} algorithm {algorithm.name}")
+                batch_results = algorithm.execute_batch(X, [exp.build_args() for exp in self.experiments])
+        except Exception as e:
+            for exp in self.experiments:
+                exp.params.fail()
+            return [(None, e)] * len(self.experiments)
+
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = []
+        for exp, params, batch_result in zip(self.experiments, hyper_params, batch_results):
+            try:
+                if batch_result.error is not None:
+                    raise batch_result.error
+                with (exp.results_path / EXECUTION_LOG).open("a") as logs_file, redirect_stdout(logs_file):
+                    y_scores, times = Times.from_batch_result(algorithm, batch_result, exp.build_args())
+                result = times.to_dict()
+                exp._assess(result, y_scores)
+                result["hyper_params"] = params
+                outcomes.append((result, None))
+            except Exception as e:
+                exp.params.fail()
+                outcomes.append((None, e))
+        return outcomes
+
+
 class Experiments:
     def __init__(
         self,
@@ -231,6 +422,7 @@ class Experiments:
         force_training_type_match: bool = False,
         force_dimensionality_match: bool = False,
         experiment_combinations_file: Optional[Path] = None,
+        scores_format: ScoresFormat = ScoresFormat(),
     ):
         self.dmgr = dmgr
         self.datasets = datasets
@@ -239,6 +431,7 @@ class Experiments:
         self.base_result_path = base_result_path
         self.resource_constraints = resource_constraints
         self.metrics = metrics
+        self.scores_format = scores_format
         self.skip_invalid_combinations = (
             skip_invalid_combinations
             or force_training_type_match
@@ -246,77 +439,121 @@ class Experiments:
         )
         self.force_training_type_match = force_training_type_match
         self.force_dimensionality_match = force_dimensionality_match
-        self.experiment_combinations: Optional[pd.DataFrame] = (
-            pd.read_csv(experiment_combinations_file)
+        self.experiment_combinations: Optional[FrozenSet[Tuple[str, str, str, str]]] = (
+            _load_experiment_combinations(experiment_combinations_file)
             if experiment_combinations_file
             else None
         )
-        if self.skip_invalid_combinations or self.experiment_combinations is not None:
-            self._N: Optional[int] = None
-        else:
-            self._N = (
-                sum([len(algo.param_config) for algo in self.algorithms])
-                * len(self.datasets)
-                * self.repetitions
-            )
-        self._experiments: Optional[List[Experiment]] = None
+        self._N: Optional[int] = None
+        self._configs: Optional[List[_ExperimentConfig]] = None
 
     def _should_be_run(
         self, algorithm: Algorithm, dataset: Dataset, params_id: str
     ) -> bool:
         return (
             self.experiment_combinations is None
-            or not self.experiment_combinations[
-                (self.experiment_combinations.algorithm == algorithm.name)
-                & (self.experiment_combinations.collection == dataset.datasetId[0])
-                & (self.experiment_combinations.dataset == dataset.datasetId[1])
-                & (self.experiment_combinations.hyper_params_id == params_id)
-            ].empty
+            or (algorithm.name, dataset.datasetId[0], dataset.datasetId[1], params_id)
+            in self.experiment_combinations
         )
 
-    def materialize_experiments(self) -> Iterator[Experiment]:
+    def _iter_configs(self) -> Iterator[_ExperimentConfig]:
         for algorithm in self.algorithms:
             for dataset in self.datasets:
                 if self._check_compatible(dataset, algorithm):
+                    test_path, train_path = self._resolve_dataset_paths(
+                        dataset, algorithm
+                    )
                     for algorithm_config in algorithm.param_config.iter(
                         algorithm, dataset
                     ):
-                        test_path, train_path = self._resolve_dataset_paths(
-                            dataset, algorithm
-                        )
                         # create parameter hash before executing heuristics
                         # (they replace the parameter values, but we want to be able to
                         # group by original configuration)
                         params_id = algorithm_config.uid()
                         if self._should_be_run(algorithm, dataset, params_id):
-                            params = inject_heuristic_values(
-                                algorithm_config, algorithm, dataset, test_path
+                            yield _ExperimentConfig(
+                                algorithm=algorithm,
+                                dataset=dataset,
+                                params=algorithm_config,
+                                params_id=params_id,
+                                test_path=test_path,
+                                train_path=train_path,
                             )
-                            for repetition in range(1, self.repetitions + 1):
-                                yield Experiment(
-                                    algorithm=algorithm,
-                                    dataset=dataset,
-                                    params=params,
-                                    params_id=params_id,
-                                    repetition=repetition,
-                                    base_results_dir=self.base_result_path,
-                                    resource_constraints=self.resource_constraints,
-                                    metrics=self.metrics,
-                                    resolved_test_dataset_path=test_path,
-                                    resolved_train_dataset_path=train_path,
-                                )
+
+    def _get_configs(self) -> List[_ExperimentConfig]:
+        # the parameter configurations are iterated only once, because they might have side effects (e.g. Optuna)
+        if self._configs is None:
+            self._configs = list(self._iter_configs())
+        return self._configs
+
+    def _inject_heuristics(self, config: _ExperimentConfig) -> Tuple[Params, Optional[Exception]]:
+        if config.injected_params is None:
+            try:
+                params = inject_heuristic_values(
+                    config.params, config.algorithm, config.dataset, config.test_path
+                )
+                config.injected_params = (params, None)
+            except Exception as e:
+                config.injected_params = (config.params, e)
+        return config.injected_params
+
+    def materialize_experiments(self) -> Iterator[Experiment]:
+        """Lazily creates the experiments.
+
+        The parameter heuristics are evaluated just-in-time for each parameter configuration when the corresponding
+        experiments are requested for the first time; repeated iterations reuse their values. If a heuristic fails,
+        the experiments of the configuration fail with its exception when they are evaluated, so that the other
+        experiments of the run are not affected.
+        """
+        # the heuristics load the datasets via the dataset cache of this process
+        DatasetCache.default(self.resource_constraints.get_dataset_cache_size())
+        for config in self._get_configs():
+            params, heuristics_error = self._inject_heuristics(config)
+            for repetition in range(1, self.repetitions + 1):
+                yield Experiment(
+                    algorithm=config.algorithm,
+                    dataset=config.dataset,
+                    params=params,
+                    params_id=config.params_id,
+                    repetition=repetition,
+                    base_results_dir=self.base_result_path,
+                    resource_constraints=self.resource_constraints,
+                    metrics=self.metrics,
+                    resolved_test_dataset_path=config.test_path,
+                    resolved_train_dataset_path=config.train_path,
+                    scores_format=self.scores_format,
+                    heuristics_error=heuristics_error,
+                )
+
+    def results_paths(self) -> Iterator[Path]:
+        """Iterates over the results paths of all experiments without creating the experiments."""
+        for config in self._get_configs():
+            for repetition in range(1, self.repetitions + 1):
+                yield generate_experiment_path(
+                    self.base_result_path,
+                    config.algorithm.name,
+                    config.params_id,
+                    config.dataset.collection_name,
+                    config.dataset.name,
+                    repetition,
+                )
 
     def __iter__(self) -> Iterator[Experiment]:
-        if self._experiments is None:
-            self._experiments = list(self.materialize_experiments())
-        return iter(self._experiments)
+        return self.materialize_experiments()
 
     def __len__(self) -> int:
-        if self._N is None and self._experiments is not None:
-            self._N = len(self._experiments)
-        elif self._N is None:
-            self._experiments = list(self.materialize_experiments())
-            self._N = len(self._experiments)
+        if self._N is None:
+            if self._configs is None and self.experiment_combinations is None:
+                # cheap counting pass: no need to iterate over the parameter configurations
+                n_configs = sum(
+                    len(algorithm.param_config)
+                    for algorithm in self.algorithms
+                    for dataset in self.datasets
+                    if self._check_compatible(dataset, algorithm)
+                )
+            else:
+                n_configs = len(self._get_configs())
+            self._N = n_configs * self.repetitions
         return self._N
 
     def _resolve_dataset_paths(
@@ -9,7 +9,7 @@ from typing import Any, List, Callable, Tuple, Dict
 
 import tqdm
 from dask import config as dask_config
-from dask.distributed import Client, SSHCluster
+from dask.distributed import Client, SSHCluster, wait
 
 from ..remote_configuration import RemoteConfiguration
 from ..resource_constraints import ResourceConstraints
@@ -25,6 +25,7 @@ class Remote:
         self.log.debug(f"Remoting configuration: {self.config}\n"
                        f"with {self.limits.tasks_per_host} tasks per host")
         self.futures: List[Future[Dict[str, Any]]] = []
+        self._pending: List[Future[Dict[str, Any]]] = []
 
         # setup logging of Dask:
         self.log.info("Configuring dask logging")
@@ -68,8 +69,17 @@ class Remote:
         self.log.debug(f"Submitting task {task} to cluster")
         future = self.client.submit(task, *args, pure=False, **kwargs)
         self.futures.append(future)
+        self._pending.append(future)
         return future  # type: ignore
 
+    def wait_for_pending(self, max_pending: int) -> None:
+        """Blocks until less than ``max_pending`` submitted tasks are not yet finished."""
+        self._pending = [f for f in self._pending if not f.done()]
+        while len(self._pending) >= max_pending:
+            self.log.debug(f"{len(self._pending)} tasks pending, waiting for tasks to finish before submitting new ones")
+            wait(self._pending, return_when="FIRST_COMPLETED")
+            self._pending = [f for f in self._pending if not f.done()]
+
     def run_on_scheduler(self, tasks: List[Tuple[Callable, List[Any], Dict[str, Any]]],
                          msg: str = "Executing tasks on scheduler",
                          progress: bool = True) -> None:
@@ -0,0 +1,97 @@
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class ResultsStore:
+    """Append-only store for the result rows of an evaluation run.
+
+    Rows are buffered in a list and the :class:`pandas.DataFrame` is materialized only on request (and cached until the
+    next modification). This keeps the bookkeeping of each experiment in O(1). If a ``stream_path`` is given, each
+    completed row is also appended to this CSV-file as soon as it is recorded. The header of the streamed CSV-file is
+    fixed to the initial ``columns``, so they must contain all keys of the streamed rows except for the
+    ``transient_columns``; streaming a row with an unknown key raises a :class:`ValueError`.
+
+    Parameters
+    ----------
+    columns : List[str]
+        The fixed columns of the result table. Additional keys of the recorded rows are appended as extra columns in
+        the order of their first appearance.
+    stream_path : Optional[Path]
+        Path to a CSV-file where completed rows are streamed to.
+    transient_columns : Sequence[str]
+        Keys of the rows that are only kept in memory and never streamed to disk (e.g. pending futures).
+    """
+
+    def __init__(self, columns: List[str], stream_path: Optional[Path] = None,
+                 transient_columns: Sequence[str] = ()) -> None:
+        self.columns = list(columns)
+        self.stream_path = stream_path
+        self._transient_columns = set(transient_columns)
+        self._extra_columns: Dict[str, None] = {}
+        self._rows: List[Dict[str, Any]] = []
+        self._df: Optional[pd.DataFrame] = None
+        self._header_written = False
+
+    def append(self, row: Dict[str, Any], stream: bool = True) -> None:
+        """Records a new result row; ``stream=False`` skips streaming the row to disk (e.g. if it is incomplete)."""
+        self._rows.append(row)
+        for key in row:
+            if key not in self._extra_columns and key not in self.columns:
+                self._extra_columns[key] = None
+        self._df = None
+        if stream:
+            self.stream(row)
+
+    def stream(self, row: Dict[str, Any]) -> None:
+        """Appends a (previously incomplete) row to the CSV-file at ``stream_path`` if there is one."""
+        if self.stream_path is not None:
+            self._stream(row)
+
+    def drop_column(self, column: str) -> None:
+        if column in self.columns:
+            self.columns.remove(column)
+        self._extra_columns.pop(column, None)
+        for row in self._rows:
+            row.pop(column, None)
+        self._df = None
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterates over the recorded rows; modifications of the rows must be followed by a call to
+        :func:`~timeeval._core.results.ResultsStore.invalidate`."""
+        return iter(self._rows)
+
+    def invalidate(self) -> None:
+        self._df = None
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the recorded rows as a data frame. The data frame is a copy, so modifying it does not change the
+        store."""
+        if self._df is None:
+            df = pd.DataFrame(self._rows, columns=self.columns + list(self._extra_columns))
+            self._df = df.replace(to_replace=[None], value=np.nan)
+        return self._df.copy()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _stream(self, row: Dict[str, Any]) -> None:
+        assert self.stream_path is not None
+        # (re-)create the file with the header on the first write and append afterwards
+        mode = "a" if self._header_written else "w"
+        with self.stream_path.open(mode, newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=self.columns, restval="")
+            if not self._header_written:
+                writer.writeheader()
+                self._header_written = True
+            writer.writerow({k: _format_value(v) for k, v in row.items() if k not in self._transient_columns})
+
+
+def _format_value(value: Any) -> Any:
+    # use the same representation of missing values as pandas.DataFrame.to_csv
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    return value
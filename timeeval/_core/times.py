@@ -6,6 +6,7 @@ from typing import Optional, Dict, Tuple, Any, List
 
 import numpy as np
 
+from ..adapters.base import BatchResult, ResourceUsage
 from ..algorithm import Algorithm
 from ..data_types import AlgorithmParameter, ExecutionType
 
@@ -16,30 +17,45 @@ class Times:
     main: float
     preprocess: Optional[float] = None
     postprocess: Optional[float] = None
+    resource_usage: Optional[ResourceUsage] = None
 
     @staticmethod
     def result_keys() -> List[str]:
-        names = ["train_preprocess_time", "train_main_time",
+        names = ["train_preprocess_time", "train_main_time", "train_postprocess_time",
                  "execute_preprocess_time", "execute_main_time", "execute_postprocess_time"]
         return names
 
     def to_dict(self) -> Dict[str, Any]:
         dd = asdict(self)
         del dd["execution_type"]
-        return {f"{self.execution_type.value}_{k}_time": v for k, v in dd.items()}
+        del dd["resource_usage"]
+        result = {f"{self.execution_type.value}_{k}_time": v for k, v in dd.items()}
+        if self.resource_usage is not None:
+            result.update(self.resource_usage.to_dict(self.execution_type))
+        return result
 
     @staticmethod
     def from_execute_algorithm(algorithm: Algorithm, X: AlgorithmParameter, args: Dict[str, Any]) -> Tuple[np.ndarray, Times]:
         x, pre_time = timer(algorithm.preprocess, X, args) if algorithm.preprocess else (X, np.nan)
-        x, main_time = timer(algorithm.execute, x, args)
+        x, main_time, usage = _timer_with_usage(algorithm.execute, algorithm, x, args)
         x, post_time = timer(algorithm.postprocess, x, args) if algorithm.postprocess else(x, np.nan)
-        return x, Times(ExecutionType.EXECUTE, main_time, preprocess=pre_time, postprocess=post_time)
+        return x, Times(ExecutionType.EXECUTE, main_time, preprocess=pre_time, postprocess=post_time,
+                        resource_usage=usage)
+
+    @staticmethod
+    def from_batch_result(algorithm: Algorithm, result: BatchResult, args: Dict[str, Any]) -> Tuple[np.ndarray, Times]:
+        # the preprocessing is not supported for batches
+        assert result.result is not None, "Failed configurations of a batch have no result to post-process!"
+        x: Any = result.result
+        x, post_time = timer(algorithm.postprocess, x, args) if algorithm.postprocess else (x, np.nan)
+        return x, Times(ExecutionType.EXECUTE, result.duration, preprocess=np.nan, postprocess=post_time,
+                        resource_usage=result.resource_usage)
 
     @staticmethod
     def from_train_algorithm(algorithm: Algorithm, X: AlgorithmParameter, args: Dict[str, Any]) -> Times:
         x, pre_time = timer(algorithm.preprocess, X, args) if algorithm.preprocess else (X, np.nan)
-        x, main_time = timer(algorithm.train, x, args)
-        return Times(ExecutionType.TRAIN, main_time, preprocess=pre_time)
+        x, main_time, usage = _timer_with_usage(algorithm.train, algorithm, x, args)
+        return Times(ExecutionType.TRAIN, main_time, preprocess=pre_time, resource_usage=usage)
 
 
 def timer(fn: Any, X: AlgorithmParameter, args: Dict[str, Any]) -> Tuple[Any, float]:
@@ -48,3 +64,13 @@ def timer(fn: Any, X: AlgorithmParameter, args: Dict[str, Any]) -> Tuple[Any, fl
     end = time.time()
     duration = end - start
     return fn_result, duration
+
+
+def _timer_with_usage(fn: Any, algorithm: Algorithm, X: AlgorithmParameter,
+                      args: Dict[str, Any]) -> Tuple[Any, float, Optional[ResourceUsage]]:
+    try:
+        fn_result, duration = timer(fn, X, args)
+    finally:
+        # the usage of failed runs is discarded, so that it is not attributed to the next run
+        usage = algorithm.main.pop_resource_usage()
+    return fn_result, duration, usage
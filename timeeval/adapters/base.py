@@ -1,9 +1,71 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Any, Dict
+from dataclasses import dataclass, asdict, fields
+from typing import Optional, Callable, Any, Dict, List
 
 from ..data_types import AlgorithmParameter, ExecutionType
 
 
+@dataclass
+class ResourceUsage:
+    """The resource usage of an algorithm run as measured by the adapter, e.g., from the Docker stats of the algorithm
+    container.
+
+    Adapters report the usage of a training or execution run via
+    :func:`~timeeval.adapters.base.Adapter.pop_resource_usage` (or the ``resource_usage`` of a
+    :class:`~timeeval.adapters.base.BatchResult`). TimeEval then adds it to the results next to the runtimes (e.g.,
+    ``execute_peak_memory`` next to ``execute_main_time``).
+
+    The memory usage is given in Bytes, the CPU and throttled times in seconds, the CPU utilization in number of CPUs,
+    and the block I/O in Bytes.
+    """
+    peak_memory: float
+    mean_memory: float
+    cpu_time: float
+    cpu_utilization: float
+    cpu_throttled_time: float
+    block_io_read: float
+    block_io_write: float
+
+    @staticmethod
+    def result_keys() -> List[str]:
+        return [f"{execution_type.value}_{f.name}"
+                for execution_type in [ExecutionType.TRAIN, ExecutionType.EXECUTE]
+                for f in fields(ResourceUsage)]
+
+    def to_dict(self, execution_type: ExecutionType) -> Dict[str, float]:
+        return {f"{execution_type.value}_{k}": v for k, v in asdict(self).items()}
+
+    def merge(self, other: "ResourceUsage") -> "ResourceUsage":
+        """Combines the usage of two consecutive runs, e.g., of the channels processed by the
+        :class:`~timeeval.adapters.multivar.MultivarAdapter`. The means are averaged without weighting them by the
+        runtimes of the runs."""
+        return ResourceUsage(
+            peak_memory=max(self.peak_memory, other.peak_memory),
+            mean_memory=(self.mean_memory + other.mean_memory) / 2,
+            cpu_time=self.cpu_time + other.cpu_time,
+            cpu_utilization=(self.cpu_utilization + other.cpu_utilization) / 2,
+            cpu_throttled_time=self.cpu_throttled_time + other.cpu_throttled_time,
+            block_io_read=self.block_io_read + other.block_io_read,
+            block_io_write=self.block_io_write + other.block_io_write,
+        )
+
+
+@dataclass
+class BatchResult:
+    """The outcome of a single parameter configuration of a batched algorithm execution
+    (see :func:`~timeeval.adapters.base.Adapter.call_batch`).
+
+    Either ``result`` contains the result of the configuration, or ``error`` the exception that prevented it.
+    ``duration`` is the runtime of this configuration in seconds and ``resource_usage`` its resource usage if the
+    adapter measured it.
+    """
+    result: Optional[AlgorithmParameter]
+    duration: float
+    error: Optional[Exception] = None
+    resource_usage: Optional[ResourceUsage] = None
+
+
 class Adapter(ABC):
     """
     The base class for all adapters. An adapter is a wrapper around an anomaly detection algorithm that allows to
@@ -41,8 +103,57 @@ class Adapter(ABC):
             args["executionType"] = ExecutionType.EXECUTE
         return self._call(dataset, args)
 
+    def pop_resource_usage(self) -> Optional[ResourceUsage]:
+        """Returns the resource usage of the runs of the current thread since the last call of this method and resets
+        it. TimeEval calls this method after each training and execution run. Adapters that measure the resource usage
+        of the algorithms override this method; the default implementation returns ``None`` (no measurement).
+        """
+        return None
+
+    def get_batch_size(self) -> int:
+        """Returns the maximum number of parameter configurations that TimeEval passes to
+        :func:`~timeeval.adapters.base.Adapter.call_batch` at once. Adapters that cannot execute multiple
+        configurations more efficiently than one after another return 1 (the default)."""
+        return 1
+
+    def call_batch(self, dataset: AlgorithmParameter, args: List[Dict[str, Any]]) -> List[BatchResult]:
+        """Runs the algorithm with multiple parameter configurations on the same dataset.
+
+        The default implementation runs the configurations one after another. Adapters that support batches
+        (see :func:`~timeeval.adapters.base.Adapter.get_batch_size`) override this method to share the setup
+        costs between the configurations.
+
+        Parameters
+        ----------
+
+        dataset : AlgorithmParameter
+            The dataset to run the algorithm on.
+
+        args : List[Dict[str, Any]]
+            The arguments of each configuration (see :func:`~timeeval.adapters.base.Adapter._call`).
+
+        Returns
+        -------
+        One :class:`~timeeval.adapters.base.BatchResult` per configuration (in the same order). Exceptions of single
+        configurations are not raised, but returned within the results.
+        """
+        results = []
+        for config_args in args:
+            start = time.time()
+            try:
+                result = self(dataset, config_args)
+                results.append(BatchResult(result, time.time() - start, resource_usage=self.pop_resource_usage()))
+            except Exception as e:
+                self.pop_resource_usage()
+                results.append(BatchResult(None, time.time() - start, e))
+        return results
+
     def get_prepare_fn(self) -> Optional[Callable[[], None]]:
-        """This method is executed before all algorithms are run."""
+        """This method is executed before all algorithms are run.
+
+        The prepare steps of all algorithms run concurrently in threads. Equal prepare steps (``==``) are executed only
+        once, so return hashable callables that compare equal if they prepare the same resource.
+        """
         return None
 
     def get_finalize_fn(self) -> Optional[Callable[[], None]]:
@@ -1,30 +1,317 @@
+import atexit
+import codecs
+import csv
 import json
+import math
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import uuid
 from dataclasses import dataclass, asdict, field
 from pathlib import Path, PurePath, PurePosixPath
 from traceback import print_exc
-from typing import Optional, Any, Callable, Tuple, Dict
+from typing import Optional, Any, Callable, Tuple, Dict, List, Iterable, TextIO, BinaryIO
 
 import docker
 import numpy as np
 import requests
+from docker import DockerClient
 from docker.errors import DockerException, ImageNotFound, APIError
 from docker.models.containers import Container
 from durations import Duration
 from numpyencoder import NumpyEncoder
 
-from .base import Adapter, AlgorithmParameter
+from .base import Adapter, AlgorithmParameter, BatchResult, ResourceUsage
 from ..data_types import ExecutionType
 from ..resource_constraints import ResourceConstraints, GB
 
 from ..utils.exceptions import exc_causes
+from ..utils.scores import read_scores_file
 
 DATASET_TARGET_PATH = PurePosixPath("/data")
 RESULTS_TARGET_PATH = PurePosixPath("/results")
 SCORES_FILE_NAME = "docker-algorithm-scores.csv"
+BINARY_SCORES_FILE_NAME = "docker-algorithm-scores.npy"
 MODEL_FILE_NAME = "model.pkl"
+BATCH_TIME_FILE_NAME = "docker-algorithm-time.txt"
+BATCH_EXECUTION_LABEL = "org.timeeval.batch-execution"
+WARM_CONTAINER_ENTRYPOINT = ["tail", "-f", "/dev/null"]
+WARM_CONTAINER_SCRATCH_LABEL = "org.timeeval.scratch-path"
+CONTAINER_LOG_FILE_NAME = "docker-container.log"
+CONTAINER_LOG_MAX_BYTES = 10 * 1024 ** 2
+CONTAINER_LOG_BACKUPS = 2
+RESOURCE_USAGE_FILE_NAME = "docker-resource-usage.csv"
+
+_DOCKER_CLIENTS: Dict[Tuple[int, Optional[float]], DockerClient] = {}
+_DOCKER_CLIENTS_LOCK = threading.Lock()
+
+
+def _docker_client(timeout: Optional[float] = None) -> DockerClient:
+    """Returns the Docker client of the current process for the given API timeout (in seconds).
+
+    The client (and its connection pool) is created on first use and reused by all later calls of the same process.
+    Forked processes create their own client because connections cannot be shared between processes.
+    """
+    key = (os.getpid(), timeout)
+    with _DOCKER_CLIENTS_LOCK:
+        if key not in _DOCKER_CLIENTS:
+            _DOCKER_CLIENTS[key] = docker.from_env() if timeout is None else docker.from_env(timeout=timeout)
+        return _DOCKER_CLIENTS[key]
+
+
+def _clear_docker_clients() -> None:
+    with _DOCKER_CLIENTS_LOCK:
+        _DOCKER_CLIENTS.clear()
+
+
+@dataclass
+class _WarmContainer:
+    container: Container
+    entrypoint: List[str]
+    scratch_path: Path
+
+
+# (image, tag, dataset folder, resource limits, environment)
+_WarmContainerKey = Tuple[str, str, str, Tuple[int, float], Tuple[Tuple[str, str], ...]]
+
+# idle warm containers of the current process
+_WARM_CONTAINERS: Dict[_WarmContainerKey, List[_WarmContainer]] = {}
+_WARM_CONTAINERS_LOCK = threading.Lock()
+
+
+def _remove_warm_container(warm: _WarmContainer) -> None:
+    try:
+        warm.container.remove(force=True, v=True)
+    except DockerException:
+        # the container might already be gone, e.g., because of the finalize step
+        pass
+    shutil.rmtree(warm.scratch_path, ignore_errors=True)
+
+
+def _remove_warm_containers(image_name: Optional[str] = None) -> None:
+    """Removes the idle warm containers of the current process (only the ones of ``image_name`` if given)."""
+    with _WARM_CONTAINERS_LOCK:
+        keys = [k for k in _WARM_CONTAINERS if image_name is None or k[0] == image_name]
+        removed = [warm for k in keys for warm in _WARM_CONTAINERS.pop(k)]
+    for warm in removed:
+        _remove_warm_container(warm)
+
+
+atexit.register(_remove_warm_containers)
+
+
+@dataclass(frozen=True)
+class _ImagePull:
+    """Prepare step that pulls a Docker image unless the local image already has the registry's digest.
+
+    Instances are equal for the same image and tag, so that TimeEval pulls every image only once even if several
+    algorithms use it.
+    """
+    image: str
+    tag: str
+
+    def __call__(self) -> None:
+        name = f"{self.image}:{self.tag}"
+        client = _docker_client(timeout=Duration("5 minutes").to_seconds())
+        start = time.time()
+        digest = self._registry_digest(client)
+        if digest is not None and digest in self._local_digests(client):
+            print(f"Image '{name}' is up-to-date ({digest}), skipping pull")
+            return
+        client.images.pull(self.image, tag=self.tag)
+        print(f"Pulled image '{name}' in {time.time() - start:.2f} seconds")
+
+    def _registry_digest(self, client: DockerClient) -> Optional[str]:
+        try:
+            digest: str = client.images.get_registry_data(f"{self.image}:{self.tag}").id
+            return digest
+        except (APIError, requests.exceptions.RequestException):
+            # the registry is not reachable or the image is local-only; let the pull decide
+            return None
+
+    def _local_digests(self, client: DockerClient) -> List[str]:
+        try:
+            repo_digests = client.images.get(f"{self.image}:{self.tag}").attrs.get("RepoDigests") or []
+        except ImageNotFound:
+            return []
+        # entries have the form <repository>@<digest>
+        return [d.rsplit("@", 1)[-1] for d in repo_digests]
+
+
+class _LogPump(threading.Thread):
+    """Background thread that writes the output of a container incrementally to the execution log.
+
+    The first ``max_bytes`` of the output are written to ``target`` (the standard output, which TimeEval redirects to the
+    execution log of the experiment). The remaining output is written to ``overflow_path``, which is rotated whenever
+    it reaches ``max_bytes`` keeping ``backups`` old files (``<overflow_path>.1``, ...). This keeps the beginning and
+    the end of the output of chatty algorithms with bounded disk and memory usage.
+    """
+    def __init__(self, stream: Iterable[bytes], target: TextIO, overflow_path: Path,
+                 max_bytes: int = CONTAINER_LOG_MAX_BYTES, backups: int = CONTAINER_LOG_BACKUPS) -> None:
+        super().__init__(daemon=True)
+        self._stream = stream
+        self._target = target
+        self._overflow_path = overflow_path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._written = 0
+        self._overflow: Optional[BinaryIO] = None
+        self._overflow_written = 0
+
+    def run(self) -> None:
+        try:
+            for chunk in self._stream:
+                self._write(chunk)
+        except (DockerException, requests.exceptions.RequestException) as e:
+            self._target.write(f"\nStreaming the container output failed: {e}\n")
+        finally:
+            self._target.write(self._decoder.decode(b"", final=True))
+            self._target.flush()
+            if self._overflow is not None:
+                self._overflow.close()
+
+    def _write(self, chunk: bytes) -> None:
+        if self._written < self._max_bytes:
+            head = chunk[:self._max_bytes - self._written]
+            self._written += len(head)
+            self._target.write(self._decoder.decode(head))
+            chunk = chunk[len(head):]
+            if chunk:
+                self._target.write(self._decoder.decode(b"", final=True))
+                self._target.write(f"\n[container output exceeds {self._max_bytes} bytes, see "
+                                   f"{self._overflow_path.name} for the remaining output]\n")
+            self._target.flush()
+        while chunk:
+            if self._overflow is None or self._overflow_written >= self._max_bytes:
+                self._rotate()
+            assert self._overflow is not None
+            part = chunk[:self._max_bytes - self._overflow_written]
+            self._overflow.write(part)
+            self._overflow.flush()
+            self._overflow_written += len(part)
+            chunk = chunk[len(part):]
+
+    def _rotate(self) -> None:
+        # the overflow file of a previous run into the same results folder (e.g., training) is rotated as well
+        if self._overflow is not None or self._overflow_path.exists():
+            if self._overflow is not None:
+                self._overflow.close()
+            for i in range(self._backups - 1, 0, -1):
+                backup = self._overflow_path.with_name(f"{self._overflow_path.name}.{i}")
+                if backup.exists():
+                    backup.replace(self._overflow_path.with_name(f"{self._overflow_path.name}.{i + 1}"))
+            if self._backups > 0 and self._overflow_path.exists():
+                self._overflow_path.replace(self._overflow_path.with_name(f"{self._overflow_path.name}.1"))
+        self._overflow_path.parent.mkdir(parents=True, exist_ok=True)
+        self._overflow = self._overflow_path.open("wb")
+        self._overflow_written = 0
+
+
+def _memory_usage(stats: Dict[str, Any]) -> Optional[float]:
+    memory = stats.get("memory_stats") or {}
+    if "usage" not in memory:
+        # the container is not running
+        return None
+    details = memory.get("stats") or {}
+    # like `docker stats`, we do not count the reclaimable page cache (cgroup v2 and v1 names)
+    cache = details.get("inactive_file", details.get("total_inactive_file", 0))
+    return float(max(memory["usage"] - cache, 0))
+
+
+def _block_io(stats: Dict[str, Any], operation: str) -> float:
+    entries = (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []
+    return float(sum(e.get("value", 0) for e in entries if str(e.get("op", "")).lower() == operation))
+
+
+class _ResourceMonitor(threading.Thread):
+    """Background thread that samples the resource usage of a container from the Docker stats API.
+
+    Docker streams the container stats about every second; we record a sample every ``interval`` seconds and, if
+    ``series_path`` is given, append it to this CSV file (without keeping the samples in memory). The CPU time, the
+    throttled time, and the block I/O are cumulative counters of the container.
+    """
+    def __init__(self, container: Container, interval: float, since: float, execution_type: str,
+                 series_path: Optional[Path] = None) -> None:
+        super().__init__(daemon=True)
+        self._container = container
+        self._interval = interval
+        self._since = since
+        self._execution_type = execution_type
+        self._series_path = series_path
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._n_samples = 0
+        self._peak_memory = 0.
+        self._memory_sum = 0.
+        self._last: Optional[Dict[str, float]] = None
+
+    def run(self) -> None:
+        series: Optional[TextIO] = None
+        last_sample = -math.inf
+        try:
+            if self._series_path is not None:
+                new_file = not self._series_path.exists()
+                self._series_path.parent.mkdir(parents=True, exist_ok=True)
+                series = self._series_path.open("a", newline="")
+                writer = csv.writer(series)
+                if new_file:
+                    writer.writerow(["execution_type", "time", "memory", "cpu_time", "cpu_throttled_time",
+                                     "block_io_read", "block_io_write"])
+            for stats in self._container.stats(stream=True, decode=True):
+                now = time.time()
+                if self._stopped.is_set():
+                    break
+                memory = _memory_usage(stats)
+                if memory is None or now - last_sample < self._interval:
+                    continue
+                last_sample = now
+                cpu_stats = stats.get("cpu_stats") or {}
+                sample = {
+                    "time": now - self._since,
+                    "memory": memory,
+                    "cpu_time": (cpu_stats.get("cpu_usage") or {}).get("total_usage", 0) / 1e9,
+                    "cpu_throttled_time": (cpu_stats.get("throttling_data") or {}).get("throttled_time", 0) / 1e9,
+                    "block_io_read": _block_io(stats, "read"),
+                    "block_io_write": _block_io(stats, "write"),
+                }
+                with self._lock:
+                    self._n_samples += 1
+                    self._peak_memory = max(self._peak_memory, memory)
+                    self._memory_sum += memory
+                    self._last = sample
+                if series is not None:
+                    writer.writerow([self._execution_type] + list(sample.values()))
+                    series.flush()
+        except (DockerException, requests.exceptions.RequestException) as e:
+            print(f"Measuring the resource usage of the container failed: {e}")
+        finally:
+            if series is not None:
+                series.close()
+
+    def stop(self) -> Optional[ResourceUsage]:
+        """Stops the sampling and returns the resource usage (``None`` if the container ended before the first
+        sample)."""
+        self._stopped.set()
+        # Docker sends the stats every second; do not wait for unresponsive daemons
+        self.join(timeout=5.)
+        with self._lock:
+            if self._last is None:
+                return None
+            last = self._last
+            return ResourceUsage(
+                peak_memory=self._peak_memory,
+                mean_memory=self._memory_sum / self._n_samples,
+                cpu_time=last["cpu_time"],
+                cpu_utilization=last["cpu_time"] / last["time"] if last["time"] > 0 else 0.,
+                cpu_throttled_time=last["cpu_throttled_time"],
+                block_io_read=last["block_io_read"],
+                block_io_write=last["block_io_write"],
+            )
 
 
 class DockerJSONEncoder(NumpyEncoder):
@@ -60,10 +347,21 @@ class AlgorithmInterface:
     modelOutput: PurePath
     executionType: ExecutionType
     customParameters: Dict[str, Any] = field(default_factory=dict)
+    binaryOutput: bool = False
+    timeOutput: Optional[PurePath] = None
 
-    def to_json_string(self) -> str:
+    def to_dict(self) -> Dict[str, Any]:
         dictionary = asdict(self)
-        return json.dumps(dictionary, cls=DockerJSONEncoder)
+        if not self.binaryOutput:
+            # only send the flag to algorithms that opted in; older images do not know it
+            del dictionary["binaryOutput"]
+        if self.timeOutput is None:
+            # only used in batch executions
+            del dictionary["timeOutput"]
+        return dictionary
+
+    def to_json_string(self) -> str:
+        return json.dumps(self.to_dict(), cls=DockerJSONEncoder)
 
 
 class DockerAdapter(Adapter):
@@ -84,7 +382,8 @@ class DockerAdapter(Adapter):
         The group privileges to use for the Docker container. Defaults to "akita".
 
     skip_pull : bool
-        Whether to skip pulling the Docker image. Defaults to False.
+        Whether to skip pulling the Docker image in TimeEval's PREPARE phase. The image is not pulled either if the
+        local image already has the digest of the image in the registry. Defaults to False.
 
     timeout : Optional[Duration]
         The timeout for the Docker container. If not set, the timeout is taken from the :class:`~timeeval.resource_contraints.ResourceConstraints`.
@@ -94,10 +393,40 @@ class DockerAdapter(Adapter):
 
     cpu_limit_overwrite : Optional[float]
         The CPU limit for the Docker container. If not set, the CPU limit is taken from the :class:`~timeeval.resource_contraints.ResourceConstraints`.
+
+    binary_scores : bool
+        Whether the algorithm writes its anomaly scores in the binary NumPy format (``.npy``). If set to ``True``,
+        TimeEval asks the algorithm to do so by setting ``binaryOutput`` in the algorithm interface and changes the
+        output file to ``docker-algorithm-scores.npy``. Algorithms that ignore the flag and write text are still
+        supported. Defaults to False.
+
+    warm_container : bool
+        Whether to reuse a long-lived container for successive runs of this algorithm instead of starting a fresh
+        container for every training and execution call. This removes the container start-up overhead, which
+        dominates the runtime of fast algorithms on small datasets. Each worker process keeps one idle container per
+        image, tag, dataset folder, and resource limits, and runs the algorithm in it using ``docker exec``. The
+        dataset folder is mounted read-only as usual. The results are written to a scratch folder that is shared with
+        the container and moved to the experiment's results folder afterward. Defaults to False.
+
+        .. warning::
+            Warm containers provide weaker isolation than fresh containers: Successive runs share the container's
+            file system (e.g., temporary files and caches), its process namespace, and its memory and CPU limits.
+            Only use this option for algorithms that do not depend on a pristine container. If a run times out, the
+            whole container is removed and the next run starts a fresh one.
+
+    batch_size : int
+        The maximum number of parameter configurations that are executed in a single container. TimeEval groups
+        consecutive experiments of an unsupervised algorithm on the same dataset (e.g., of a parameter grid search) into
+        batches of this size. Images advertise that they support batches with the label
+        ``org.timeeval.batch-execution=true``; they get a list of algorithm configurations (see
+        :doc:`the algorithm interface </concepts/algorithms>`) and loop over them internally, so that the container
+        start-up and the interpreter and library loading is paid only once per batch. The configurations of images
+        without the label are executed one after another in separate containers. Defaults to 1 (no batches).
     """
     def __init__(self, image_name: str, tag: str = "latest", group_privileges: str = "akita", skip_pull: bool = False,
                  timeout: Optional[Duration] = None, memory_limit_overwrite: Optional[int] = None,
-                 cpu_limit_overwrite: Optional[float] = None) -> None:
+                 cpu_limit_overwrite: Optional[float] = None, binary_scores: bool = False,
+                 warm_container: bool = False, batch_size: int = 1) -> None:
         self.image_name = image_name
         self.tag = tag
         self.group = group_privileges
@@ -105,6 +434,14 @@ class DockerAdapter(Adapter):
         self.timeout = timeout
         self.memory_limit = memory_limit_overwrite
         self.cpu_limit = cpu_limit_overwrite
+        self.binary_scores = binary_scores
+        self.warm_container = warm_container
+        self.batch_size = batch_size
+        self._resource_usage: Dict[int, ResourceUsage] = {}
+
+    @property
+    def _scores_file_name(self) -> str:
+        return BINARY_SCORES_FILE_NAME if self.binary_scores else SCORES_FILE_NAME
 
     @staticmethod
     def _get_gid(group: str) -> str:
@@ -173,20 +510,20 @@ class DockerAdapter(Adapter):
             path = path.resolve()
         return path
 
-    def _run_container(self, dataset_path: Path, args: Dict[str, Any]) -> Container:
-        client = docker.from_env()
-
-        algorithm_interface = AlgorithmInterface(
+    def _algorithm_interface(self, dataset_path: Path, args: Dict[str, Any],
+                             results_path: PurePosixPath = RESULTS_TARGET_PATH) -> AlgorithmInterface:
+        return AlgorithmInterface(
             dataInput=DATASET_TARGET_PATH / dataset_path.name,
-            dataOutput=RESULTS_TARGET_PATH / SCORES_FILE_NAME,
-            modelInput=RESULTS_TARGET_PATH / MODEL_FILE_NAME,
-            modelOutput=RESULTS_TARGET_PATH / MODEL_FILE_NAME,
+            dataOutput=results_path / self._scores_file_name,
+            modelInput=results_path / MODEL_FILE_NAME,
+            modelOutput=results_path / MODEL_FILE_NAME,
             executionType=args.get("executionType", ExecutionType.EXECUTE.value),
             customParameters=args.get("hyper_params", {}),
+            binaryOutput=self.binary_scores,
         )
-        env_vars = self._prepare_env()
-        print(f"Running container '{self.image_name}:{self.tag}' with env='{repr(env_vars)}' in {algorithm_interface.executionType} mode.")
 
+    def _start_container(self, client: DockerClient, command: Optional[str], volumes: Dict[str, Dict[str, str]],
+                         env_vars: Dict[str, str], args: Dict[str, Any], **kwargs: Any) -> Container:
         memory_limit, cpu_limit = self._get_compute_limits(args)
         cpu_shares = int(cpu_limit * 1e9)
         print(f"Restricting container to {cpu_limit} CPUs and {memory_limit / GB:.3f} GB RAM")
@@ -194,17 +531,15 @@ class DockerAdapter(Adapter):
         try:
             return client.containers.run(
                 f"{self.image_name}:{self.tag}",
-                f"execute-algorithm '{algorithm_interface.to_json_string()}'",
-                volumes={
-                    str(dataset_path.parent.resolve()): {"bind": str(DATASET_TARGET_PATH), "mode": "ro"},
-                    str(self._results_path(args, absolute=True)): {"bind": str(RESULTS_TARGET_PATH), "mode": "rw"}
-                },
+                command,
+                volumes=volumes,
                 environment=env_vars,
                 mem_swappiness=0,
                 mem_limit=memory_limit,
                 memswap_limit=memory_limit,
                 nano_cpus=cpu_shares,
                 detach=True,
+                **kwargs
             )
         except (APIError, ImageNotFound) as e:
             reason = str(e)
@@ -219,94 +554,399 @@ class DockerAdapter(Adapter):
                 f"Could not start Docker container for algorithm {self.image_name}:{self.tag} because {reason}!"
             ) from None  # hides exception chain for driver process
 
-    def _run_until_timeout(self, container: Container, args: Dict[str, Any]) -> None:
+    def _run_container(self, dataset_path: Path, args: Dict[str, Any]) -> Container:
+        client = _docker_client()
+
+        algorithm_interface = self._algorithm_interface(dataset_path, args)
+        env_vars = self._prepare_env()
+        print(f"Running container '{self.image_name}:{self.tag}' with env='{repr(env_vars)}' in {algorithm_interface.executionType} mode.")
+
+        return self._start_container(
+            client,
+            f"execute-algorithm '{algorithm_interface.to_json_string()}'",
+            volumes={
+                str(dataset_path.parent.resolve()): {"bind": str(DATASET_TARGET_PATH), "mode": "ro"},
+                str(self._results_path(args, absolute=True)): {"bind": str(RESULTS_TARGET_PATH), "mode": "rw"}
+            },
+            env_vars=env_vars,
+            args=args,
+        )
+
+    def _acquire_warm_container(self, dataset_path: Path, args: Dict[str, Any],
+                                env_vars: Dict[str, str]) -> Tuple[_WarmContainerKey, _WarmContainer]:
+        dataset_folder = str(dataset_path.parent.resolve())
+        key: _WarmContainerKey = (self.image_name, self.tag, dataset_folder, self._get_compute_limits(args),
+                                  tuple(sorted(env_vars.items())))
+        while True:
+            with _WARM_CONTAINERS_LOCK:
+                idle = _WARM_CONTAINERS.get(key)
+                warm = idle.pop() if idle else None
+            if warm is None:
+                break
+            # the container might have been removed in the meantime, e.g., by the finalize step of a previous run
+            # (the worker processes outlive a run)
+            try:
+                warm.container.reload()
+                if warm.container.status == "running":
+                    return key, warm
+            except DockerException:
+                pass
+            _remove_warm_container(warm)
+
+        client = _docker_client()
+        print(f"Starting warm container '{self.image_name}:{self.tag}' with env='{repr(env_vars)}'.")
+        scratch_path = Path(tempfile.mkdtemp(prefix="timeeval-warm-"))
+        try:
+            entrypoint: List[str] = client.images.get(f"{self.image_name}:{self.tag}").attrs["Config"]["Entrypoint"] or []
+            container = self._start_container(
+                client,
+                None,
+                volumes={
+                    dataset_folder: {"bind": str(DATASET_TARGET_PATH), "mode": "ro"},
+                    str(scratch_path): {"bind": str(RESULTS_TARGET_PATH), "mode": "rw"}
+                },
+                env_vars=env_vars,
+                args=args,
+                entrypoint=WARM_CONTAINER_ENTRYPOINT,
+                # allows the finalize step to clean up the scratch folders of all processes
+                labels={WARM_CONTAINER_SCRATCH_LABEL: str(scratch_path)},
+            )
+        except BaseException:
+            shutil.rmtree(scratch_path, ignore_errors=True)
+            raise
+        return key, _WarmContainer(container, entrypoint, scratch_path)
+
+    @staticmethod
+    def _release_warm_container(key: _WarmContainerKey, warm: _WarmContainer) -> None:
+        with _WARM_CONTAINERS_LOCK:
+            _WARM_CONTAINERS.setdefault(key, []).append(warm)
+
+    def _exec_in_warm_container(self, dataset_path: Path, args: Dict[str, Any]) -> None:
+        client = _docker_client()
+        env_vars = self._prepare_env()
+        key, warm = self._acquire_warm_container(dataset_path, args, env_vars)
+
+        # each run gets its own folder in the shared scratch volume
+        run_path = warm.scratch_path / uuid.uuid4().hex
+        run_path.mkdir()
+        results_path = self._results_path(args)
+        if (results_path / MODEL_FILE_NAME).is_file():
+            shutil.copy2(results_path / MODEL_FILE_NAME, run_path / MODEL_FILE_NAME)
+        algorithm_interface = self._algorithm_interface(dataset_path, args, RESULTS_TARGET_PATH / run_path.name)
+        print(f"Running in warm container '{self.image_name}:{self.tag}' in {algorithm_interface.executionType} mode.")
+
         timeout = self._get_timeout(args)
+        logs: Optional[_LogPump] = None
+        print("\n#### Docker container logs ####")
         try:
-            result = container.wait(timeout=timeout.to_seconds())
-        except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError) as e:
-            if "timed out" in str(e):
-                if self._should_use_prelim_results(args):
-                    # check whether results file is stored
-                    if (self._results_path(args) / SCORES_FILE_NAME).is_file():
-                        print(f"Container timeout after {timeout}, but TimeEval disregards this because "
-                              f"'ResourceConstraints.preliminary_results_on_timeout' is set to True."
-                              f"\nWill be using preliminary results for evaluation.")
-                        result = {"StatusCode": 0}
-                    else:
-                        print(f"Container timeout after {timeout} and "
-                              f"'ResourceConstraints.preliminary_results_on_timeout' is set to True. However, the "
-                              f"algorithm did not store a preliminary result; raising DockerTimeoutError anyway!")
-                        raise DockerTimeoutError(f"{self.image_name} could not create results after {timeout}") from e
-                elif self._should_use_prelim_model(args):
-                    # check if model was stored
-                    if (self._results_path(args) / MODEL_FILE_NAME).is_file():
-                        print(f"Container timeout after {timeout}, but TimeEval disregards this because "
-                              "'ResourceConstraints.use_preliminary_model_on_train_timeout' is set to True.")
-                        result = {"StatusCode": 0}
-                    else:
-                        print(f"Container timeout after {timeout} and 'ResourceConstraints.use_preliminary_model_on_train_timeout' is "
-                              "set to True. However, the algorithm did not store a model; "
-                              "raising DockerTimeoutError anyway!")
-                        raise DockerTimeoutError(f"{self.image_name} could not build a model within {timeout}") from e
-                else:
-                    print(f"Container timeout after {timeout}, raising DockerTimeoutError!")
-                    raise DockerTimeoutError(f"{self.image_name} timed out after {timeout}") from e
-            else:
-                print(f"Waiting for container failed with error: {e}")
-                raise e
+            exec_id = client.api.exec_create(
+                warm.container.id,
+                warm.entrypoint + ["execute-algorithm", algorithm_interface.to_json_string()],
+                environment=env_vars,
+            )["Id"]
+            # the exec API has no timeout, so we consume the output in the background and wait for its end
+            logs = _LogPump(client.api.exec_start(exec_id, stream=True), sys.stdout,
+                            results_path / CONTAINER_LOG_FILE_NAME)
+            logs.start()
+            logs.join(timeout=timeout.to_seconds())
         finally:
-            print("\n#### Docker container logs ####")
-            print(container.logs().decode("utf-8"))
+            finished = logs is not None and not logs.is_alive()
+            if not finished:
+                # a single exec'd process cannot be stopped using the API, so we have to kill the whole container
+                try:
+                    warm.container.kill()
+                except DockerException:
+                    pass
+                if logs is not None:
+                    logs.join()
             print("###############################\n")
-            container.stop()
+            results_path.mkdir(parents=True, exist_ok=True)
+            for file in run_path.iterdir():
+                shutil.move(str(file), str(results_path / file.name))
+            shutil.rmtree(run_path, ignore_errors=True)
+            if not finished:
+                _remove_warm_container(warm)
+
+        if not finished:
+            result = self._handle_timeout(timeout, args)
+        else:
+            result = {"StatusCode": client.api.exec_inspect(exec_id)["ExitCode"]}
+            self._release_warm_container(key, warm)
+        self._check_status(result["StatusCode"], args)
+
+    def _handle_timeout(self, timeout: Duration, args: Dict[str, Any],
+                        cause: Optional[BaseException] = None) -> Dict[str, Any]:
+        if self._should_use_prelim_results(args):
+            # check whether results file is stored
+            if (self._results_path(args) / self._scores_file_name).is_file():
+                print(f"Container timeout after {timeout}, but TimeEval disregards this because "
+                      f"'ResourceConstraints.preliminary_results_on_timeout' is set to True."
+                      f"\nWill be using preliminary results for evaluation.")
+                return {"StatusCode": 0}
+            else:
+                print(f"Container timeout after {timeout} and "
+                      f"'ResourceConstraints.preliminary_results_on_timeout' is set to True. However, the "
+                      f"algorithm did not store a preliminary result; raising DockerTimeoutError anyway!")
+                raise DockerTimeoutError(f"{self.image_name} could not create results after {timeout}") from cause
+        elif self._should_use_prelim_model(args):
+            # check if model was stored
+            if (self._results_path(args) / MODEL_FILE_NAME).is_file():
+                print(f"Container timeout after {timeout}, but TimeEval disregards this because "
+                      "'ResourceConstraints.use_preliminary_model_on_train_timeout' is set to True.")
+                return {"StatusCode": 0}
+            else:
+                print(f"Container timeout after {timeout} and 'ResourceConstraints.use_preliminary_model_on_train_timeout' is "
+                      "set to True. However, the algorithm did not store a model; "
+                      "raising DockerTimeoutError anyway!")
+                raise DockerTimeoutError(f"{self.image_name} could not build a model within {timeout}") from cause
+        else:
+            print(f"Container timeout after {timeout}, raising DockerTimeoutError!")
+            raise DockerTimeoutError(f"{self.image_name} timed out after {timeout}") from cause
 
-        if result["StatusCode"] == 137:
-            print(f"Docker algorithm ran out of memory (status {result['StatusCode']})!")
+    def _check_status(self, status_code: int, args: Dict[str, Any], oom_killed: bool = False) -> None:
+        if status_code == 137 or (oom_killed and status_code != 0):
+            print(f"Docker algorithm ran out of memory (status {status_code})!")
             raise DockerMemoryError(f"Docker algorithm exceeded memory limit of {self._get_compute_limits(args)[0]} Bytes!")
 
-        elif result["StatusCode"] != 0:
-            print(f"Docker algorithm failed with status code '{result['StatusCode']}', consider container logs above.")
-            raise DockerAlgorithmFailedError(f"Status '{result['StatusCode']}', please consider log files in {self._results_path(args, absolute=True)}!")
+        elif status_code != 0:
+            print(f"Docker algorithm failed with status code '{status_code}', consider container logs above.")
+            raise DockerAlgorithmFailedError(f"Status '{status_code}', please consider log files in {self._results_path(args, absolute=True)}!")
+
+    @staticmethod
+    def _wait_for_exit(container: Container, since: float, timeout: float) -> Optional[Dict[str, Any]]:
+        """Waits for the container to exit and returns its status, or ``None`` if it still runs after ``timeout``
+        seconds (counted from ``since``).
+
+        The exit (``die``) and OOM events of the container are received from the Docker events API, which also reports
+        the exact end time. Events since the container start are replayed, so that we cannot miss an early exit.
+        """
+        try:
+            events = _docker_client().events(
+                since=int(since),
+                until=int(math.ceil(since + timeout)),
+                filters={"type": "container", "container": container.id, "event": ["oom", "die"]},
+                decode=True,
+            )
+        except (APIError, requests.exceptions.RequestException) as e:
+            print(f"Docker events are not available ({e}), waiting for the container instead.")
+            return DockerAdapter._wait(container, timeout - (time.time() - since))
+
+        oom_killed = False
+        try:
+            for event in events:
+                action = event.get("Action", event.get("status"))
+                if action == "oom":
+                    oom_killed = True
+                elif action == "die":
+                    attributes = event.get("Actor", {}).get("Attributes", {})
+                    end = event["timeNano"] / 1e9 if "timeNano" in event else time.time()
+                    print(f"Container exited after {end - since:.3f} seconds.")
+                    return {"StatusCode": int(attributes.get("exitCode", -1)), "OOMKilled": oom_killed}
+        finally:
+            events.close()
+        return None
+
+    @staticmethod
+    def _wait(container: Container, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            result: Dict[str, Any] = container.wait(timeout=max(timeout, 0))
+            return result
+        except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError) as e:
+            if "timed out" in str(e):
+                return None
+            print(f"Waiting for container failed with error: {e}")
+            raise e
+
+    def _start_resource_monitor(self, container: Container, args: Dict[str, Any],
+                                since: float) -> Optional[_ResourceMonitor]:
+        constraints = args.get("resource_constraints", ResourceConstraints())
+        if constraints.resource_usage_interval is None:
+            return None
+        exec_type = args.get("executionType", ExecutionType.EXECUTE)
+        monitor = _ResourceMonitor(
+            container,
+            interval=constraints.resource_usage_interval.to_seconds(),
+            since=since,
+            execution_type=exec_type.value if isinstance(exec_type, ExecutionType) else str(exec_type),
+            series_path=self._results_path(args) / RESOURCE_USAGE_FILE_NAME if constraints.resource_usage_series else None,
+        )
+        monitor.start()
+        return monitor
+
+    def _report_resource_usage(self, usage: ResourceUsage) -> None:
+        # the runs of different threads are measured separately
+        thread_id = threading.get_ident()
+        previous = self._resource_usage.get(thread_id)
+        # multiple runs until the usage is popped, e.g., for the channels of the MultivarAdapter, are combined
+        self._resource_usage[thread_id] = usage if previous is None else previous.merge(usage)
+
+    def _run_until_timeout(self, container: Container, args: Dict[str, Any], since: float) -> None:
+        timeout = self._get_timeout(args)
+        monitor = self._start_resource_monitor(container, args, since)
+        print("\n#### Docker container logs ####")
+        logs = _LogPump(container.logs(stream=True, follow=True), sys.stdout,
+                        self._results_path(args) / CONTAINER_LOG_FILE_NAME)
+        logs.start()
+        try:
+            result = self._wait_for_exit(container, since, timeout.to_seconds())
+        finally:
+            usage = monitor.stop() if monitor is not None else None
+            container.stop()
+            logs.join()
+            print("###############################\n")
+        if usage is not None:
+            self._report_resource_usage(usage)
+
+        if result is None:
+            result = self._handle_timeout(timeout, args)
+        self._check_status(result["StatusCode"], args, oom_killed=result.get("OOMKilled", False))
 
     def _read_results(self, args: Dict[str, Any]) -> np.ndarray:
-        results: np.ndarray = np.genfromtxt(self._results_path(args) / SCORES_FILE_NAME, delimiter=",")
+        return read_scores_file(self._results_path(args) / self._scores_file_name)
+
+    def _supports_batches(self) -> bool:
+        labels = _docker_client().images.get(f"{self.image_name}:{self.tag}").attrs["Config"].get("Labels") or {}
+        return str(labels.get(BATCH_EXECUTION_LABEL, "false")).lower() == "true"
+
+    def _run_batch(self, dataset_path: Path, args: List[Dict[str, Any]]) -> List[BatchResult]:
+        interfaces = []
+        volumes = {str(dataset_path.parent.resolve()): {"bind": str(DATASET_TARGET_PATH), "mode": "ro"}}
+        for i, config_args in enumerate(args):
+            # each configuration writes to its own results folder, which is mounted to /results/<i>
+            results_path = self._results_path(config_args, absolute=True)
+            results_path.mkdir(parents=True, exist_ok=True)
+            # outputs of previous runs would mark the configuration as complete
+            for file_name in [BATCH_TIME_FILE_NAME, self._scores_file_name]:
+                if (results_path / file_name).exists():
+                    (results_path / file_name).unlink()
+            volumes[str(results_path)] = {"bind": str(RESULTS_TARGET_PATH / str(i)), "mode": "rw"}
+            interface = self._algorithm_interface(dataset_path, config_args, RESULTS_TARGET_PATH / str(i))
+            interface.timeOutput = RESULTS_TARGET_PATH / str(i) / BATCH_TIME_FILE_NAME
+            interfaces.append(interface.to_dict())
+
+        env_vars = self._prepare_env()
+        print(f"Running container '{self.image_name}:{self.tag}' with env='{repr(env_vars)}' for a batch of "
+              f"{len(args)} configurations.")
+        # the batch may take as long as its configurations one after another
+        timeout = self._get_timeout(args[0]).to_seconds() * len(args)
+        start = time.time()
+        container = self._start_container(
+            _docker_client(),
+            f"execute-algorithm '{json.dumps({'batch': interfaces}, cls=DockerJSONEncoder)}'",
+            volumes=volumes,
+            env_vars=env_vars,
+            args=args[0],
+        )
+        print("\n#### Docker container logs ####")
+        logs = _LogPump(container.logs(stream=True, follow=True), sys.stdout,
+                        self._results_path(args[0]) / CONTAINER_LOG_FILE_NAME)
+        logs.start()
+        try:
+            result = self._wait_for_exit(container, start, timeout)
+        finally:
+            container.stop()
+            logs.join()
+            print("###############################\n")
+        duration = time.time() - start
+        status: Optional[int] = None
+        oom_killed = False
+        if result is None:
+            print(f"Container timeout after {timeout} seconds!")
+        else:
+            status = result["StatusCode"]
+            oom_killed = result.get("OOMKilled", False)
+
+        results = []
+        for config_args in args:
+            results_path = self._results_path(config_args)
+            time_file = results_path / BATCH_TIME_FILE_NAME
+            has_scores = (results_path / self._scores_file_name).is_file()
+            # the configurations write their runtime after their scores; it marks them as complete
+            if time_file.is_file() or (status == 0 and has_scores):
+                results.append(BatchResult(self._read_results(config_args),
+                                           self._batch_config_duration(time_file, duration, len(args))))
+                continue
+
+            if status is None and has_scores and self._should_use_prelim_results(config_args):
+                print(f"Container timeout after {timeout} seconds, but TimeEval disregards this for the configuration "
+                      f"in {results_path} because 'ResourceConstraints.use_preliminary_scores_on_execute_timeout' is "
+                      f"set to True.\nWill be using preliminary results for evaluation.")
+                results.append(BatchResult(self._read_results(config_args), duration / len(args)))
+                continue
+
+            error: Exception
+            if status is None:
+                error = DockerTimeoutError(f"{self.image_name} timed out after {timeout} seconds in a batch of "
+                                           f"{len(args)} configurations")
+            elif status == 137 or (oom_killed and status != 0):
+                error = DockerMemoryError(f"Docker algorithm exceeded memory limit of "
+                                          f"{self._get_compute_limits(config_args)[0]} Bytes!")
+            else:
+                error = DockerAlgorithmFailedError(f"Status '{status}', please consider log files in "
+                                                   f"{self._results_path(config_args, absolute=True)}!")
+            results.append(BatchResult(None, np.nan, error))
         return results
 
+    @staticmethod
+    def _batch_config_duration(time_file: Path, duration: float, n_configs: int) -> float:
+        # images that do not report the runtimes get an equal share of the batch runtime
+        if time_file.is_file():
+            try:
+                return float(time_file.read_text().strip())
+            except ValueError:
+                print(f"Could not parse the runtime in {time_file}, using an equal share of the batch runtime instead.")
+        return duration / n_configs
+
     # Adapter overwrites
 
     def _call(self, dataset: AlgorithmParameter, args: Dict[str, Any]) -> AlgorithmParameter:
         assert isinstance(dataset, Path), \
             "Docker adapters cannot handle NumPy arrays! Please put in the path to the dataset."
-        container = self._run_container(dataset, args)
-        self._run_until_timeout(container, args)
+        if self.warm_container:
+            self._exec_in_warm_container(dataset, args)
+        else:
+            since = time.time()
+            container = self._run_container(dataset, args)
+            self._run_until_timeout(container, args, since)
 
         if args.get("executionType", ExecutionType.EXECUTE) == ExecutionType.EXECUTE:
             return self._read_results(args)
         else:
             return dataset
 
-    def get_prepare_fn(self) -> Optional[Callable[[], None]]:
-        if not self.skip_pull:
-            # capture variables for the function closure
-            image: str = self.image_name
-            tag: str = self.tag
+    def pop_resource_usage(self) -> Optional[ResourceUsage]:
+        # warm containers and batches serve multiple runs, so their usage cannot be attributed to a single run
+        return self._resource_usage.pop(threading.get_ident(), None)
 
-            def prepare() -> None:
-                client = docker.from_env(timeout=Duration("5 minutes").to_seconds())
-                client.images.pull(image, tag=tag)
+    def get_batch_size(self) -> int:
+        return self.batch_size
 
-            return prepare
+    def call_batch(self, dataset: AlgorithmParameter, args: List[Dict[str, Any]]) -> List[BatchResult]:
+        assert isinstance(dataset, Path), \
+            "Docker adapters cannot handle NumPy arrays! Please put in the path to the dataset."
+        trains = any(a.get("executionType", ExecutionType.EXECUTE) != ExecutionType.EXECUTE for a in args)
+        if len(args) < 2 or trains or self.warm_container or not self._supports_batches():
+            return super().call_batch(dataset, args)
+        return self._run_batch(dataset, args)
+
+    def get_prepare_fn(self) -> Optional[Callable[[], None]]:
+        if not self.skip_pull:
+            return _ImagePull(self.image_name, self.tag)
         else:
             return None
 
     def get_finalize_fn(self) -> Optional[Callable[[], None]]:
         def finalize() -> None:
-            client = docker.from_env(timeout=Duration("10 minutes").to_seconds())
+            _remove_warm_containers(self.image_name)
+            client = _docker_client(timeout=Duration("10 minutes").to_seconds())
             try:
                 containers = client.containers.list(all=True, filters={"ancestor": self.image_name})
                 for c in containers:
                     # force removal and also remove associated volumes
                     c.remove(force=True, v=True)
+                    scratch_path = (c.labels or {}).get(WARM_CONTAINER_SCRATCH_LABEL)
+                    if scratch_path:
+                        shutil.rmtree(scratch_path, ignore_errors=True)
             except DockerException:
                 # container cleanup is not critical; allow failure
                 pass
@@ -6,8 +6,9 @@ import tempfile
 import numpy as np
 import pandas as pd
 
-from .base import Adapter
+from .base import Adapter, ResourceUsage
 from ..data_types import AlgorithmParameter
+from ..utils.datasets import is_binary_dataset, load_binary_dataset
 
 
 class AggregationMethod(Enum):
@@ -73,7 +74,10 @@ class MultivarAdapter(Adapter):
         """Returns the timeseries as a pandas DataFrame."""
 
         df: Optional[pd.DataFrame] = None
-        if isinstance(dataset, Path):
+        if isinstance(dataset, Path) and is_binary_dataset(dataset):
+            df = load_binary_dataset(dataset)
+            df = df.set_index(df.columns[0])
+        elif isinstance(dataset, Path):
             df = pd.read_csv(dataset, index_col=0)
         elif isinstance(dataset, np.ndarray):
             df = pd.DataFrame(dataset)
@@ -128,6 +132,9 @@ class MultivarAdapter(Adapter):
             assert len(scores) == 1, "Expected only one score file when combining before"
             return scores[0]
 
+    def pop_resource_usage(self) -> Optional[ResourceUsage]:
+        return self._adapter.pop_resource_usage()
+
     def get_prepare_fn(self) -> Optional[Callable[[], None]]:
         return self._adapter.get_prepare_fn()
 
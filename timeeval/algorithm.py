@@ -9,8 +9,8 @@ from .params import ParameterConfig
 
 # only imports the below classes for type checking to avoid circular imports (annotations-import is necessary!)
 if TYPE_CHECKING:
-    from typing import Optional, Callable, Dict, Any
-    from .adapters.base import Adapter
+    from typing import Optional, Callable, Dict, Any, List
+    from .adapters.base import Adapter, BatchResult
     from .data_types import TSFunction, TSFunctionPost, AlgorithmParameter
 
 
@@ -156,6 +156,34 @@ class Algorithm:
         args["executionType"] = ExecutionType.EXECUTE
         return self.main(dataset, args)
 
+    def execute_batch(self, dataset: AlgorithmParameter, args: List[Dict[str, Any]]) -> List[BatchResult]:
+        """Execute this algorithm's test/execute procedure for multiple parameter configurations on the same dataset.
+
+        .. warning::
+            Internal API!
+
+        This method sets the algorithms :class:`~timeeval.data_types.ExecutionType` to ``EXECUTE`` for all
+        configurations and then calls the batch implementation of the adapter (see
+        :func:`~timeeval.adapters.base.Adapter.call_batch`).
+
+        Parameters
+        ----------
+        dataset : timeeval.data_types.AlgorithmParameter
+            Either a numpy-array containing the test time series data or a path to the test time series file.
+        args : List[dict]
+            TimeEval arguments of each configuration (see :func:`~timeeval.Algorithm.execute`).
+
+        Returns
+        -------
+        results : List[timeeval.adapters.base.BatchResult]
+            The results (or exceptions) and runtimes of the configurations in the same order as ``args``.
+
+        :meta private:
+        """
+        for config_args in args:
+            config_args["executionType"] = ExecutionType.EXECUTE
+        return self.main.call_batch(dataset, args)
+
     def prepare_fn(self) -> Optional[Callable[[], None]]:
         """Returns the prepare-step-function of this algorithm.
 
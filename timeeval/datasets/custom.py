@@ -11,6 +11,7 @@ from .custom_base import CustomDatasetsBase
 from .dataset import Dataset
 from .metadata import DatasetId
 from ..data_types import TrainingType, InputDimensionality
+from ..utils.datasets import is_binary_dataset, load_labels_only
 
 
 TRAIN_PATH_KEY = "train_path"
@@ -33,7 +34,10 @@ def _training_type(train_path: Optional[Path]) -> TrainingType:
     if train_path is None:
         return TrainingType.UNSUPERVISED
     else:
-        labels = pd.read_csv(train_path).iloc[:, -1]
+        if is_binary_dataset(train_path):
+            labels = load_labels_only(train_path)
+        else:
+            labels = pd.read_csv(train_path).iloc[:, -1]
         if np.any(labels):
             return TrainingType.SUPERVISED
         else:
@@ -14,6 +14,7 @@ from .custom_noop import NoOpCustomDatasets
 from .dataset import Dataset
 from .metadata import DatasetId, DatasetMetadata
 from ..data_types import TrainingType, InputDimensionality
+from ..utils.datasets import is_binary_dataset, load_binary_dataset
 
 
 class Datasets(abc.ABC):
@@ -358,9 +359,13 @@ class Datasets(abc.ABC):
         Returns
         -------
         df : data frame
-             The training or testing time series as a :class:`pandas.DataFrame`.
+             The training or testing time series as a :class:`pandas.DataFrame`. The columns of datasets in the binary
+             format (see :func:`~timeeval.utils.datasets.save_binary_dataset`) are memory-mapped and read-only.
         """
         path = self.get_dataset_path(dataset_id, train)
+        if is_binary_dataset(path):
+            # binary datasets store the timestamps with their correct data type
+            return load_binary_dataset(path)
         if dataset_id[0] not in self._custom_datasets.get_collection_names():
             if self._get_value_internal(dataset_id, "datetime_index"):
                 return pd.read_csv(path, parse_dates=["timestamp"], infer_datetime_format=True)
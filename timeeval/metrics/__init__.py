@@ -1,5 +1,5 @@
 """
-This module contains all metrics that can be used with TimeEval. The metrics are divided into five different categories:
+This module contains all metrics that can be used with TimeEval. The metrics are divided into six different categories:
 
 - **Classification-metrics:** These metrics are defined over binary classification predictions (zeros or ones), thus
   they require a thresholding strategy to convert anomaly scorings to binary classification results.
@@ -35,11 +35,24 @@ This module contains all metrics that can be used with TimeEval. The metrics are
     - :class:`~timeeval.metrics.PrecisionAtK`
     - :class:`~timeeval.metrics.FScoreAtK`
 
+- **Streaming-metrics:** These metrics process the inputs chunk by chunk with bounded memory, e.g., to evaluate
+  memory-mapped label and score files of very long time series (see :class:`~timeeval.metrics.StreamingMetric`).
+
+    - :class:`~timeeval.metrics.StreamingRocAUC`
+    - :class:`~timeeval.metrics.StreamingPrAUC`
+    - :class:`~timeeval.metrics.StreamingPrecision`
+    - :class:`~timeeval.metrics.StreamingRecall`
+    - :class:`~timeeval.metrics.StreamingF1Score`
+
 All metrics inherit from the abstract base class :class:`~timeeval.metrics.Metric`, and implement the ``__call__``
 method, the ``supports_continuous_scorings`` method, and the ``name`` property. This allows them to be used within
 TimeEval and on their own. You can also implement your own metrics by inheriting from :class:`timeeval.metrics.Metric`
 (see its documentation for more information).
 
+To compute multiple metrics for the same scoring, use a :class:`~timeeval.metrics.MetricSuite`. It validates the
+inputs only once and shares intermediate results, such as the sorted scores, between the metrics. To compute a metric
+for many scorings of the same time series, use :func:`~timeeval.metrics.Metric.score_many`.
+
 Examples
 --------
 
@@ -86,6 +99,9 @@ from .classification_metrics import Precision, Recall, F1Score
 from .metric import Metric
 from .other_metrics import AveragePrecision, PrecisionAtK, FScoreAtK
 from .range_metrics import RangePrecisionRangeRecallAUC, RangePrecision, RangeRecall, RangeFScore
+from .streaming import (StreamingMetric, StreamingRocAUC, StreamingPrAUC, StreamingPrecision, StreamingRecall,
+                        StreamingF1Score)
+from .suite import MetricSuite, MetricContext, MetricResult, LabelContext
 from .vus_metrics import RangePrAUC, RangeRocAUC, RangePrVUS, RangeRocVUS
 
 
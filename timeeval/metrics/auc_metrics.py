@@ -1,11 +1,84 @@
 from abc import ABC
-from typing import Iterable, Callable, Any
+from typing import Iterable, Callable, Any, NamedTuple, Optional, TYPE_CHECKING
+
+import warnings
 
 import numpy as np
+from scipy.stats import rankdata
 from sklearn.metrics import auc, roc_curve, precision_recall_curve
 
 from .metric import Metric
 
+if TYPE_CHECKING:
+    from .suite import LabelContext, MetricContext
+
+
+_BLOCK_SIZE = 2 ** 20
+
+
+class _AucScores(NamedTuple):
+    roc_auc: float
+    pr_auc: float
+    average_precision: float
+
+
+def _auc_scores(y_true: np.ndarray, y_score: np.ndarray, dtype: Any = np.float64) -> Optional[_AucScores]:
+    """Computes the ROC AUC, the PR AUC, and the average precision of a scoring at once without materializing the
+    curves.
+
+    The results are the same as computing the areas under the curves of :func:`sklearn.metrics.roc_curve` and
+    :func:`sklearn.metrics.precision_recall_curve` (and :func:`sklearn.metrics.average_precision_score`): The recall
+    changes only at the distinct scores of the anomalous points, so that the areas are sums over these thresholds. For
+    each threshold, we need just the number of normal points with a higher or equal score, which we look up in the
+    sorted scores of the normal points. The scores are sorted in the given ``dtype``; ``np.float32`` halves the memory
+    footprint for long time series at the cost of merging scores that are equal in single precision.
+
+    Returns ``None`` if ``y_true`` does not contain both, the labels 0 and 1, and nothing else; in this case, the
+    sklearn functions must be used to get their results, warnings, and errors.
+    """
+    positives = y_true == 1
+    n_pos = int(np.count_nonzero(positives))
+    n_neg = positives.shape[0] - n_pos
+    if n_pos == 0 or n_neg == 0 or n_neg != np.count_nonzero(y_true == 0):
+        return None
+
+    # distinct thresholds at which the recall changes (in descending order) and their number of anomalous points
+    thresholds, pos_counts = np.unique(y_score[positives].astype(dtype), return_counts=True)
+    thresholds = thresholds[::-1]
+    pos_counts = pos_counts[::-1]
+    # copy the scores of the normal points blockwise to avoid temporary full-size arrays in double precision
+    negatives = np.empty(n_neg, dtype=dtype)
+    end = 0
+    for i in range(0, positives.shape[0], _BLOCK_SIZE):
+        block = y_score[i:i + _BLOCK_SIZE][~positives[i:i + _BLOCK_SIZE]]
+        negatives[end:end + block.shape[0]] = block
+        end += block.shape[0]
+    negatives.sort()
+
+    # false positives at the thresholds (>= threshold) and right above them (> threshold)
+    fps = n_neg - np.searchsorted(negatives, thresholds, side="left")
+    prev_fps = n_neg - np.searchsorted(negatives, thresholds, side="right")
+    return _areas(pos_counts, fps, prev_fps, n_pos, n_neg)
+
+
+def _areas(pos_counts: np.ndarray, fps: np.ndarray, prev_fps: np.ndarray, n_pos: int, n_neg: int) -> _AucScores:
+    """Computes the ROC AUC, the PR AUC, and the average precision from the number of anomalous points per threshold
+    (in descending order of the thresholds, covering all anomalous points) and the false positives at (>=) and right
+    above (>) each threshold."""
+    tps = np.cumsum(pos_counts)
+    prev_tps = tps - pos_counts
+
+    # ROC AUC: probability that an anomalous point has a higher score than a normal point (ties count half)
+    roc_auc = np.sum(pos_counts * ((n_neg - fps) + (n_neg - prev_fps))) / (2 * n_pos * n_neg)
+    precision = tps / (tps + fps)
+    # the PR curve starts with a precision of 1 above the highest score
+    prev_ps = prev_tps + prev_fps
+    prev_precision = np.divide(prev_tps, prev_ps, out=np.ones_like(precision), where=prev_ps > 0)
+    recall_gain = pos_counts / n_pos
+    pr_auc = np.sum(recall_gain * (precision + prev_precision)) / 2
+    average_precision = np.sum(recall_gain * precision)
+    return _AucScores(float(roc_auc), float(pr_auc), float(average_precision))
+
 
 class AucMetric(Metric, ABC):
     """Base class for area-under-curve-based metrics.
@@ -13,23 +86,35 @@ class AucMetric(Metric, ABC):
     All AUC-Metrics support continuous scorings, calculate the area under a curve function, and allow plotting this
     curve function. See the subclasses' documentation for a detailed explanation of the corresponding curve and metric.
     """
-    def __init__(self, plot: bool = False, plot_store: bool = False) -> None:
+    def __init__(self, plot: bool = False, plot_store: bool = False, float32: bool = False) -> None:
         self._plot = plot
         self._plot_store = plot_store
+        self._dtype = np.float32 if float32 else np.float64
+
+    def _auc_scores(self, y_true: np.ndarray, y_score: np.ndarray,
+                    context: Optional["MetricContext"] = None) -> Optional[_AucScores]:
+        # the curves are required only for plotting
+        if self._plot:
+            return None
+        if context is not None:
+            return context.auc_scores(self._dtype)
+        return _auc_scores(y_true, y_score, self._dtype)
 
     def _auc(self,
              y_true: np.ndarray,
              y_score: Iterable[float],
              curve_function: Callable[[np.ndarray, np.ndarray], Any]) -> float:
         x, y, thresholds = curve_function(y_true, np.array(y_score))
-        if "precision_recall" in curve_function.__name__:
+        return self._area(x, y, curve_function.__name__)
+
+    def _area(self, x: np.ndarray, y: np.ndarray, name: str) -> float:
+        if "precision_recall" in name:
             # swap x and y
             x, y = y, x
         area: float = auc(x, y)
         if self._plot:
             import matplotlib.pyplot as plt
 
-            name = curve_function.__name__
             plt.plot(x, y, label=name, drawstyle="steps-post")
             # plt.plot([0, 1], [0, 1], linestyle="--", label="Random")
             plt.title(f"{name} | area = {area:.4f}")
@@ -52,17 +137,50 @@ class RocAUC(AucMetric):
     plot_store : bool
         If this parameter is ``True`` the curve plot will be saved in the current working directory under the name
         template "fig-{metric-name}.pdf".
+    float32 : bool
+        Sort the anomaly scores in single precision to halve the memory footprint for very long time series. Scores
+        that are equal in single precision are treated as ties.
 
     See Also
     --------
     `https://en.wikipedia.org/wiki/Receiver_operating_characteristic <https://en.wikipedia.org/wiki/Receiver_operating_characteristic>`_ : Explanation of the ROC-curve.
     """
-    def __init__(self, plot: bool = False, plot_store: bool = False) -> None:
-        super().__init__(plot, plot_store)
+    def __init__(self, plot: bool = False, plot_store: bool = False, float32: bool = False) -> None:
+        super().__init__(plot, plot_store, float32)
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+        scores = self._auc_scores(y_true, y_score)
+        if scores is not None:
+            return scores.roc_auc
         return self._auc(y_true, y_score, roc_curve)
 
+    def score_context(self, context: "MetricContext") -> float:
+        scores = self._auc_scores(context.y_true, context.y_score, context)
+        if scores is not None:
+            return scores.roc_auc
+        return self._area(*context.roc_curve()[:2], name=roc_curve.__name__)
+
+    def _score_many(self, labels: "LabelContext", y_scores: np.ndarray,
+                    **kwargs: Any) -> np.ndarray:
+        positives = labels.y_true == 1
+        n_pos = int(np.sum(positives))
+        n_neg = positives.shape[0] - n_pos
+        # the ranks are computed in double precision
+        if (self._plot or self._dtype != np.float64 or y_scores.shape[0] == 0 or n_pos == 0 or n_neg == 0
+                or not np.all(np.isin(labels.y_true, [0, 1]))):
+            return super()._score_many(labels, y_scores, **kwargs)
+
+        y_scores = np.vstack([self._validate_scoring(labels.y_true, row, **kwargs) for row in y_scores])
+        # The ROC-AUC is the probability that a random positive point has a higher score than a random negative one
+        # (Mann-Whitney U statistic), which we can compute for all scorings at once using the score ranks.
+        ranks = rankdata(y_scores, axis=1)
+        scores: np.ndarray = (np.sum(ranks[:, positives], axis=1) - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+        constant = np.min(y_scores, axis=1) == np.max(y_scores, axis=1)
+        if np.any(constant):
+            warnings.warn("Cannot compute metric for a constant value in y_score, returning 0.0!")
+            scores[constant] = 0.
+        return scores
+
     @property
     def name(self) -> str:
         return "ROC_AUC"
@@ -78,13 +196,25 @@ class PrAUC(AucMetric):
     plot_store : bool
         If this parameter is ``True`` the curve plot will be saved in the current working directory under the name
         template "fig-{metric-name}.pdf".
+    float32 : bool
+        Sort the anomaly scores in single precision to halve the memory footprint for very long time series. Scores
+        that are equal in single precision are treated as ties.
     """
-    def __init__(self, plot: bool = False, plot_store: bool = False) -> None:
-        super().__init__(plot, plot_store)
+    def __init__(self, plot: bool = False, plot_store: bool = False, float32: bool = False) -> None:
+        super().__init__(plot, plot_store, float32)
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+        scores = self._auc_scores(y_true, y_score)
+        if scores is not None:
+            return scores.pr_auc
         return self._auc(y_true, y_score, precision_recall_curve)
 
+    def score_context(self, context: "MetricContext") -> float:
+        scores = self._auc_scores(context.y_true, context.y_score, context)
+        if scores is not None:
+            return scores.pr_auc
+        return self._area(*context.precision_recall_curve()[:2], name=precision_recall_curve.__name__)
+
     @property
     def name(self) -> str:
         return "PR_AUC"
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import numpy as np
 from sklearn.metrics import precision_score, recall_score, f1_score
@@ -6,6 +7,9 @@ from sklearn.metrics import precision_score, recall_score, f1_score
 from .metric import Metric
 from .thresholding import ThresholdingStrategy, NoThresholding
 
+if TYPE_CHECKING:
+    from .suite import MetricContext
+
 
 class ClassificationMetric(Metric, ABC):
     """Base class for standard classification metrics.
@@ -22,6 +26,9 @@ class ClassificationMetric(Metric, ABC):
         y_pred = self._thresholding_strategy.fit_transform(y_true, y_score)
         return self._internal_score(y_true, y_pred)
 
+    def score_context(self, context: "MetricContext") -> float:
+        return self._internal_score(context.y_true, context.predictions(self._thresholding_strategy))
+
     def supports_continuous_scorings(self) -> bool:
         return not isinstance(self._thresholding_strategy, NoThresholding)
 
@@ -1,10 +1,26 @@
+import hashlib
 import warnings
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
 from sklearn.utils import column_or_1d, assert_all_finite, check_consistent_length
 
+if TYPE_CHECKING:
+    from .suite import LabelContext, MetricContext
+
+
+def _read_only(a: np.ndarray) -> np.ndarray:
+    view = a.view()
+    view.setflags(write=False)
+    return view
+
+
+def _array_digest(a: np.ndarray) -> Tuple[str, Tuple[int, ...], str]:
+    """Fingerprint of the content of an array (used as key for caching intermediate results)."""
+    data = np.ascontiguousarray(a)
+    return str(data.dtype), data.shape, hashlib.blake2b(data.view(np.uint8).data, digest_size=16).hexdigest()
+
 
 class Metric(ABC):
     """Base class for metric implementations that score anomaly scorings against ground truth binary labels. Every
@@ -39,27 +55,88 @@ class Metric(ABC):
     """
 
     def __call__(self, y_true: np.ndarray, y_score: np.ndarray, **kwargs) -> float:  # type: ignore[no-untyped-def]
+        from .suite import MetricContext, _score
+
         y_true, y_score = self._validate_scores(y_true, y_score, **kwargs)
-        if np.unique(y_score).shape[0] == 1:
-            warnings.warn("Cannot compute metric for a constant value in y_score, returning 0.0!")
-            return 0.
-        return self.score(y_true, y_score)
+        # single-use context: metrics that overwrite score_context() work on read-only views of the inputs
+        return _score(self, MetricContext(y_true, y_score))
+
+    def score_many(self, y_true: Union[np.ndarray, "LabelContext"], y_scores: np.ndarray,
+                   **kwargs: Any) -> np.ndarray:
+        """Computes the metric for multiple anomaly scorings of the same time series at once.
+
+        The ground truth labels are validated only once, and all label-side structures (e.g. the extended anomaly
+        labels of the range-based metrics) are shared between the scorings. Pass a
+        :class:`~timeeval.metrics.LabelContext` instead of the labels to share them also between multiple metrics or
+        calls. Some metrics, such as :class:`~timeeval.metrics.RocAUC`, evaluate the whole batch vectorized.
+
+        Parameters
+        ----------
+        y_true : np.ndarray or LabelContext
+            Ground truth binary labels (or their context).
+        y_scores : np.ndarray
+            2-dimensional array with one anomaly scoring per row (each of the same length as ``y_true``).
+        kwargs
+            Same options as for :func:`~timeeval.metrics.Metric.__call__` (``inf_is_1``, ``neginf_is_0``, and
+            ``nan_is_0``).
+
+        Returns
+        -------
+        scores : np.ndarray
+            The metric for each scoring (row).
+        """
+        from .suite import LabelContext
+
+        labels = y_true if isinstance(y_true, LabelContext) else LabelContext(y_true)
+        y_scores = np.asarray(y_scores)
+        if y_scores.ndim != 2:
+            raise ValueError(f"The anomaly scorings must be a 2-dimensional array with one scoring per row, but the "
+                             f"array has {y_scores.ndim} dimension(s)!")
+        return self._score_many(labels, y_scores, **kwargs)
+
+    def _score_many(self, labels: "LabelContext", y_scores: np.ndarray,
+                    **kwargs: Any) -> np.ndarray:
+        from .suite import MetricContext, _score
+
+        scores = np.empty(y_scores.shape[0], dtype=np.float_)
+        for i in range(y_scores.shape[0]):
+            y_score = self._validate_scoring(labels.y_true, y_scores[i], **kwargs)
+            scores[i] = _score(self, MetricContext(labels.y_true, y_score, labels))
+        return scores
 
     def _validate_scores(self, y_true: np.ndarray, y_score: np.ndarray,
                          inf_is_1: bool = True,
                          neginf_is_0: bool = True,
                          nan_is_0: bool = True) -> Tuple[np.ndarray, np.ndarray]:
-        y_true = np.array(y_true).copy()
-        y_score = np.array(y_score).copy()
+        """Validates the inputs without copying them. The returned arrays may share their memory with the inputs and
+        must not be modified (see :func:`~timeeval.metrics.Metric._validate_scoring`)."""
+        y_true = np.asarray(y_true)
+        y_score = np.asarray(y_score)
         # check labels
         if self.supports_continuous_scorings() and y_true.dtype == np.float_ and y_score.dtype == np.int_:
             warnings.warn("Assuming that y_true and y_score where permuted, because their dtypes indicate so. "
                           "y_true should be an integer array and y_score a float array!")
             return self._validate_scores(y_score, y_true)
 
-        y_true: np.ndarray = column_or_1d(y_true)  # type: ignore
+        y_true = self._validate_labels(y_true)
+        y_score = self._validate_scoring(y_true, y_score, inf_is_1, neginf_is_0, nan_is_0)
+        return y_true, y_score
+
+    @staticmethod
+    def _validate_labels(y_true: np.ndarray) -> np.ndarray:
+        y_true = column_or_1d(y_true)
         assert_all_finite(y_true)
+        return y_true
 
+    def _validate_scoring(self, y_true: np.ndarray, y_score: np.ndarray,
+                          inf_is_1: bool = True,
+                          neginf_is_0: bool = True,
+                          nan_is_0: bool = True) -> np.ndarray:
+        """Validates the anomaly scoring for the already validated labels ``y_true``.
+
+        The scoring is copied only if it contains non-finite scores that must be substituted; otherwise, the input
+        array (or a view of it) is returned.
+        """
         # check scores
         y_score: np.ndarray = column_or_1d(y_score)  # type: ignore
 
@@ -74,26 +151,30 @@ class Metric(ABC):
                 raise ValueError("When using continuous scoring metrics, the scores must be floats!")
 
         # substitute NaNs and Infs
-        nan_mask = np.isnan(y_score)
-        inf_mask = np.isinf(y_score)
-        neginf_mask = np.isneginf(y_score)
-        penalize_mask = np.full_like(y_score, dtype=bool, fill_value=False)
-        if inf_is_1:
-            y_score[inf_mask] = 1
-        else:
-            penalize_mask = penalize_mask | inf_mask
-        if neginf_is_0:
-            y_score[neginf_mask] = 0
-        else:
-            penalize_mask = penalize_mask | neginf_mask
-        if nan_is_0:
-            y_score[nan_mask] = 0
-        else:
-            penalize_mask = penalize_mask | nan_mask
-        y_score[penalize_mask] = (~np.array(y_true[penalize_mask], dtype=bool)).astype(np.int_)
-
-        assert_all_finite(y_score)
-        return y_true, y_score
+        idx = np.flatnonzero(~np.isfinite(y_score))
+        if idx.shape[0] == 0:
+            return y_score
+        values = y_score[idx]
+        # penalized scores are wrong: 1 for normal points and 0 for anomalous points
+        penalty = (~np.array(y_true[idx], dtype=bool)).astype(np.int_)
+        nan = np.isnan(values)
+        posinf = np.isposinf(values)
+        neginf = np.isneginf(values)
+        substitutes = np.zeros(idx.shape[0], dtype=y_score.dtype)
+        substitutes[posinf] = 1
+        penalize_mask = np.zeros(idx.shape[0], dtype=bool)
+        if not inf_is_1:
+            # -inf is an inf as well
+            penalize_mask |= posinf | neginf
+        if not neginf_is_0:
+            penalize_mask |= neginf
+        if not nan_is_0:
+            penalize_mask |= nan
+        substitutes[penalize_mask] = penalty[penalize_mask]
+
+        y_score = y_score.copy()
+        y_score[idx] = substitutes
+        return y_score
 
     @property
     @abstractmethod
@@ -107,6 +188,11 @@ class Metric(ABC):
 
         Please use :func:`~timeeval.metrics.Metric.__call__` instead of calling this function directly!
 
+        ``score`` is called by the default implementation of :func:`~timeeval.metrics.Metric.score_context` with copies
+        of the validated inputs, so it may modify them. Metrics that overwrite ``score_context`` avoid these copies,
+        because :func:`~timeeval.metrics.Metric.__call__` and :class:`~timeeval.metrics.MetricSuite` both compute
+        the metric via ``score_context``.
+
         Examples
         --------
 
@@ -121,6 +207,17 @@ class Metric(ABC):
         """
         ...
 
+    def score_context(self, context: "MetricContext") -> float:
+        """Computes the metric based on a :class:`~timeeval.metrics.MetricContext` with validated inputs.
+
+        This method is used by :func:`~timeeval.metrics.Metric.__call__` (with a single-use context) and
+        :class:`~timeeval.metrics.MetricSuite`. Metrics can overwrite it to reuse the intermediate results of the
+        context that are shared between multiple metrics and to avoid copying the inputs. The default implementation
+        calls :func:`~timeeval.metrics.Metric.score` with copies of the validated inputs, so that ``score`` may modify
+        them.
+        """
+        return self.score(context.y_true.copy(), context.y_score.copy())
+
     @abstractmethod
     def supports_continuous_scorings(self) -> bool:
         """Whether this metric accepts continuous anomaly scorings as input (``True``) or binary classification
@@ -1,12 +1,16 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import numpy as np
-from prts import ts_fscore, ts_precision
 from sklearn.metrics import average_precision_score
 
+from .auc_metrics import _auc_scores
 from .metric import Metric
+from .range_metrics import _anomaly_ranges, _f_beta, _range_precision, _range_recall
 from .thresholding import TopKRangesThresholding
 
+if TYPE_CHECKING:
+    from .suite import MetricContext
+
 
 class AveragePrecision(Metric):
     """Computes the average precision metric aver all possible thresholds.
@@ -27,9 +31,22 @@ class AveragePrecision(Metric):
         self._kwargs = kwargs
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+        scores = None if self._kwargs else _auc_scores(y_true, y_score)
+        if scores is not None:
+            return scores.average_precision
         score: float = average_precision_score(y_true, y_score, pos_label=1, **self._kwargs)
         return score
 
+    def score_context(self, context: "MetricContext") -> float:
+        if self._kwargs:
+            return super().score_context(context)
+        scores = context.auc_scores()
+        if scores is not None:
+            return scores.average_precision
+        # same as sklearn's average_precision_score but reuses the shared precision-recall curve
+        precision, recall, _ = context.precision_recall_curve()
+        return float(-np.sum(np.diff(recall) * np.array(precision)[:-1]))
+
     def supports_continuous_scorings(self) -> bool:
         return True
 
@@ -60,9 +77,17 @@ class FScoreAtK(Metric):
         self._k = k
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        y_pred = TopKRangesThresholding(k=self._k).fit_transform(y_true, y_score)
-        score: float = ts_fscore(y_true, y_pred, p_alpha=1, r_alpha=1, cardinality="reciprocal")
-        return score
+        return self._score_predictions(y_true, TopKRangesThresholding(k=self._k).fit_transform(y_true, y_score))
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score_predictions(context.y_true, context.predictions(TopKRangesThresholding(k=self._k)))
+
+    def _score_predictions(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        real_ranges = _anomaly_ranges(y_true)
+        pred_ranges = _anomaly_ranges(y_pred)
+        precision = _range_precision(real_ranges, pred_ranges, alpha=1, cardinality="reciprocal", bias="flat")
+        recall = _range_recall(real_ranges, pred_ranges, alpha=1, cardinality="reciprocal", bias="flat")
+        return _f_beta(precision, recall, beta=1)
 
     def supports_continuous_scorings(self) -> bool:
         return True
@@ -94,9 +119,14 @@ class PrecisionAtK(Metric):
         self._k = k
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        y_pred = TopKRangesThresholding(k=self._k).fit_transform(y_true, y_score)
-        score: float = ts_precision(y_true, y_pred, alpha=1, cardinality="reciprocal")
-        return score
+        return self._score_predictions(y_true, TopKRangesThresholding(k=self._k).fit_transform(y_true, y_score))
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score_predictions(context.y_true, context.predictions(TopKRangesThresholding(k=self._k)))
+
+    def _score_predictions(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return _range_precision(_anomaly_ranges(y_true), _anomaly_ranges(y_pred),
+                                alpha=1, cardinality="reciprocal", bias="flat")
 
     def supports_continuous_scorings(self) -> bool:
         return True
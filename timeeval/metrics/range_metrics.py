@@ -1,12 +1,106 @@
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
-from prts import ts_precision, ts_recall, ts_fscore
 
 from .auc_metrics import AucMetric
 from .metric import Metric
 from .thresholding import ThresholdingStrategy, NoThresholding
 
+if TYPE_CHECKING:
+    from .suite import MetricContext
+
+
+_CARDINALITIES = ("one", "reciprocal", "udf_gamma")
+_BIASES = ("flat", "front", "middle", "back")
+
+
+def _anomaly_ranges(y: np.ndarray) -> np.ndarray:
+    """Extracts the continuous anomalous ranges of a binary labeling as an array of inclusive ``[start, end]``
+    index pairs."""
+    changes = np.diff(np.r_[0, np.asarray(y) > 0, 0].astype(np.int8))
+    starts = np.flatnonzero(changes == 1)
+    ends = np.flatnonzero(changes == -1) - 1
+    ranges: np.ndarray = np.c_[starts, ends]
+    return ranges
+
+
+def _positional_weight(x: np.ndarray, length: np.ndarray, bias: str) -> np.ndarray:
+    """Cumulative positional bias :math:`\\sum_{i=1}^{x} \\delta(i, length)` of the first ``x`` points of ranges with
+    the given lengths."""
+    x = x.astype(np.float_)
+    length = length.astype(np.float_)
+    weight: np.ndarray
+    if bias == "flat":
+        weight = x
+    elif bias == "front":
+        weight = x * (length + 1) - x * (x + 1) / 2
+    elif bias == "back":
+        weight = x * (x + 1) / 2
+    else:  # middle: increasing weights in the first half, decreasing weights in the second half
+        half = np.floor(length / 2)
+        first = np.minimum(x, half)
+        second = np.maximum(x - half, 0)
+        weight = first * (first + 1) / 2 + second * (length + 1) - ((half + second) * (half + second + 1) - half * (half + 1)) / 2
+    return weight
+
+
+def _range_reward(ranges: np.ndarray, other: np.ndarray, alpha: float, cardinality: str, bias: str) -> float:
+    """Computes the average reward of ``ranges`` regarding their overlap with the ``other`` ranges as defined by
+    Tatbul et al. [TatbulEtAl2018]_.
+
+    The range-based precision is the reward of the predicted ranges with respect to the real anomaly ranges, and the
+    range-based recall is the reward of the real anomaly ranges with respect to the predicted ranges. Both range arrays
+    are sorted and non-overlapping, so that the ranges in ``other`` that overlap with a range are a contiguous block
+    that can be found using binary search.
+    """
+    if not 0 <= alpha <= 1:
+        raise ValueError(f"alpha must be between 0 and 1, but was {alpha}!")
+    if cardinality not in _CARDINALITIES:
+        raise ValueError(f"Unknown cardinality '{cardinality}', use one of {', '.join(_CARDINALITIES)}!")
+    if bias not in _BIASES:
+        raise ValueError(f"Unknown positional bias '{bias}', use one of {', '.join(_BIASES)}!")
+    if ranges.shape[0] == 0:
+        return 0.
+
+    # the other ranges [first, last) overlap with each range
+    first = np.searchsorted(other[:, 1], ranges[:, 0], side="left")
+    last = np.searchsorted(other[:, 0], ranges[:, 1], side="right")
+    n_overlaps = np.maximum(last - first, 0)
+
+    # enumerate all overlapping pairs (at most len(ranges) + len(other) many)
+    range_idx = np.repeat(np.arange(ranges.shape[0]), n_overlaps)
+    other_idx = np.arange(range_idx.shape[0]) - np.repeat(np.cumsum(n_overlaps) - n_overlaps - first, n_overlaps)
+    starts = ranges[range_idx, 0]
+    length = ranges[range_idx, 1] - starts + 1
+    overlap_start = np.maximum(starts, other[other_idx, 0]) - starts
+    overlap_end = np.minimum(ranges[range_idx, 1], other[other_idx, 1]) - starts + 1
+    omega = ((_positional_weight(overlap_end, length, bias) - _positional_weight(overlap_start, length, bias))
+             / _positional_weight(length, length, bias))
+    omega_reward = np.bincount(range_idx, weights=omega, minlength=ranges.shape[0])
+
+    gamma = np.ones(ranges.shape[0])
+    if cardinality == "reciprocal":
+        gamma[n_overlaps > 1] = 1. / n_overlaps[n_overlaps > 1]
+    existence_reward = (n_overlaps > 0).astype(np.float_)
+    rewards = alpha * existence_reward + (1 - alpha) * gamma * omega_reward
+    return float(np.sum(rewards) / ranges.shape[0])
+
+
+def _f_beta(precision: float, recall: float, beta: float) -> float:
+    if precision + recall == 0:
+        return 0.
+    return (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
+
+
+def _range_precision(real_ranges: np.ndarray, pred_ranges: np.ndarray,
+                     alpha: float, cardinality: str, bias: str) -> float:
+    return _range_reward(pred_ranges, real_ranges, alpha, cardinality, bias)
+
+
+def _range_recall(real_ranges: np.ndarray, pred_ranges: np.ndarray,
+                  alpha: float, cardinality: str, bias: str) -> float:
+    return _range_reward(real_ranges, pred_ranges, alpha, cardinality, bias)
+
 
 class RangePrecision(Metric):
     """Computes the range-based precision metric introduced by Tatbul et al. at NeurIPS 2018 [TatbulEtAl2018]_.
@@ -39,9 +133,16 @@ class RangePrecision(Metric):
         self._name = name
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        y_pred = self._thresholding_strategy.fit_transform(y_true, y_score)
-        score: float = ts_precision(y_true, y_pred, alpha=self._alpha, cardinality=self._cardinality, bias=self._bias)
-        return score
+        return self._score_predictions(_anomaly_ranges(y_true),
+                                       self._thresholding_strategy.fit_transform(y_true, y_score))
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score_predictions(context.labels.anomaly_ranges,
+                                       context.predictions(self._thresholding_strategy))
+
+    def _score_predictions(self, real_ranges: np.ndarray, y_pred: np.ndarray) -> float:
+        return _range_precision(real_ranges, _anomaly_ranges(y_pred),
+                                self._alpha, self._cardinality, self._bias)
 
     def supports_continuous_scorings(self) -> bool:
         return not isinstance(self._thresholding_strategy, NoThresholding)
@@ -83,9 +184,16 @@ class RangeRecall(Metric):
         self._name = name
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        y_pred = self._thresholding_strategy.fit_transform(y_true, y_score)
-        score: float = ts_recall(y_true, y_pred, alpha=self._alpha, cardinality=self._cardinality, bias=self._bias)
-        return score
+        return self._score_predictions(_anomaly_ranges(y_true),
+                                       self._thresholding_strategy.fit_transform(y_true, y_score))
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score_predictions(context.labels.anomaly_ranges,
+                                       context.predictions(self._thresholding_strategy))
+
+    def _score_predictions(self, real_ranges: np.ndarray, y_pred: np.ndarray) -> float:
+        return _range_recall(real_ranges, _anomaly_ranges(y_pred),
+                             self._alpha, self._cardinality, self._bias)
 
     def supports_continuous_scorings(self) -> bool:
         return not isinstance(self._thresholding_strategy, NoThresholding)
@@ -145,13 +253,19 @@ class RangeFScore(Metric):
         self._name = f"RANGE_F{self._beta:.2f}_SCORE" if name is None else name
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        y_pred = self._thresholding_strategy.fit_transform(y_true, y_score)
-        score: float = ts_fscore(y_true, y_pred,
-                                 beta=self._beta,
-                                 p_alpha=self._p_alpha, r_alpha=self._r_alpha,
-                                 cardinality=self._cardinality,
-                                 p_bias=self._p_bias, r_bias=self._p_bias)
-        return score
+        return self._score_predictions(_anomaly_ranges(y_true),
+                                       self._thresholding_strategy.fit_transform(y_true, y_score))
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score_predictions(context.labels.anomaly_ranges,
+                                       context.predictions(self._thresholding_strategy))
+
+    def _score_predictions(self, real_ranges: np.ndarray, y_pred: np.ndarray) -> float:
+        # extract the predicted ranges only once for both precision and recall
+        pred_ranges = _anomaly_ranges(y_pred)
+        precision = _range_precision(real_ranges, pred_ranges, self._p_alpha, self._cardinality, self._p_bias)
+        recall = _range_recall(real_ranges, pred_ranges, self._r_alpha, self._cardinality, self._p_bias)
+        return _f_beta(precision, recall, self._beta)
 
     def supports_continuous_scorings(self) -> bool:
         return not isinstance(self._thresholding_strategy, NoThresholding)
@@ -168,9 +282,9 @@ class RangePrecisionRangeRecallAUC(AucMetric):
     Parameters
     ----------
     max_samples: int
-        TimeEval uses a community implementation of the range-based precision and recall metrics, which is quite slow.
-        To prevent long runtimes caused by scorings with high precision (many thresholds), just a specific amount of
-        possible thresholds is sampled. This parameter controls the maximum number of thresholds; too low numbers
+        The range-based precision and recall are computed for each threshold separately. To prevent long runtimes
+        caused by scorings with high precision (many thresholds), just a specific amount of possible thresholds is
+        sampled. This parameter controls the maximum number of thresholds; too low numbers
         degrade the metrics' quality.
     r_alpha : float
         Weight of the existence reward for the range-based recall.
@@ -207,9 +321,15 @@ class RangePrecisionRangeRecallAUC(AucMetric):
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
         return self._auc(y_true, y_score, self._range_precision_recall_curve)
 
+    def score_context(self, context: "MetricContext") -> float:
+        x, y, _ = self._range_precision_recall_curve(context.y_true, context.y_score, context.labels.anomaly_ranges)
+        return self._area(x, y, self._range_precision_recall_curve.__name__)
+
     def _range_precision_recall_curve(self,
                                       y_true: np.ndarray,
-                                      y_score: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                                      y_score: np.ndarray,
+                                      real_ranges: Optional[np.ndarray] = None
+                                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         thresholds = np.unique(y_score)
         thresholds.sort()
         # The first precision and recall values are precision=class balance and recall=1.0, which corresponds to a
@@ -231,16 +351,12 @@ class RangePrecisionRangeRecallAUC(AucMetric):
 
         recalls = np.zeros_like(thresholds)
         precisions = np.zeros_like(thresholds)
+        if real_ranges is None:
+            real_ranges = _anomaly_ranges(y_true)
         for i, threshold in enumerate(thresholds):
-            y_pred = (y_score >= threshold).astype(np.int64)
-            recalls[i] = ts_recall(y_true, y_pred,
-                                   alpha=self._r_alpha,
-                                   cardinality=self._cardinality,
-                                   bias=self._bias)
-            precisions[i] = ts_precision(y_true, y_pred,
-                                         alpha=self._p_alpha,
-                                         cardinality=self._cardinality,
-                                         bias=self._bias)
+            pred_ranges = _anomaly_ranges(y_score >= threshold)
+            recalls[i] = _range_recall(real_ranges, pred_ranges, self._r_alpha, self._cardinality, self._bias)
+            precisions[i] = _range_precision(real_ranges, pred_ranges, self._p_alpha, self._cardinality, self._bias)
         # first sort by recall, then by precision to break ties (important for noisy scorings)
         sorted_idx = np.lexsort((precisions * (-1), recalls))[::-1]
         return np.r_[p0, precisions[sorted_idx], 1], np.r_[r0, recalls[sorted_idx], 0], thresholds
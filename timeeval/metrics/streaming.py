@@ -0,0 +1,328 @@
+import warnings
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, Tuple
+
+import numpy as np
+from sklearn.exceptions import UndefinedMetricWarning
+
+from .auc_metrics import _areas
+from .metric import Metric
+from .thresholding import ThresholdingStrategy, NoThresholding, FixedValueThresholding
+
+_Chunks = Callable[[], Iterator[Tuple[np.ndarray, np.ndarray]]]
+
+
+class StreamingMetric(Metric, ABC):
+    """Base class for metrics that process the ground truth labels and the anomaly scoring chunk by chunk.
+
+    In contrast to the other metrics, streaming metrics never validate or copy the entire inputs at once. Their memory
+    footprint is bounded by the chunk size, so that they can evaluate memory-mapped label and score files that do not
+    fit into memory. Each chunk is validated separately with the same options as for the other metrics (``inf_is_1``,
+    ``neginf_is_0``, and ``nan_is_0``), and the inputs are read in multiple passes.
+
+    Parameters
+    ----------
+    chunk_size : int
+        Number of points that are processed at once.
+
+    Examples
+    --------
+    Evaluate a binary dataset (see :func:`~timeeval.utils.datasets.save_binary_dataset`) and binary anomaly scores
+    (see :class:`~timeeval.utils.scores.ScoresFormat`) without loading them into memory:
+
+    >>> from pathlib import Path
+    >>> from timeeval.metrics import StreamingRocAUC
+    >>> from timeeval.utils.datasets import load_labels_only
+    >>> from timeeval.utils.scores import load_scores
+    >>> y_true = load_labels_only(Path("dataset.tsbin"))
+    >>> y_score = load_scores(Path("anomaly_scores.npy"), mmap=True)
+    >>> StreamingRocAUC(bins=10000)(y_true, y_score)
+    """
+
+    def __init__(self, chunk_size: int = 2 ** 20) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be positive, but was {chunk_size}!")
+        self._chunk_size = chunk_size
+
+    def __call__(self, y_true: np.ndarray, y_score: np.ndarray, **kwargs) -> float:  # type: ignore[no-untyped-def]
+        if len(y_true) != len(y_score):
+            raise ValueError(f"Found input variables with inconsistent numbers of samples: "
+                             f"[{len(y_true)}, {len(y_score)}]")
+
+        def chunks() -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+            return self._chunks(y_true, y_score, **kwargs)
+
+        low, high = np.inf, -np.inf
+        n = 0
+        for _, y_score_chunk in chunks():
+            if y_score_chunk.shape[0] > 0:
+                low = min(low, np.min(y_score_chunk))
+                high = max(high, np.max(y_score_chunk))
+                n += y_score_chunk.shape[0]
+        if n == 0:
+            raise ValueError("Found empty input variables, but a minimum of 1 sample is required!")
+        if low == high:
+            warnings.warn("Cannot compute metric for a constant value in y_score, returning 0.0!")
+            return 0.
+        return self._score_chunks(chunks, len(y_true), low, high)
+
+    def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
+        return self._score_chunks(lambda: self._chunks(y_true, y_score), y_true.shape[0], np.min(y_score),
+                                  np.max(y_score))
+
+    def _chunks(self, y_true: np.ndarray, y_score: np.ndarray,
+                **kwargs: Any) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        dtype = np.float_ if self.supports_continuous_scorings() else None
+        for start in range(0, len(y_true), self._chunk_size):
+            y_true_chunk = self._validate_labels(np.array(y_true[start:start + self._chunk_size]))
+            y_score_chunk = np.array(y_score[start:start + self._chunk_size], dtype=dtype)
+            yield y_true_chunk, self._validate_scoring(y_true_chunk, y_score_chunk, **kwargs)
+
+    @abstractmethod
+    def _score_chunks(self, chunks: _Chunks, n: int, low: float, high: float) -> float:
+        """Computes the metric from the validated chunks of the inputs.
+
+        Parameters
+        ----------
+        chunks : Callable[[], Iterator[Tuple[np.ndarray, np.ndarray]]]
+            Creates a new iterator over the validated chunks (``y_true`` and ``y_score``) for each pass.
+        n : int
+            Number of points.
+        low : float
+            Minimum anomaly score.
+        high : float
+            Maximum anomaly score.
+        """
+        ...
+
+
+class _BinnedAucMetric(StreamingMetric, ABC):
+    def __init__(self, bins: int, binning: str, chunk_size: int) -> None:
+        super().__init__(chunk_size)
+        if bins < 1:
+            raise ValueError(f"The number of bins must be positive, but was {bins}!")
+        if binning not in ("uniform", "quantile"):
+            raise ValueError(f"Unknown binning '{binning}', use 'uniform' or 'quantile'!")
+        self._bins = bins
+        self._binning = binning
+
+    def _score_chunks(self, chunks: _Chunks, n: int, low: float, high: float) -> float:
+        if self._binning == "quantile":
+            edges = self._quantile_edges(chunks, n, low, high)
+        else:
+            edges = np.linspace(low, high, self._bins + 1)
+        # bin i contains the scores in [edges[i], edges[i + 1]) and the last bin also the maximum score
+        inner_edges = edges[1:-1]
+        n_bins = edges.shape[0] - 1
+        pos_counts = np.zeros(n_bins, dtype=np.int64)
+        neg_counts = np.zeros(n_bins, dtype=np.int64)
+        for y_true, y_score in chunks():
+            positives = y_true == 1
+            if not np.all(positives | (y_true == 0)):
+                raise ValueError(f"{self.name} requires binary labels (0 or 1)!")
+            idx = np.searchsorted(inner_edges, y_score, side="right")
+            pos_counts += np.bincount(idx[positives], minlength=n_bins)
+            neg_counts += np.bincount(idx[~positives], minlength=n_bins)
+
+        n_pos = int(np.sum(pos_counts))
+        n_neg = int(np.sum(neg_counts))
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError(f"{self.name} requires normal and anomalous points in y_true!")
+        # all points in a bin share the threshold (lower bin edge); the thresholds are processed in descending order
+        pos_counts = pos_counts[::-1]
+        neg_counts = neg_counts[::-1]
+        fps = np.cumsum(neg_counts)
+        prev_fps = fps - neg_counts
+        # the recall changes only at the bins with anomalous points
+        mask = pos_counts > 0
+        return self._select(_areas(pos_counts[mask], fps[mask], prev_fps[mask], n_pos, n_neg))
+
+    def _quantile_edges(self, chunks: _Chunks, n: int, low: float, high: float) -> np.ndarray:
+        # the quantiles are estimated from a regular sample of the scores
+        sample_size = max(100 * self._bins, 100000)
+        stride = max(1, -(-n // sample_size))
+        samples = []
+        start = 0
+        for _, y_score in chunks():
+            # copy the sample to release the chunk
+            samples.append(y_score[(-start) % stride::stride].copy())
+            start += y_score.shape[0]
+        edges: np.ndarray = np.unique(np.quantile(np.concatenate(samples), np.linspace(0, 1, self._bins + 1)))
+        if edges.shape[0] < 2:
+            return np.array([low, high])
+        edges[0] = low
+        edges[-1] = high
+        return edges
+
+    def supports_continuous_scorings(self) -> bool:
+        return True
+
+    @abstractmethod
+    def _select(self, scores: Tuple[float, float, float]) -> float:
+        ...
+
+
+class StreamingRocAUC(_BinnedAucMetric):
+    """Approximates the area under the receiver operating characteristic curve (see
+    :class:`~timeeval.metrics.RocAUC`) with bounded memory.
+
+    The anomaly scores are binned, and all scores within a bin are treated as ties. Thus, the result equals the
+    ROC AUC of the binned scores. It converges to the exact ROC AUC with an increasing number of bins.
+
+    Parameters
+    ----------
+    bins : int
+        Number of bins (thresholds).
+    binning : {'uniform', 'quantile'}
+        Use bins of equal width over the score range (``'uniform'``) or bins with (approximately) the same number of
+        points (``'quantile'``), which is more precise for skewed score distributions. The quantiles are estimated
+        from a regular sample of the scores and need an additional pass over the inputs.
+    chunk_size : int
+        Number of points that are processed at once.
+    """
+
+    def __init__(self, bins: int = 10000, binning: str = "uniform", chunk_size: int = 2 ** 20) -> None:
+        super().__init__(bins, binning, chunk_size)
+
+    def _select(self, scores: Tuple[float, float, float]) -> float:
+        return scores[0]
+
+    @property
+    def name(self) -> str:
+        return "STREAMING_ROC_AUC"
+
+
+class StreamingPrAUC(_BinnedAucMetric):
+    """Approximates the area under the precision recall curve (see :class:`~timeeval.metrics.PrAUC`) with bounded
+    memory.
+
+    The anomaly scores are binned, and all scores within a bin are treated as ties. Thus, the result equals the
+    PR AUC of the binned scores. It converges to the exact PR AUC with an increasing number of bins.
+
+    Parameters
+    ----------
+    bins : int
+        Number of bins (thresholds).
+    binning : {'uniform', 'quantile'}
+        Use bins of equal width over the score range (``'uniform'``) or bins with (approximately) the same number of
+        points (``'quantile'``), which is more precise for skewed score distributions. The quantiles are estimated
+        from a regular sample of the scores and need an additional pass over the inputs.
+    chunk_size : int
+        Number of points that are processed at once.
+    """
+
+    def __init__(self, bins: int = 10000, binning: str = "uniform", chunk_size: int = 2 ** 20) -> None:
+        super().__init__(bins, binning, chunk_size)
+
+    def _select(self, scores: Tuple[float, float, float]) -> float:
+        return scores[1]
+
+    @property
+    def name(self) -> str:
+        return "STREAMING_PR_AUC"
+
+
+class _StreamingClassificationMetric(StreamingMetric, ABC):
+    def __init__(self, thresholding_strategy: ThresholdingStrategy, chunk_size: int) -> None:
+        super().__init__(chunk_size)
+        if not isinstance(thresholding_strategy, (FixedValueThresholding, NoThresholding)):
+            raise ValueError("Streaming classification metrics support only fixed thresholds (FixedValueThresholding "
+                             "or NoThresholding), because other thresholding strategies require the entire scoring!")
+        self._thresholding_strategy = thresholding_strategy
+
+    def _score_chunks(self, chunks: _Chunks, n: int, low: float, high: float) -> float:
+        tp = fp = fn = 0
+        for y_true, y_score in chunks():
+            y_pred = self._thresholding_strategy.transform(y_score) == 1
+            positives = y_true == 1
+            tp += int(np.count_nonzero(y_pred & positives))
+            fp += int(np.count_nonzero(y_pred & ~positives))
+            fn += int(np.count_nonzero(~y_pred & positives))
+        return self._internal_score(tp, fp, fn)
+
+    def supports_continuous_scorings(self) -> bool:
+        return not isinstance(self._thresholding_strategy, NoThresholding)
+
+    @abstractmethod
+    def _internal_score(self, tp: int, fp: int, fn: int) -> float:
+        ...
+
+
+def _divide(numerator: int, denominator: int, name: str) -> float:
+    # same behavior as sklearn's zero_division="warn"
+    if denominator == 0:
+        warnings.warn(f"{name} is ill-defined and being set to 0.0.", UndefinedMetricWarning)
+        return 0.
+    return numerator / denominator
+
+
+class StreamingPrecision(_StreamingClassificationMetric):
+    """Computes the precision metric (see :class:`~timeeval.metrics.Precision`) with bounded memory.
+
+    Parameters
+    ----------
+    thresholding_strategy : ThresholdingStrategy
+        Fixed threshold used to transform the anomaly scorings to binary classification predictions; either
+        :class:`~timeeval.metrics.thresholding.FixedValueThresholding` or
+        :class:`~timeeval.metrics.thresholding.NoThresholding`.
+    chunk_size : int
+        Number of points that are processed at once.
+    """
+
+    def __init__(self, thresholding_strategy: ThresholdingStrategy, chunk_size: int = 2 ** 20) -> None:
+        super().__init__(thresholding_strategy, chunk_size)
+
+    def _internal_score(self, tp: int, fp: int, fn: int) -> float:
+        return _divide(tp, tp + fp, "Precision")
+
+    @property
+    def name(self) -> str:
+        return f"StreamingPrecision_{self._thresholding_strategy}"
+
+
+class StreamingRecall(_StreamingClassificationMetric):
+    """Computes the recall metric (see :class:`~timeeval.metrics.Recall`) with bounded memory.
+
+    Parameters
+    ----------
+    thresholding_strategy : ThresholdingStrategy
+        Fixed threshold used to transform the anomaly scorings to binary classification predictions; either
+        :class:`~timeeval.metrics.thresholding.FixedValueThresholding` or
+        :class:`~timeeval.metrics.thresholding.NoThresholding`.
+    chunk_size : int
+        Number of points that are processed at once.
+    """
+
+    def __init__(self, thresholding_strategy: ThresholdingStrategy, chunk_size: int = 2 ** 20) -> None:
+        super().__init__(thresholding_strategy, chunk_size)
+
+    def _internal_score(self, tp: int, fp: int, fn: int) -> float:
+        return _divide(tp, tp + fn, "Recall")
+
+    @property
+    def name(self) -> str:
+        return f"StreamingRecall_{self._thresholding_strategy}"
+
+
+class StreamingF1Score(_StreamingClassificationMetric):
+    """Computes the F1 metric (see :class:`~timeeval.metrics.F1Score`) with bounded memory.
+
+    Parameters
+    ----------
+    thresholding_strategy : ThresholdingStrategy
+        Fixed threshold used to transform the anomaly scorings to binary classification predictions; either
+        :class:`~timeeval.metrics.thresholding.FixedValueThresholding` or
+        :class:`~timeeval.metrics.thresholding.NoThresholding`.
+    chunk_size : int
+        Number of points that are processed at once.
+    """
+
+    def __init__(self, thresholding_strategy: ThresholdingStrategy, chunk_size: int = 2 ** 20) -> None:
+        super().__init__(thresholding_strategy, chunk_size)
+
+    def _internal_score(self, tp: int, fp: int, fn: int) -> float:
+        return _divide(2 * tp, 2 * tp + fp + fn, "F-score")
+
+    @property
+    def name(self) -> str:
+        return f"StreamingF1Score_{self._thresholding_strategy}"
@@ -0,0 +1,285 @@
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from sklearn.exceptions import UndefinedMetricWarning
+from sklearn.metrics import precision_recall_curve
+
+from .auc_metrics import _AucScores, _auc_scores
+from .metric import Metric, _read_only
+from .range_metrics import _anomaly_ranges
+from .thresholding import ThresholdingStrategy
+
+
+class _LazyCache:
+    def __init__(self) -> None:
+        self._cache: Dict[Hashable, Any] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the intermediate result with the given key, computing it on first access."""
+        if key in self._cache:
+            return self._cache[key]
+        # one lock per key: other intermediate results can be computed concurrently
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+        return self._cache[key]
+
+
+class LabelContext(_LazyCache):
+    """Validated ground truth labels together with lazily computed label-side structures, such as the extended anomaly
+    labels of the range-based metrics, that are shared by all anomaly scorings for the same labels.
+
+    Pass a label context to :func:`~timeeval.metrics.Metric.score_many` to reuse these structures for multiple
+    metrics and multiple calls. The labels of the context are read-only and must not be modified.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        Ground truth labels.
+
+    Examples
+    --------
+    >>> from timeeval.metrics import LabelContext, RangePrVUS, RocAUC
+    >>> labels = LabelContext(y_true)
+    >>> roc_aucs = RocAUC().score_many(labels, y_scores)
+    >>> pr_volumes = RangePrVUS().score_many(labels, y_scores)
+    """
+
+    def __init__(self, y_true: np.ndarray) -> None:
+        super().__init__()
+        self.y_true = _read_only(Metric._validate_labels(np.asarray(y_true)))
+
+    @property
+    def anomaly_ranges(self) -> np.ndarray:
+        """The anomalies of the labels as an array of inclusive ``[start, end]`` index pairs (read-only)."""
+        ranges: np.ndarray = self.cached("anomaly_ranges", lambda: _read_only(_anomaly_ranges(self.y_true)))
+        return ranges
+
+
+class MetricContext(_LazyCache):
+    """Validated ground truth and anomaly scoring together with lazily computed intermediate results that are shared by
+    multiple metrics.
+
+    The context is created by :class:`~timeeval.metrics.MetricSuite` and passed to
+    :func:`~timeeval.metrics.Metric.score_context`. The arrays of the context are read-only views of the validated
+    inputs.
+    The context is thread-safe: each intermediate result is computed only once, even if multiple metrics request it
+    concurrently.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        Validated ground truth labels.
+    y_score : np.ndarray
+        Validated anomaly scoring.
+    labels : Optional[LabelContext]
+        Context of the ground truth labels ``y_true`` if it is shared with other scorings.
+    """
+
+    def __init__(self, y_true: np.ndarray, y_score: np.ndarray, labels: Optional[LabelContext] = None) -> None:
+        super().__init__()
+        self.y_true = _read_only(y_true)
+        self.y_score = _read_only(y_score)
+        self._labels = labels
+
+    @property
+    def labels(self) -> LabelContext:
+        """Context of the ground truth labels."""
+        if self._labels is not None:
+            return self._labels
+        labels: LabelContext = self.cached("labels", lambda: LabelContext(self.y_true))
+        return labels
+
+    @property
+    def argsort(self) -> np.ndarray:
+        """Stable ascending argsort of the anomaly scores."""
+        order: np.ndarray = self.cached("argsort", lambda: np.argsort(self.y_score, kind="stable"))
+        return order
+
+    @property
+    def sorted_scores(self) -> np.ndarray:
+        """Anomaly scores in ascending order."""
+        scores: np.ndarray = self.cached("sorted_scores", lambda: self.y_score[self.argsort])
+        return scores
+
+    @property
+    def is_constant(self) -> bool:
+        """Whether the scoring has only a single distinct value."""
+        return bool(self.y_score.shape[0] > 0 and self.sorted_scores[0] == self.sorted_scores[-1])
+
+    def confusion_matrix_at_thresholds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the false positives, true positives, and the corresponding (distinct, decreasing) thresholds, where
+        all points with a score greater or equal to the threshold are considered anomalous."""
+        def compute() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            desc_scores = self.sorted_scores[::-1]
+            desc_labels = self.y_true[self.argsort[::-1]]
+            distinct_value_indices = np.where(np.diff(desc_scores))[0]
+            threshold_idxs = np.r_[distinct_value_indices, desc_labels.shape[0] - 1]
+            tps = np.cumsum(desc_labels, dtype=np.float64)[threshold_idxs]
+            fps = 1 + threshold_idxs - tps
+            return fps, tps, desc_scores[threshold_idxs]
+
+        result: Tuple[np.ndarray, np.ndarray, np.ndarray] = self.cached("confusion_matrix_at_thresholds", compute)
+        return result
+
+    def roc_curve(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same as :func:`sklearn.metrics.roc_curve` but based on the shared confusion matrix."""
+        def compute() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            fps, tps, thresholds = self.confusion_matrix_at_thresholds()
+            if fps.shape[0] > 2:
+                # drop thresholds of points that are collinear with their neighbors (they do not affect the AUC)
+                optimal_idxs = np.where(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True])[0]
+                fps = fps[optimal_idxs]
+                tps = tps[optimal_idxs]
+                thresholds = thresholds[optimal_idxs]
+            tps = np.r_[0, tps]
+            fps = np.r_[0, fps]
+            thresholds = np.r_[np.inf, thresholds]
+
+            if fps[-1] <= 0:
+                warnings.warn("No negative samples in y_true, false positive value should be meaningless",
+                              UndefinedMetricWarning)
+                fpr = np.repeat(np.nan, fps.shape)
+            else:
+                fpr = fps / fps[-1]
+            if tps[-1] <= 0:
+                warnings.warn("No positive samples in y_true, true positive value should be meaningless",
+                              UndefinedMetricWarning)
+                tpr = np.repeat(np.nan, tps.shape)
+            else:
+                tpr = tps / tps[-1]
+            return fpr, tpr, thresholds
+
+        result: Tuple[np.ndarray, np.ndarray, np.ndarray] = self.cached("roc_curve", compute)
+        return result
+
+    def auc_scores(self, dtype: Any = np.float64) -> Optional[_AucScores]:
+        """ROC AUC, PR AUC, and average precision computed at once without materializing the curves, where the scores
+        are sorted in the given ``dtype``. ``None`` if the labels require computing them from the curves."""
+        result: Optional[_AucScores] = self.cached(
+            ("auc_scores", np.dtype(dtype).name), lambda: _auc_scores(self.y_true, self.y_score, dtype)
+        )
+        return result
+
+    def predictions(self, strategy: ThresholdingStrategy) -> np.ndarray:
+        """Binary predictions of the thresholding strategy for the scoring (read-only). The thresholding is computed
+        only once for all strategies with the same configuration (see
+        :func:`~timeeval.metrics.thresholding.ThresholdingStrategy.cache_key`); their ``threshold`` is set as if they
+        had been fitted on the scoring."""
+        def compute() -> Tuple[Optional[float], np.ndarray]:
+            y_pred = np.asarray(strategy.fit_transform(self.y_true, self.y_score))
+            y_pred.setflags(write=False)
+            return strategy.threshold, y_pred
+
+        result: Tuple[Optional[float], np.ndarray] = self.cached(("predictions", strategy.cache_key()), compute)
+        strategy.threshold = result[0]
+        return result[1]
+
+    def precision_recall_curve(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Result of :func:`sklearn.metrics.precision_recall_curve` (computed once)."""
+        result: Tuple[np.ndarray, np.ndarray, np.ndarray] = self.cached(
+            "precision_recall_curve", lambda: precision_recall_curve(self.y_true, self.y_score)
+        )
+        return result
+
+
+class MetricResult(NamedTuple):
+    """Result of a single metric computed by a :class:`~timeeval.metrics.MetricSuite`. Either ``score`` or
+    ``exception`` is set. ``time`` is the computation time of the metric in seconds. Intermediate results that are
+    shared between metrics are accounted to the metric that requested them first."""
+    metric: Metric
+    score: Optional[float]
+    exception: Optional[Exception]
+    time: float = np.nan
+
+
+class MetricSuite:
+    """Computes multiple metrics for the same anomaly scoring.
+
+    In contrast to calling each :class:`~timeeval.metrics.Metric` on its own, the suite validates the inputs only
+    once (per validation type) and shares intermediate results, such as the sorted scores, the confusion matrices for
+    all thresholds, and the anomaly ranges, between the metrics (see :class:`~timeeval.metrics.MetricContext`). The
+    results are the same as calling the metrics directly.
+
+    Parameters
+    ----------
+    metrics : List[Metric]
+        The metrics to compute.
+    n_jobs : int
+        Number of threads used to compute the metrics concurrently. The default (1) computes the metrics sequentially.
+        Most metrics spend their time in NumPy routines that release the GIL, so that threads can speed up the
+        evaluation of multiple expensive metrics.
+
+    Examples
+    --------
+    >>> from timeeval.metrics import MetricSuite, RocAUC, PrAUC
+    >>> suite = MetricSuite([RocAUC(), PrAUC()])
+    >>> for result in suite.evaluate(y_true, y_score):
+    >>>     print(result.metric.name, result.score)
+    """
+
+    def __init__(self, metrics: List[Metric], n_jobs: int = 1) -> None:
+        self.metrics = metrics
+        self.n_jobs = n_jobs
+
+    def evaluate(self, y_true: Union[np.ndarray, LabelContext], y_score: np.ndarray) -> Iterator[MetricResult]:
+        """Lazily computes the metrics and returns their results in the configured order.
+
+        The inputs are validated without copying them (see :func:`~timeeval.metrics.Metric._validate_scores`). Pass a
+        :class:`~timeeval.metrics.LabelContext` instead of the labels to skip their validation and to share the
+        label-side structures with other evaluations of the same labels.
+
+        Exceptions are not raised but returned as part of the :class:`~timeeval.metrics.MetricResult`.
+        """
+        labels = y_true if isinstance(y_true, LabelContext) else None
+        true_labels = y_true.y_true if isinstance(y_true, LabelContext) else y_true
+        # metrics that validate the inputs the same way share the same context
+        contexts: Dict[Tuple[Any, bool], Union[MetricContext, Exception]] = {}
+
+        def validate(metric: Metric) -> MetricContext:
+            if labels is not None and type(metric)._validate_scores is Metric._validate_scores:
+                return MetricContext(true_labels, metric._validate_scoring(true_labels, np.asarray(y_score)), labels)
+            return MetricContext(*metric._validate_scores(true_labels, y_score), labels)
+
+        def get_context(metric: Metric) -> Union[MetricContext, Exception]:
+            key = (type(metric)._validate_scores, metric.supports_continuous_scorings())
+            if key not in contexts:
+                try:
+                    contexts[key] = validate(metric)
+                except Exception as e:
+                    contexts[key] = e
+            return contexts[key]
+
+        if self.n_jobs <= 1 or len(self.metrics) <= 1:
+            for metric in self.metrics:
+                yield _evaluate(metric, get_context(metric))
+        else:
+            jobs = [(metric, get_context(metric)) for metric in self.metrics]
+            with ThreadPoolExecutor(max_workers=min(self.n_jobs, len(jobs))) as pool:
+                yield from pool.map(lambda job: _evaluate(*job), jobs)
+
+
+def _evaluate(metric: Metric, context: Union[MetricContext, Exception]) -> MetricResult:
+    if isinstance(context, Exception):
+        return MetricResult(metric, None, context)
+    start = time.time()
+    try:
+        score = _score(metric, context)
+    except Exception as e:
+        return MetricResult(metric, None, e, time.time() - start)
+    return MetricResult(metric, score, None, time.time() - start)
+
+
+def _score(metric: Metric, context: MetricContext) -> float:
+    if context.is_constant:
+        warnings.warn("Cannot compute metric for a constant value in y_score, returning 0.0!")
+        return 0.
+    return metric.score_context(context)
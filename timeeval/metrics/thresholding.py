@@ -1,10 +1,19 @@
 import contextlib
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Any, Generator
+from collections import OrderedDict
+from typing import Optional, Any, Generator, Hashable, Tuple
 
 import numpy as np
 
+from .metric import _array_digest
+
+
+_PYTHRESH_CACHE_SIZE = 8
+_PYTHRESH_CACHE: "OrderedDict[Tuple[Hashable, Any], Tuple[float, np.ndarray]]" = OrderedDict()
+_PYTHRESH_CACHE_LOCK = threading.Lock()
+
 
 class ThresholdingStrategy(ABC):
     """Takes an anomaly scoring and ground truth labels to compute and apply a threshold to the scoring.
@@ -75,6 +84,16 @@ class ThresholdingStrategy(ABC):
         """Abstract method containing the actual code to determine the threshold. Must be overwritten by subclasses!"""
         ...
 
+    def cache_key(self) -> Hashable:
+        """Identifies the configuration of this strategy. Strategies with the same key compute the same threshold and
+        predictions for the same inputs, so that metrics can share them (see
+        :func:`~timeeval.metrics.MetricContext.predictions`).
+
+        The default implementation uses the type and the representation (``repr``) of the strategy. Subclasses must
+        overwrite this method if their representation does not contain their full configuration.
+        """
+        return type(self), repr(self)
+
 
 class NoThresholding(ThresholdingStrategy):
     """Special no-op strategy that checks for already existing binary labels and keeps them untouched. This allows
@@ -266,11 +285,30 @@ class TopKRangesThresholding(ThresholdingStrategy):
     def _count_anomaly_ranges(y_pred: np.ndarray) -> int:
         return int(np.sum(np.diff(np.r_[0, y_pred, 0]) == 1))
 
+    @staticmethod
+    def _count_anomaly_ranges_per_threshold(y_score: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+        """Counts the anomalous ranges of ``y_score >= t`` for all (unique, decreasing) thresholds ``t`` at once.
+
+        The number of ranges is the number of anomalous points minus the number of neighboring anomalous point pairs.
+        A point becomes anomalous at the position of its score in the thresholds and a pair at the position of the
+        lower score of both points.
+        """
+        n_thresholds = thresholds.shape[0]
+        # position of the first threshold that marks the point as anomalous (NaN-scores are never anomalous)
+        activation = n_thresholds - 1 - np.searchsorted(thresholds[::-1], y_score, side="left")
+        activation[np.isnan(y_score)] = n_thresholds
+        pair_activation = np.maximum(activation[:-1], activation[1:])
+        points = np.cumsum(np.bincount(activation, minlength=n_thresholds + 1)[:n_thresholds])
+        pairs = np.cumsum(np.bincount(pair_activation, minlength=n_thresholds + 1)[:n_thresholds])
+        counts: np.ndarray = points - pairs
+        return counts
+
     def find_threshold(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
         """Computes a threshold based on the number of expected anomalous subsequences / ranges (number of anomalies).
 
-        This method iterates over all possible thresholds from high to low to find the first threshold that yields `k`
-        or more continuous anomalous ranges.
+        This method searches all possible thresholds from high to low for the first threshold that yields `k` or more
+        continuous anomalous ranges. The number of ranges is computed for all thresholds at once in
+        :math:`O(n \\log n)`.
 
         If `k` is `None`, the ground truth data is used to calculate the real number of anomalies (anomalous ranges).
 
@@ -288,15 +326,15 @@ class TopKRangesThresholding(ThresholdingStrategy):
         """
         if self._k is None:
             self._k = self._count_anomaly_ranges(y_true)
-        thresholds: Tuple[float] = np.unique(y_score)[::-1]
-        t = thresholds[0]
-        y_pred = np.array(y_score >= t, dtype=np.int_)
-        # exclude minimum from thresholds, because all points are >= minimum!
-        for t in thresholds[1:-1]:
-            y_pred = np.array(y_score >= t, dtype=np.int_)
-            detected_n = self._count_anomaly_ranges(y_pred)
-            if detected_n >= self._k:
-                break
+        thresholds: np.ndarray = np.unique(y_score)[::-1]
+        if thresholds.shape[0] <= 2:
+            t: float = thresholds[0]
+            return t
+        detected_n = self._count_anomaly_ranges_per_threshold(y_score, thresholds)
+        # exclude maximum and minimum from thresholds, because all points are >= minimum!
+        candidates = np.flatnonzero(detected_n[1:-1] >= self._k)
+        idx = candidates[0] + 1 if candidates.shape[0] > 0 else thresholds.shape[0] - 2
+        t = thresholds[idx]
         return t
 
     def __str__(self) -> str:
@@ -424,6 +462,14 @@ class PyThreshThresholding(ThresholdingStrategy):
         ``_predictions`` and return them when calling
         :func:`~timeeval.metrics.thresholding.PyThreshThresholding.transform`.
 
+        Because PyThresh thresholders can be expensive, the results of the last few evaluations are memoized for the
+        whole process based on the thresholder configuration (see
+        :func:`~timeeval.metrics.thresholding.PyThreshThresholding.cache_key`) and a fingerprint of the scores.
+        Multiple metrics that use the same thresholder for the same scoring, thus, run it only once. Stochastic
+        thresholders without a fixed seed (``random_state=None``) and thresholders whose parameters are unknown are
+        not memoized; metrics evaluated together in a :class:`~timeeval.metrics.MetricSuite` still share their
+        predictions.
+
         Parameters
         ----------
         y_true : np.ndarray
@@ -437,15 +483,56 @@ class PyThreshThresholding(ThresholdingStrategy):
             Threshold computed by the internal thresholder.
         """
         y_score = self._make_finite(y_score)
+        config_key = self._config_key()
+        key = None if config_key is None or not self._is_seeded() else (config_key, _array_digest(y_score))
+        if key is not None:
+            with _PYTHRESH_CACHE_LOCK:
+                if key in _PYTHRESH_CACHE:
+                    _PYTHRESH_CACHE.move_to_end(key)
+                    cached_threshold, predictions = _PYTHRESH_CACHE[key]
+                    self._predictions = predictions.copy()
+                    return cached_threshold
 
         # fix seeding (depending on pythresh version) and if random_state is supplied
         with tmp_np_random_seed_pythresh(self._thresholder, self._random_state):
             # call PyThresh
-            self._predictions = self._thresholder.eval(y_score)
+            self._predictions = np.asarray(self._thresholder.eval(y_score))
             threshold: float = self._thresholder.thresh_
 
+        if key is not None:
+            with _PYTHRESH_CACHE_LOCK:
+                _PYTHRESH_CACHE[key] = (threshold, self._predictions.copy())
+                while len(_PYTHRESH_CACHE) > _PYTHRESH_CACHE_SIZE:
+                    _PYTHRESH_CACHE.popitem(last=False)
         return threshold
 
+    def cache_key(self) -> Hashable:
+        """Identifies the configuration by the type and the parameters (``get_params(deep=True)``) of the PyThresh
+        thresholder. If the parameters are not available or not comparable, the predictions are shared only between
+        metrics that use this strategy instance."""
+        config_key = self._config_key()
+        if config_key is None:
+            return type(self), id(self)
+        return config_key
+
+    def _config_key(self) -> Optional[Hashable]:
+        if not hasattr(self._thresholder, "get_params"):
+            return None
+        key = (type(self), type(self._thresholder), _freeze(self._thresholder.get_params(deep=True)),
+               _freeze(self._random_state))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _is_seeded(self) -> bool:
+        # thresholders with an unseeded (or stateful) RNG compute different results for the same scores
+        if isinstance(self._random_state, (int, np.integer)):
+            return True
+        params = self._thresholder.get_params(deep=False)
+        return "random_state" not in params or isinstance(params["random_state"], (int, np.integer))
+
     def transform(self, y_score: np.ndarray) -> np.ndarray:
         if self._predictions is not None:
             return self._predictions
@@ -459,6 +546,17 @@ class PyThreshThresholding(ThresholdingStrategy):
         return f"PyThreshThresholding(pythresh_thresholding={repr(self._thresholder)})"
 
 
+def _freeze(value: Any) -> Any:
+    """Converts parameter values into a hashable form that is compared by value."""
+    if isinstance(value, np.ndarray):
+        return _array_digest(value)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return dict, tuple(sorted(((k, _freeze(v)) for k, v in value.items()), key=lambda item: repr(item[0])))
+    return value
+
+
 @contextlib.contextmanager
 def tmp_np_random_seed_pythresh(thresholder: 'BaseThresholder', random_state: Any) -> Generator[None, None, None]:   # type: ignore
     import pythresh.version
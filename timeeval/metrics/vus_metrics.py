@@ -1,10 +1,118 @@
 from abc import ABC
-from typing import Optional, Tuple
+from typing import Callable, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from .metric import Metric
 
+if TYPE_CHECKING:
+    from .suite import LabelContext, MetricContext
+
+
+class _LabelSlopes(NamedTuple):
+    """Sparse form of extended anomaly labels (see :func:`RangeAucMetric._label_slopes`)."""
+    changed: np.ndarray
+    weights: np.ndarray
+    anomalies: np.ndarray
+    range_points: np.ndarray
+    range_offsets: np.ndarray
+
+
+class _RangeCurveEngine:
+    """Computes the range-based precision, recall, and FPR curves for many extended labelings of the same scoring.
+
+    All buffer-size-independent work (sorting the scores, sampling the thresholds, the true positives of the binary
+    labels, and the maximum score of each anomaly) is done once. Each extended labeling is given in sparse form as the
+    points whose label weight differs from the binary labels (the slopes, see :func:`RangeAucMetric._label_slopes`);
+    they are usually a small fraction of the time series.
+
+    A precomputed stable ascending ``order`` of the scores can be passed in to skip the sorting step.
+    """
+
+    def __init__(self, y_true: np.ndarray, y_score: np.ndarray,
+                 sample_thresholds: Callable[[np.ndarray, bool], np.ndarray],
+                 bounds: Tuple[np.ndarray, np.ndarray],
+                 order: Optional[np.ndarray] = None) -> None:
+        self.y_true = y_true.astype(np.float_)
+        self.y_score = y_score
+        self.length = y_score.shape[0]
+        self.p_true = np.sum(y_true)
+
+        # Sort the scores once. The points predicted as anomalous for a threshold t (y_score >= t) are then exactly
+        # the k(t) points with the highest scores, and the true positives are a prefix sum over the sorted labels.
+        if order is None:
+            order = np.argsort(y_score, kind="stable")
+        sorted_scores = y_score[order]
+        self.thresholds = sample_thresholds(sorted_scores, True)
+        self.n_pred = self.length - np.searchsorted(sorted_scores, self.thresholds, side="left")
+        # rank of each point in descending score order: a point is predicted anomalous iff rank < n_pred
+        self.rank = np.empty(self.length, dtype=np.int_)
+        self.rank[order[::-1]] = np.arange(self.length)
+        self.tp_true = np.r_[0, np.cumsum(self.y_true[order][::-1])][self.n_pred]
+        # the maximum score of the i-th anomaly of the binary labels is stored at index length + i, so that the range
+        # points of the extended labelings can refer to whole anomalies (see RangeAucMetric._slope_windows)
+        starts, ends = bounds
+        range_max_scores = np.empty(0, dtype=np.float_)
+        if starts.shape[0] > 0:
+            indices = np.c_[starts, ends].ravel()
+            range_max_scores = np.maximum.reduceat(y_score, indices[indices < self.length])[::2]
+        self.range_scores = np.r_[y_score, range_max_scores]
+
+    def _true_positives(self, changed: np.ndarray, delta: np.ndarray) -> np.ndarray:
+        # add the label weights of the slope points to the true positives of the binary labels
+        if changed.shape[0] == 0:
+            tp: np.ndarray = self.tp_true
+            return tp
+        changed_order = np.argsort(self.rank[changed], kind="stable")
+        changed_ranks = self.rank[changed][changed_order]
+        delta_cumsum = np.r_[0, np.cumsum(delta[changed_order])]
+        tp = self.tp_true + delta_cumsum[np.searchsorted(changed_ranks, self.n_pred, side="left")]
+        return tp
+
+    def _range_max_scores(self, range_points: np.ndarray, range_offsets: np.ndarray) -> np.ndarray:
+        """Computes the maximum score of the points with a positive label weight for each (extended) anomaly range.
+
+        The points of the i-th range are ``range_points[range_offsets[i]:range_offsets[i + 1]]``; they refer to single
+        points or, with indices from ``length`` on, to whole anomalies of the binary labels. Every range contains at
+        least one anomaly of the binary labels.
+        """
+        if range_offsets.shape[0] == 0:
+            return np.empty(0, dtype=np.float_)
+        max_scores: np.ndarray = np.maximum.reduceat(self.range_scores[range_points], range_offsets)
+        return max_scores
+
+    def range_pr_roc_auc(self, slopes: "_LabelSlopes", with_plotting: bool = False
+                         ) -> Tuple[float, float, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+        changed, weights, anomalies = slopes.changed, slopes.weights, slopes.anomalies
+        delta = weights - self.y_true[changed]
+        p = np.average([self.p_true, self.p_true + np.sum(delta)])
+        n = self.length - p
+        tp = self._true_positives(changed, delta)
+        fp = self.n_pred - tp
+
+        # An anomaly range is detected for all thresholds below the maximum score of its (weighted) anomalous points.
+        range_max_scores = self._range_max_scores(slopes.range_points, slopes.range_offsets)
+        range_max_scores.sort()
+        detected = range_max_scores.shape[0] - np.searchsorted(range_max_scores, self.thresholds, side="left")
+        existence_reward = detected / anomalies.shape[0]
+
+        recalls = np.zeros(self.thresholds.shape[0] + 2)  # tprs
+        fprs = np.zeros(self.thresholds.shape[0] + 2)
+        precisions = np.ones(self.thresholds.shape[0] + 1)
+
+        recalls[1:-1] = np.minimum(tp / p, 1) * existence_reward
+        fprs[1:-1] = np.minimum(fp / n, 1)
+        precisions[1:] = tp / self.n_pred
+        recalls[-1] = 1
+        fprs[-1] = 1
+
+        range_pr_auc: float = np.sum((recalls[1:-1] - recalls[:-2]) * (precisions[1:] + precisions[:-1]) / 2)
+        range_roc_auc: float = np.sum((fprs[1:] - fprs[:-1]) * (recalls[1:] + recalls[:-1]) / 2)
+
+        if with_plotting:
+            return range_pr_auc, range_roc_auc, (recalls[:-1], fprs[:-1], precisions)
+        return range_pr_auc, range_roc_auc, None
+
 
 class RangeAucMetric(Metric, ABC):
     """Base class for range-based area under the curve metrics.
@@ -13,7 +121,7 @@ class RangeAucMetric(Metric, ABC):
     See the subclasses' documentation for an explanation of the corresponding metric.
     """
 
-    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: int = 250):
+    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: Optional[int] = 250):
         self._buffer_size = buffer_size
         self._compat_mode = compatibility_mode
         self._max_samples = max_samples
@@ -30,15 +138,16 @@ class RangeAucMetric(Metric, ABC):
         ends = index[labels == -1]
         return starts, ends
 
-    def _extend_anomaly_labels(self, y_true: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """Extends the anomaly labels with slopes on both ends. Makes the labels continuous instead of binary."""
-        starts, ends = self.anomaly_bounds(y_true)
+    def _extend_anomaly_labels(self, y_true: np.ndarray, buffer_size: Optional[int] = None
+                               ) -> Tuple[np.ndarray, np.ndarray]:
+        """Extends the anomaly labels with slopes on both ends. Makes the labels continuous instead of binary.
 
-        if self._buffer_size is None:
-            # per default: set buffer size as median anomaly length:
-            self._buffer_size = int(np.median(ends - starts))
+        Uses the configured buffer size if ``buffer_size`` is not given.
+        """
+        starts, ends = self.anomaly_bounds(y_true)
+        buffer_size = self._resolve_buffer_size(y_true, buffer_size)
 
-        if self._buffer_size <= 1:
+        if buffer_size <= 1:
             if self._compat_mode:
                 anomalies = np.array(list(zip(starts, ends - 1)))
             else:
@@ -46,15 +155,15 @@ class RangeAucMetric(Metric, ABC):
             return y_true.astype(np.float_), anomalies
 
         y_true_cont = y_true.astype(np.float_)
-        slope_length = self._buffer_size // 2
+        slope_length = buffer_size // 2
         length = y_true_cont.shape[0]
         if self._compat_mode:
             for i, (s, e) in enumerate(zip(starts, ends)):
                 e -= 1
                 x1 = np.arange(e, min(e + slope_length, length))
-                y_true_cont[x1] += np.sqrt(1 - (x1 - e) / self._buffer_size)
+                y_true_cont[x1] += np.sqrt(1 - (x1 - e) / buffer_size)
                 x2 = np.arange(max(s - slope_length, 0), s)
-                y_true_cont[x2] += np.sqrt(1 - (s - x2) / self._buffer_size)
+                y_true_cont[x2] += np.sqrt(1 - (s - x2) / buffer_size)
             y_true_cont = np.clip(y_true_cont, 0, 1)
             starts, ends = self.anomaly_bounds(y_true_cont)
             anomalies = np.array(list(zip(starts, ends - 1)))
@@ -72,56 +181,173 @@ class RangeAucMetric(Metric, ABC):
                 anomalies[i] = [s0, e1]
         return y_true_cont, anomalies
 
-    def _uniform_threshold_sampling(self, y_score: np.ndarray) -> np.ndarray:
+    def _resolve_buffer_size(self, y_true: np.ndarray, buffer_size: Optional[int] = None,
+                             labels: Optional["LabelContext"] = None) -> int:
+        if buffer_size is None:
+            if self._buffer_size is None:
+                # per default: set buffer size as median anomaly length:
+                starts, ends = self._anomaly_bounds(y_true, labels)
+                self._buffer_size = int(np.median(ends - starts))
+            buffer_size = self._buffer_size
+        return buffer_size
+
+    def _anomaly_bounds(self, y_true: np.ndarray, labels: Optional["LabelContext"] = None
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        if labels is None:
+            return self.anomaly_bounds(y_true)
+        ranges = labels.anomaly_ranges
+        return ranges[:, 0], ranges[:, 1] + 1
+
+    def _label_slopes(self, y_true: np.ndarray, buffer_size: Optional[int] = None,
+                      labels: Optional["LabelContext"] = None) -> _LabelSlopes:
+        """Extends the anomaly labels (see :func:`RangeAucMetric._extend_anomaly_labels`) in sparse form: the indices
+        and label weights of all points whose weight differs from the binary labels, the extended anomaly ranges, and
+        the points of each range that determine its maximum score.
+
+        The result depends only on the labels and is, thus, cached in the ``labels`` context if given.
+        """
+        buffer_size = self._resolve_buffer_size(y_true, buffer_size, labels)
+        starts, ends = self._anomaly_bounds(y_true, labels)
+
+        if labels is None:
+            return self._slope_windows(y_true, starts, ends, buffer_size)
+        slopes: _LabelSlopes = labels.cached(
+            ("range_label_slopes", self._compat_mode, buffer_size),
+            lambda: self._slope_windows(y_true, starts, ends, buffer_size)
+        )
+        return slopes
+
+    def _slope_windows(self, y_true: np.ndarray, starts: np.ndarray, ends: np.ndarray, buffer_size: int
+                       ) -> _LabelSlopes:
+        """Computes the same extended labels as :func:`RangeAucMetric._extend_anomaly_labels`, but considers only the
+        slope windows of ``buffer_size//2`` points before and after each anomaly instead of the whole time series."""
+        length = y_true.shape[0]
+        range_ids = np.arange(starts.shape[0])
+        if buffer_size <= 1 or starts.shape[0] == 0:
+            anomalies = np.c_[starts, ends - 1] if self._compat_mode else np.c_[starts, ends]
+            # the (inclusive) end of the anomaly ranges in the default mode is never anomalous
+            return _LabelSlopes(np.empty(0, dtype=np.int_), np.empty(0, dtype=np.float_), anomalies,
+                                length + range_ids, range_ids)
+
+        slope_length = buffer_size // 2
+        if self._compat_mode:
+            start_distances = np.arange(1, slope_length + 1)
+            end_distances = np.arange(slope_length)
+            start_weights = np.sqrt(1 - start_distances / buffer_size)
+            end_weights = np.sqrt(1 - end_distances / buffer_size)
+        else:
+            start_distances = end_distances = np.arange(slope_length + 1)
+            start_weights = end_weights = np.linspace(1 / np.sqrt(2), 1, slope_length + 1)[::-1]
+        # all points of the slope windows (before the start and after the last point of each anomaly)
+        points = np.c_[starts[:, np.newaxis] - start_distances, ends[:, np.newaxis] - 1 + end_distances]
+        point_weights = np.broadcast_to(np.r_[start_weights, end_weights], points.shape)
+        point_ranges = np.broadcast_to(range_ids[:, np.newaxis], points.shape)
+        valid = (points >= 0) & (points < length)
+        points, point_weights, point_ranges = points[valid], point_weights[valid], point_ranges[valid]
+
+        # the label weights of the normal points in the windows: overlapping slopes are summed up (and clipped) in the
+        # compatibility mode, otherwise the maximum weight is used
+        normal = y_true[points] == 0
+        order = np.lexsort((point_weights[normal], points[normal]))
+        normal_points = points[normal][order]
+        normal_weights = point_weights[normal][order]
+        first = np.ones(normal_points.shape[0], dtype=np.bool_)
+        first[1:] = normal_points[1:] != normal_points[:-1]
+        changed = normal_points[first]
+        if changed.shape[0] == 0:
+            weights = normal_weights
+        elif self._compat_mode:
+            weights = np.minimum(np.add.reduceat(normal_weights, np.flatnonzero(first)), 1)
+        else:
+            weights = normal_weights[np.r_[first[1:], True]]
+
+        if self._compat_mode:
+            # anomalies whose extended ranges overlap or touch are merged
+            lo = np.maximum(starts - slope_length, 0)
+            hi = np.minimum(ends - 2 + slope_length, length - 1)
+            merged = np.r_[False, lo[1:] <= hi[:-1] + 1]
+            groups = np.cumsum(~merged) - 1
+            group_starts = np.flatnonzero(~merged)
+            anomalies = np.c_[lo[group_starts], hi[np.r_[group_starts[1:], range_ids.shape[0]] - 1]]
+            point_groups = groups[point_ranges]
+            range_groups = groups
+            extra_points = np.empty(0, dtype=np.int_)
+            extra_groups = np.empty(0, dtype=np.int_)
+        else:
+            anomalies = np.c_[np.maximum(starts - slope_length, 0), np.minimum(ends + slope_length, length)]
+            point_groups = point_ranges
+            range_groups = range_ids
+            # the (inclusive) end of the range is only considered if it is anomalous or lies in another slope
+            extra_points = anomalies[:, 1]
+            in_bounds = extra_points < length
+            extra_points, extra_groups = extra_points[in_bounds], range_ids[in_bounds]
+            is_changed = np.isin(extra_points, changed)
+            positive = is_changed | (y_true[extra_points] > 0)
+            extra_points, extra_groups = extra_points[positive], extra_groups[positive]
+
+        range_points = np.r_[points, length + range_ids, extra_points]
+        range_point_groups = np.r_[point_groups, range_groups, extra_groups]
+        order = np.argsort(range_point_groups, kind="stable")
+        range_offsets = np.searchsorted(range_point_groups[order], np.arange(anomalies.shape[0]))
+        return _LabelSlopes(changed, weights, anomalies, range_points[order], range_offsets)
+
+    def _uniform_threshold_sampling(self, y_score: np.ndarray, presorted: bool = False) -> np.ndarray:
         if self._compat_mode:
             n_samples = 250
+        elif self._max_samples is None:
+            n_samples = y_score.shape[0]
         else:
             n_samples = min(self._max_samples, y_score.shape[0])
-        thresholds: np.ndarray = np.sort(y_score)[::-1]
+        thresholds: np.ndarray = (y_score if presorted else np.sort(y_score))[::-1]
         thresholds = thresholds[np.linspace(0, thresholds.shape[0] - 1, n_samples, dtype=np.int_)]
         return thresholds
 
+    def _curve_engine(self, y_true: np.ndarray, y_score: np.ndarray,
+                      context: Optional["MetricContext"] = None) -> _RangeCurveEngine:
+        if context is None:
+            return _RangeCurveEngine(y_true, y_score, self._uniform_threshold_sampling, self.anomaly_bounds(y_true))
+        # share the engine (and the sort order of the context) with all range metrics using the same thresholds
+        engine: _RangeCurveEngine = context.cached(
+            ("range_curve_engine", self._compat_mode, self._max_samples),
+            lambda: _RangeCurveEngine(y_true, y_score, self._uniform_threshold_sampling,
+                                      self._anomaly_bounds(y_true, context.labels), order=context.argsort)
+        )
+        return engine
+
     def _range_pr_roc_auc_support(self,
                                   y_true: np.ndarray,
                                   y_score: np.ndarray,
-                                  with_plotting: bool = False
+                                  with_plotting: bool = False,
+                                  context: Optional["MetricContext"] = None
                                   ) -> Tuple[float, float, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
-        y_true_cont, anomalies = self._extend_anomaly_labels(y_true)
-        thresholds = self._uniform_threshold_sampling(y_score)
-        p = np.average([np.sum(y_true), np.sum(y_true_cont)])
-
-        recalls = np.zeros(thresholds.shape[0] + 2)  # tprs
-        fprs = np.zeros(thresholds.shape[0] + 2)
-        precisions = np.ones(thresholds.shape[0] + 1)
-
-        for i, t in enumerate(thresholds):
-            y_pred = y_score >= t
-            product = y_true_cont * y_pred
-            tp = np.sum(product)
-            # fp = np.dot((np.ones_like(y_pred) - y_true_cont).T, y_pred)
-            fp = np.sum(y_pred) - tp
-            n = len(y_pred) - p
-
-            existence_reward = [np.sum(product[s:e + 1]) > 0 for s, e in anomalies]
-            existence_reward = np.sum(existence_reward) / anomalies.shape[0]
-
-            recall = min(tp / p, 1) * existence_reward  # = tpr
-            fpr = min(fp / n, 1)
-            precision = tp / np.sum(y_pred)
-
-            recalls[i + 1] = recall
-            fprs[i + 1] = fpr
-            precisions[i + 1] = precision
-
-        recalls[-1] = 1
-        fprs[-1] = 1
-
-        range_pr_auc: float = np.sum((recalls[1:-1] - recalls[:-2]) * (precisions[1:] + precisions[:-1]) / 2)
-        range_roc_auc: float = np.sum((fprs[1:] - fprs[:-1]) * (recalls[1:] + recalls[:-1]) / 2)
-
-        if with_plotting:
-            return range_pr_auc, range_roc_auc, (recalls[:-1], fprs[:-1], precisions)
-        return range_pr_auc, range_roc_auc, None
+        engine = self._curve_engine(y_true, y_score, context)
+        slopes = self._label_slopes(y_true, labels=context.labels if context else None)
+        return engine.range_pr_roc_auc(slopes, with_plotting)
+
+    def _range_pr_roc_volume(self, y_true: np.ndarray, y_score: np.ndarray, max_buffer_size: int,
+                             context: Optional["MetricContext"] = None) -> Tuple[float, float]:
+        """Computes the range-based PR- and ROC-volume together for all buffer sizes from 0 to ``max_buffer_size``.
+
+        The scores are sorted and the thresholds are sampled only once for all buffer sizes. The results are cached in
+        the ``context`` if given, so that computing the other volume for the same context afterward is free.
+        """
+        if context is None:
+            return self._compute_volume(y_true, y_score, max_buffer_size)
+        volumes: Tuple[float, float] = context.cached(
+            ("range_volume", max_buffer_size, self._compat_mode, self._max_samples),
+            lambda: self._compute_volume(y_true, y_score, max_buffer_size, context)
+        )
+        return volumes
+
+    def _compute_volume(self, y_true: np.ndarray, y_score: np.ndarray, max_buffer_size: int,
+                        context: Optional["MetricContext"] = None) -> Tuple[float, float]:
+        engine = self._curve_engine(y_true, y_score, context)
+        prs = np.zeros(max_buffer_size + 1)
+        rocs = np.zeros(max_buffer_size + 1)
+        labels = context.labels if context else None
+        for bs in range(max_buffer_size + 1):
+            prs[bs], rocs[bs], _ = engine.range_pr_roc_auc(self._label_slopes(y_true, buffer_size=bs, labels=labels))
+        return float(np.sum(prs) / (max_buffer_size + 1)), float(np.sum(rocs) / (max_buffer_size + 1))
 
     def supports_continuous_scorings(self) -> bool:
         return True
@@ -158,15 +384,15 @@ class RangePrAUC(RangeAucMetric):
     compatibility_mode : bool
         When set to ``True``, produces exactly the same output as the metric implementation by the original authors.
         Otherwise, TimeEval uses a slightly improved implementation that fixes some bugs and uses linear slopes.
-    max_samples : int
-        Calculating precision and recall for many thresholds is quite slow. We, therefore, uniformly sample thresholds
-        from the available score space. This parameter controls the maximum number of thresholds; too low numbers
-        degrade the metrics' quality.
+    max_samples : Optional[int]
+        We uniformly sample thresholds from the available score space. This parameter controls the maximum number of
+        thresholds; too low numbers degrade the metrics' quality. Set it to ``None`` to use all anomaly scores as
+        thresholds.
     plot : bool
     plot_store : bool
     """
 
-    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: int = 250,
+    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: Optional[int] = 250,
                  plot: bool = False, plot_store: bool = False):
         super().__init__(buffer_size, compatibility_mode, max_samples)
         self._plot = plot
@@ -188,7 +414,13 @@ class RangePrAUC(RangeAucMetric):
         plt.show()
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        range_pr_auc, _, plotting_details = self._range_pr_roc_auc_support(y_true, y_score, with_plotting=self._plot)
+        return self._score(y_true, y_score)
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score(context.y_true, context.y_score, context)
+
+    def _score(self, y_true: np.ndarray, y_score: np.ndarray, context: Optional["MetricContext"] = None) -> float:
+        range_pr_auc, _, plotting_details = self._range_pr_roc_auc_support(y_true, y_score, self._plot, context)
         if self._plot and plotting_details is not None:
             self._plot_auc(range_pr_auc, plotting_details)
         return range_pr_auc
@@ -229,10 +461,10 @@ class RangeRocAUC(RangeAucMetric):
     compatibility_mode : bool
         When set to ``True``, produces exactly the same output as the metric implementation by the original authors.
         Otherwise, TimeEval uses a slightly improved implementation that fixes some bugs and uses linear slopes.
-    max_samples : int
-        Calculating precision and recall for many thresholds is quite slow. We, therefore, uniformly sample thresholds
-        from the available score space. This parameter controls the maximum number of thresholds; too low numbers
-        degrade the metrics' quality.
+    max_samples : Optional[int]
+        We uniformly sample thresholds from the available score space. This parameter controls the maximum number of
+        thresholds; too low numbers degrade the metrics' quality. Set it to ``None`` to use all anomaly scores as
+        thresholds.
     plot : bool
     plot_store : bool
 
@@ -241,7 +473,7 @@ class RangeRocAUC(RangeAucMetric):
     `https://en.wikipedia.org/wiki/Receiver_operating_characteristic <https://en.wikipedia.org/wiki/Receiver_operating_characteristic>`_ : Explanation of the ROC-curve.
     """
 
-    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: int = 250,
+    def __init__(self, buffer_size: Optional[int] = None, compatibility_mode: bool = False, max_samples: Optional[int] = 250,
                  plot: bool = False, plot_store: bool = False):
         super().__init__(buffer_size, compatibility_mode, max_samples)
         self._plot = plot
@@ -263,7 +495,13 @@ class RangeRocAUC(RangeAucMetric):
         plt.show()
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        _, range_auc_roc, plotting_details = self._range_pr_roc_auc_support(y_true, y_score, with_plotting=self._plot)
+        return self._score(y_true, y_score)
+
+    def score_context(self, context: "MetricContext") -> float:
+        return self._score(context.y_true, context.y_score, context)
+
+    def _score(self, y_true: np.ndarray, y_score: np.ndarray, context: Optional["MetricContext"] = None) -> float:
+        _, range_auc_roc, plotting_details = self._range_pr_roc_auc_support(y_true, y_score, self._plot, context)
         if self._plot and plotting_details is not None:
             self._plot_auc(range_auc_roc, plotting_details)
         return range_auc_roc
@@ -285,6 +523,10 @@ class RangePrVUS(RangeAucMetric):
     This metric includes similar changes as :class:`~timeeval.metrics.RangePrAUC`, which can be disabled using the
     ``compatibility_mode`` parameter.
 
+    The PR- and ROC-volumes are computed together and shared via the :class:`~timeeval.metrics.MetricContext`.
+    Computing this metric together with :class:`~timeeval.metrics.RangeRocVUS` (same parameters) in a
+    :class:`~timeeval.metrics.MetricSuite`, thus, does not increase the runtime.
+
     Parameters
     ----------
     max_buffer_size : int
@@ -293,10 +535,10 @@ class RangePrVUS(RangeAucMetric):
     compatibility_mode : bool
         When set to ``True``, produces exactly the same output as the metric implementation by the original authors.
         Otherwise, TimeEval uses a slightly improved implementation that fixes some bugs and uses linear slopes.
-    max_samples : int
-        Calculating precision and recall for many thresholds is quite slow. We, therefore, uniformly sample thresholds
-        from the available score space. This parameter controls the maximum number of thresholds; too low numbers
-        degrade the metrics' quality.
+    max_samples : Optional[int]
+        We uniformly sample thresholds from the available score space. This parameter controls the maximum number of
+        thresholds; too low numbers degrade the metrics' quality. Set it to ``None`` to use all anomaly scores as
+        thresholds.
 
     See Also
     --------
@@ -304,17 +546,16 @@ class RangePrVUS(RangeAucMetric):
         Area under the curve version using a single buffer size.
     """
 
-    def __init__(self, max_buffer_size: int = 500, compatibility_mode: bool = False, max_samples: int = 250):
+    def __init__(self, max_buffer_size: int = 500, compatibility_mode: bool = False, max_samples: Optional[int] = 250):
         super().__init__(None, compatibility_mode, max_samples)
         self._max_buffer_size = max_buffer_size
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        prs = np.zeros(self._max_buffer_size + 1)
-        for bs in np.arange(0, self._max_buffer_size + 1):
-            self._buffer_size = bs
-            pr_auc, _, _ = self._range_pr_roc_auc_support(y_true, y_score)
-            prs[bs] = pr_auc
-        range_pr_volume: float = np.sum(prs) / (self._max_buffer_size + 1)
+        range_pr_volume, _ = self._range_pr_roc_volume(y_true, y_score, self._max_buffer_size)
+        return range_pr_volume
+
+    def score_context(self, context: "MetricContext") -> float:
+        range_pr_volume, _ = self._range_pr_roc_volume(context.y_true, context.y_score, self._max_buffer_size, context)
         return range_pr_volume
 
     @property
@@ -334,6 +575,10 @@ class RangeRocVUS(RangeAucMetric):
     This metric includes similar changes as :class:`~timeeval.metrics.RangeRocAUC`, which can be disabled using the
     ``compatibility_mode`` parameter.
 
+    The PR- and ROC-volumes are computed together and shared via the :class:`~timeeval.metrics.MetricContext`.
+    Computing this metric together with :class:`~timeeval.metrics.RangePrVUS` (same parameters) in a
+    :class:`~timeeval.metrics.MetricSuite`, thus, does not increase the runtime.
+
     Parameters
     ----------
     max_buffer_size : int
@@ -342,10 +587,10 @@ class RangeRocVUS(RangeAucMetric):
     compatibility_mode : bool
         When set to ``True``, produces exactly the same output as the metric implementation by the original authors.
         Otherwise, TimeEval uses a slightly improved implementation that fixes some bugs and uses linear slopes.
-    max_samples : int
-        Calculating precision and recall for many thresholds is quite slow. We, therefore, uniformly sample thresholds
-        from the available score space. This parameter controls the maximum number of thresholds; too low numbers
-        degrade the metrics' quality.
+    max_samples : Optional[int]
+        We uniformly sample thresholds from the available score space. This parameter controls the maximum number of
+        thresholds; too low numbers degrade the metrics' quality. Set it to ``None`` to use all anomaly scores as
+        thresholds.
 
     See Also
     --------
@@ -362,18 +607,17 @@ class RangeRocVUS(RangeAucMetric):
        15(11): 2774 - 2787, 2022. doi:`10.14778/3551793.3551830 <https://doi.org/10.14778/3551793.3551830>`_
     """
 
-    def __init__(self, max_buffer_size: int = 500, compatibility_mode: bool = False, max_samples: int = 250):
+    def __init__(self, max_buffer_size: int = 500, compatibility_mode: bool = False, max_samples: Optional[int] = 250):
         super().__init__(None, compatibility_mode, max_samples)
         self._max_buffer_size = max_buffer_size
 
     def score(self, y_true: np.ndarray, y_score: np.ndarray) -> float:
-        rocs = np.zeros(self._max_buffer_size + 1)
-        for bs in np.arange(0, self._max_buffer_size + 1):
-            self._buffer_size = bs
-            _, roc_auc, _ = self._range_pr_roc_auc_support(y_true, y_score)
-            rocs[bs] = roc_auc
-        range_pr_volume: float = np.sum(rocs) / (self._max_buffer_size + 1)
-        return range_pr_volume
+        _, range_roc_volume = self._range_pr_roc_volume(y_true, y_score, self._max_buffer_size)
+        return range_roc_volume
+
+    def score_context(self, context: "MetricContext") -> float:
+        _, range_roc_volume = self._range_pr_roc_volume(context.y_true, context.y_score, self._max_buffer_size, context)
+        return range_roc_volume
 
     @property
     def name(self) -> str:
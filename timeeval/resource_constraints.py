@@ -31,6 +31,7 @@ Examples
 """
 DEFAULT_TASKS_PER_HOST = 1
 DEFAULT_TIMEOUT = Duration("8 hours")
+DEFAULT_DATASET_CACHE_SIZE = 2 * GB
 
 
 @dataclass
@@ -49,7 +50,8 @@ class ResourceConstraints:
         Specify, how many evaluation tasks are executed on each host. This setting influences the default memory and
         CPU limits if :attr:`~timeeval.ResourceConstraints.task_memory_limit` and
         :attr:`~timeeval.ResourceConstraints.task_cpu_limit` are ``None``: the available
-        resources of the node are shared equally between the tasks.
+        resources of the node are shared equally between the tasks. In non-distributed mode, TimeEval uses a local pool
+        of ``tasks_per_host`` worker processes to evaluate the experiments in parallel.
 
         Because each tasks, in effect, trains or executes a time series anomaly detection algorithm, the tasks are
         resource-intensive, which means that over-provisioning is not useful and could decrease overall performance. If
@@ -77,6 +79,28 @@ class ResourceConstraints:
         If this option is enabled (default) and an algorithm exceeds the execution timeout, TimeEval will look for any
         preliminary result. This allows the evaluation of progressive algorithms that output a rough result, refine it
         over time, and would otherwise run into the execution timeout.
+    parallel_metrics : bool
+        If this option is enabled, TimeEval computes the metrics of each experiment concurrently using a pool of
+        threads. The number of threads is bounded by the CPU limit of the task (see
+        :func:`~timeeval.ResourceConstraints.get_metric_workers`). Per default, the metrics are computed sequentially.
+        This option does not limit the algorithms and can be used with any algorithm adapter.
+    resource_usage_interval : Optional[Duration]
+        If this option is set, TimeEval samples the resource usage of each algorithm container in this interval and
+        adds the peak and mean memory usage (in Bytes), the CPU time, the mean CPU utilization (in CPUs), the throttled
+        CPU time, and the block I/O (in Bytes) of the training and execution to the results (e.g.,
+        ``execute_peak_memory``). The measurements use the Docker stats API, which provides new values about every
+        second, so shorter intervals have no effect. Per default, the resource usage is not measured. This option does
+        not limit the algorithms and can be used with any algorithm adapter, but just the
+        :class:`~timeeval.adapters.docker.DockerAdapter` reports the usage. Runs in warm containers and batches
+        executed in a single container serve multiple experiments and, thus, report no usage.
+    resource_usage_series : bool
+        If this option is enabled in addition to :attr:`~timeeval.ResourceConstraints.resource_usage_interval`, all
+        samples are stored in the file ``docker-resource-usage.csv`` in the results folder of each experiment.
+    dataset_cache_size : Optional[int]
+        Specify the maximum size in Bytes of the datasets that each task (worker process) keeps in its dataset cache
+        (see :class:`~timeeval.utils.dataset_cache.DatasetCache`). Per default, the size is derived from the memory
+        limit of the task (see :func:`~timeeval.ResourceConstraints.get_dataset_cache_size`). This option does not
+        limit the algorithms and can be used with any algorithm adapter.
     """
 
     tasks_per_host: int = DEFAULT_TASKS_PER_HOST
@@ -86,6 +110,10 @@ class ResourceConstraints:
     execute_timeout: Duration = DEFAULT_TIMEOUT
     use_preliminary_model_on_train_timeout: bool = True
     use_preliminary_scores_on_execute_timeout: bool = True
+    parallel_metrics: bool = False
+    resource_usage_interval: Optional[Duration] = None
+    resource_usage_series: bool = False
+    dataset_cache_size: Optional[int] = None
 
     def get_compute_resource_limits(self,
                                     memory_overwrite: Optional[int] = None,
@@ -141,6 +169,36 @@ class ResourceConstraints:
 
         return memory_limit, cpu_limit
 
+    def get_metric_workers(self) -> int:
+        """Returns the number of threads used to compute the metrics of a single task.
+
+        If :attr:`~timeeval.ResourceConstraints.parallel_metrics` is enabled, this is the number of whole CPUs of the
+        task's CPU limit (at least 1, see :func:`~timeeval.ResourceConstraints.get_compute_resource_limits`).
+        Otherwise, the metrics are computed sequentially using a single thread.
+
+        .. attention::
+            Must be called on the node that will execute the task!
+        """
+        if not self.parallel_metrics:
+            return 1
+        _, cpu_limit = self.get_compute_resource_limits()
+        return max(1, int(cpu_limit))
+
+    def get_dataset_cache_size(self) -> int:
+        """Returns the maximum size of the dataset cache of a single task in Bytes.
+
+        If :attr:`~timeeval.ResourceConstraints.dataset_cache_size` is not set, each task caches up to 2 GB but at
+        most a quarter of its memory limit (see :func:`~timeeval.ResourceConstraints.get_compute_resource_limits`), so
+        that the caches of all tasks of a node share its memory like the tasks themselves.
+
+        .. attention::
+            Must be called on the node that will execute the task!
+        """
+        if self.dataset_cache_size is not None:
+            return self.dataset_cache_size
+        memory_limit, _ = self.get_compute_resource_limits()
+        return min(DEFAULT_DATASET_CACHE_SIZE, memory_limit // 4)
+
     def get_train_timeout(self, timeout_overwrite: Optional[Duration] = None) -> Duration:
         """Returns the maximum runtime of a training task in seconds.
 
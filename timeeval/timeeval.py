@@ -1,5 +1,7 @@
+import dataclasses
 import datetime as dt
 import logging
+import shutil
 import signal
 import socket
 import subprocess
@@ -7,17 +9,22 @@ from enum import Enum
 from pathlib import Path
 from time import time
 from types import FrameType
-from typing import Callable, List, Tuple, Dict, Optional, Any, Union, Mapping
+from collections import deque
+from concurrent.futures import Future as ConcurrentFuture, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Tuple, Dict, Optional, Any, Mapping, Deque, Iterator
 
 import numpy as np
 import pandas as pd
 import tqdm
 from distributed.client import Future
 from joblib import Parallel, delayed
+from joblib.externals.loky import get_reusable_executor
 
-from ._core.experiments import Experiments, Experiment
+from ._core.experiments import Experiments, Experiment, ExperimentBatch, batch_experiments
 from ._core.remote import Remote, RemoteConfiguration
+from ._core.results import ResultsStore
 from ._core.times import Times
+from .adapters.base import ResourceUsage
 from .adapters.docker import DockerTimeoutError, DockerMemoryError, DockerAdapter
 from .adapters.multivar import MultivarAdapter
 from .algorithm import Algorithm
@@ -27,8 +34,10 @@ from .datasets import Datasets
 from .integration import TimeEvalModule
 from .metrics import Metric, DefaultMetrics
 from .params import BayesianParameterSearch
-from .resource_constraints import ResourceConstraints
+from .resource_constraints import ResourceConstraints, DEFAULT_TASKS_PER_HOST
+from .utils.datasets import CSV_DATASET_CACHE
 from .utils.encode_params import dumps_params
+from .utils.scores import ScoresFormat
 from .utils.tqdm_joblib import tqdm_joblib
 
 
@@ -43,6 +52,78 @@ class Status(Enum):
     OOM = 3
 
 
+MAX_PENDING_TASKS_PER_WORKER = 16
+"""Number of submitted but not yet finished evaluation tasks per worker.
+
+TimeEval consumes the stream of experiments in bounded batches: new tasks are created and submitted only if less than
+``MAX_PENDING_TASKS_PER_WORKER`` tasks per worker are pending.
+"""
+
+DEFAULT_PREPARE_JOBS = 4
+"""Default number of algorithm prepare steps, such as Docker image pulls, that run concurrently per host."""
+
+
+def _evaluate_experiment(exp: Experiment) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    # executed in a local worker process; exceptions are returned to record them in the main process
+    try:
+        return exp.evaluate(), None
+    except Exception as e:
+        return None, e
+
+
+def _evaluate_batch(batch: ExperimentBatch) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    # executed in a local worker process
+    return batch.evaluate()
+
+
+def _batch_outcome(outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]], i: int) -> Dict[str, Any]:
+    # executed remotely to get a separate future for each experiment of a batch
+    result, error = outcomes[i]
+    if error is not None:
+        raise error
+    assert result is not None
+    return result
+
+
+def _completed_future(outcome: Tuple[Optional[Dict[str, Any]], Optional[Exception]]) -> ConcurrentFuture:
+    future: ConcurrentFuture = ConcurrentFuture()
+    future.set_result(outcome)
+    return future
+
+
+def _run_prepare_steps(steps: List[Callable[[], None]], n_jobs: int,
+                       progress_bar: Optional[tqdm.tqdm] = None) -> Dict[str, float]:
+    """Runs the prepare steps concurrently using up to ``n_jobs`` threads and returns their runtimes in seconds.
+
+    The prepare steps, such as pulling Docker images, mostly wait for I/O, so that threads suffice. The first exception
+    of a step is re-raised after all running steps finished.
+    """
+    def timed(step: Callable[[], None]) -> float:
+        start = time()
+        step()
+        return time() - start
+
+    durations: Dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(n_jobs, len(steps)))) as executor:
+        futures = {executor.submit(timed, step): step for step in steps}
+        for future in as_completed(futures):
+            durations[repr(futures[future])] = future.result()
+            if progress_bar is not None:
+                progress_bar.update()
+    return durations
+
+
+def _split_batch_future(future: ConcurrentFuture, n: int) -> List[ConcurrentFuture]:
+    futures: List[ConcurrentFuture] = [ConcurrentFuture() for _ in range(n)]
+
+    def split(f: ConcurrentFuture) -> None:
+        for item, outcome in zip(futures, f.result()):
+            item.set_result(outcome)
+
+    future.add_done_callback(split)
+    return futures
+
+
 class TimeEval:
     """Main class of TimeEval.
 
@@ -110,6 +191,9 @@ class TimeEval:
     distributed : bool
         Run TimeEval in distributed mode.
         In this case, you **should** also supply a ``remote_config``.
+        In non-distributed mode, TimeEval executes the experiments locally. If
+        :attr:`~timeeval.ResourceConstraints.tasks_per_host` is greater than 1, the experiments are evaluated in parallel
+        using a pool of ``tasks_per_host`` worker processes.
     remote_config : Optional[RemoteConfiguration]
         Configuration of the Dask cluster used for distributed execution of TimeEval.
         See :class:`~timeeval.RemoteConfiguration` for details.
@@ -158,7 +242,7 @@ class TimeEval:
         Supply a path to an experiment combinations CSV-File.
         Using this file, you can specify explicitly which combinations of algorithms, datasts, and hyperparameters
         should be executed.
-        The file should contain CSV data with a single header line and four columns with the following names:
+        The file should contain CSV data with a single header line and (at least) four columns with the following names:
 
         1. `algorithm` - name of the algorithm
         2. `collection` - name of the dataset collection
@@ -167,6 +251,30 @@ class TimeEval:
 
         Only experiments that are present in the TimeEval configuration **and** this file are scheduled and executed.
         This allows you to circumvent the cross-product that TimeEval will perform in its default configuration.
+        Instead of CSV, the file can also be stored in the Parquet (``.parquet``) or Feather (``.feather``) format
+        (requires `pyarrow <https://arrow.apache.org/docs/python>`_).
+    resume_from : Optional[Path]
+        Supply the path to the results directory of a previous (e.g. interrupted) TimeEval run, e.g.
+        ``results/2023_01_01_12_00_00``, to resume this run.
+        TimeEval then uses this directory as its results path instead of creating a new one in ``results_path``.
+        Experiments that already completed successfully in the previous run (their ``metrics.csv``-file contains all
+        configured metrics) are not executed again; their results are read from the experiment directories instead.
+        Only missing or failed experiments are scheduled, and the ``results.csv``-file is rebuilt with the results of all
+        experiments.
+
+        .. note::
+            In distributed mode, the experiment results of the previous run must be available on the local host.
+            Use :func:`~timeeval.TimeEval.rsync_results_from` to fetch them from the remote machines first.
+    scores_format : Optional[ScoresFormat]
+        Configures the file format of the persisted anomaly scores (``raw_anomaly_scores`` and ``anomaly_scores``) of
+        each experiment. Per default, the scores are stored as newline-separated text (``.ts``-files). Use
+        ``ScoresFormat(binary=True)`` to store them in the compact binary NumPy format (``.npy``-files) instead. See
+        :class:`~timeeval.utils.scores.ScoresFormat` for all options and :func:`~timeeval.utils.scores.load_scores` to
+        read the scores back in any format.
+    n_prepare_jobs : int
+        Maximum number of algorithm prepare steps, such as pulling Docker images, that run concurrently (per host) in
+        the PREPARE phase. Identical prepare steps, e.g., the pulls of the same image and tag by several algorithms, are
+        executed only once.
     module_configs : Mapping[str, Any], optional
         Use this parameter to pass additional configuration options for automatically loaded TimeEval modules. This is
         currently used only for the implementation of the Bayesian hyperparameter optimization prozedure using Optuna.
@@ -205,6 +313,9 @@ class TimeEval:
     - execute_preprocess_time: if :func:`~timeeval.Algorithm.preprocess` is defined
     - execute_main_time: always
     - execute_postprocess_time: if :func:`~timeeval.Algorithm.postprocess` is defined
+
+    In addition, TimeEval records the computation time of each metric in the column ``<metric name>_time`` (e.g.
+    ``ROC_AUC_time``).
     """
 
     DEFAULT_RESULT_PATH = Path("./results")
@@ -230,13 +341,19 @@ class TimeEval:
                  force_dimensionality_match: bool = False,
                  n_jobs: int = -1,
                  experiment_combinations_file: Optional[Path] = None,
-                 module_configs: Mapping[str, Any] = {}) -> None:
+                 module_configs: Mapping[str, Any] = {},
+                 resume_from: Optional[Path] = None,
+                 scores_format: Optional[ScoresFormat] = None,
+                 n_prepare_jobs: int = DEFAULT_PREPARE_JOBS) -> None:
         assert len(datasets) > 0, "No datasets given for evaluation!"
         assert len(algorithms) > 0, "No algorithms given for evaluation!"
         assert repetitions > 0, "Negative or 0 repetitions are not supported!"
         assert n_jobs >= -1, f"n_jobs={n_jobs} not supported (must be >= -1)!"
+        assert n_prepare_jobs > 0, f"n_prepare_jobs={n_prepare_jobs} not supported (must be > 0)!"
         if experiment_combinations_file is not None:
             assert experiment_combinations_file.exists(), "Experiment combination file not found!"
+        if resume_from is not None:
+            assert resume_from.is_dir(), "Results directory of the run to resume not found!"
         if remote_config:
             assert len(remote_config.worker_hosts) > 0, "At least one worker is required to execute experiments!"
 
@@ -251,36 +368,51 @@ class TimeEval:
                                              f"{', '.join(not_found_datasets)}"
 
         limits = resource_constraints or ResourceConstraints.default_constraints()
-        if limits != ResourceConstraints.default_constraints():
+        # the number of tasks per host, the metric parallelism, the resource usage measurements, and the dataset cache
+        # size do not limit the algorithms and can be used with any algorithm adapter
+        unlimited = dataclasses.replace(limits, tasks_per_host=DEFAULT_TASKS_PER_HOST, parallel_metrics=False,
+                                        resource_usage_interval=None, resource_usage_series=False,
+                                        dataset_cache_size=None)
+        if unlimited != ResourceConstraints.default_constraints():
             incompatible_algos = [a.name for a in algorithms if not isinstance(a.main, DockerAdapter) and not (isinstance(a.main, MultivarAdapter) and isinstance(a.main._adapter, DockerAdapter))]
             assert len(incompatible_algos) == 0, "The following algorithms won't satisfy the specified resource " \
                                                  f"constraints: {', '.join(incompatible_algos)}. Either drop the " \
                                                  "resource constraints or use the DockerAdapter for all algorithms!"
 
         self.log = logging.getLogger(self.__class__.__name__)
-        start_date: str = dt.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        self.results_path = results_path.resolve() / start_date
+        if resume_from is not None:
+            self.results_path = resume_from.resolve()
+        else:
+            start_date: str = dt.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            self.results_path = results_path.resolve() / start_date
+        self.resume = resume_from is not None
         self.disable_progress_bar = disable_progress_bar
         if metrics is None:
             self.metrics: List[Metric] = DefaultMetrics.default_list()
         else:
             self.metrics = metrics
         self.metric_names = [m.name for m in self.metrics]
-        self.results = pd.DataFrame(columns=TimeEval.RESULT_KEYS + self.metric_names)
+        self.metric_time_names = [f"{name}_time" for name in self.metric_names]
         self.distributed = distributed
         self.n_jobs = n_jobs
+        self.n_prepare_jobs = n_prepare_jobs
 
         self.log.info(f"Results are recorded in the directory {self.results_path}")
         self.results_path.mkdir(parents=True, exist_ok=True)
+        # results.csv is streamed during the run and must contain all columns of the final results from the start
+        result_columns = TimeEval.RESULT_KEYS + self.metric_names + Times.result_keys() + self.metric_time_names
+        if limits.resource_usage_interval is not None:
+            result_columns += ResourceUsage.result_keys()
+        self._results = ResultsStore(list(dict.fromkeys(result_columns)),
+                                     stream_path=self.results_path / RESULTS_CSV,
+                                     transient_columns=["future_result"])
 
         if not distributed and limits.tasks_per_host > 1:
-            self.log.warning(
-                f"`tasks_per_host` was set to {limits.tasks_per_host}. However, non-distributed "
-                "execution of TimeEval does currently not support parallelism! Reducing `tasks_per_host` to 1. "
-                "The automatic resource limitation will reflect this by increasing the limits for the single task. "
-                "Explicitly set constraints to limit the resources for local executions of TimeEval."
+            self.log.info(
+                f"`tasks_per_host` was set to {limits.tasks_per_host}. Executing the experiments locally using a pool "
+                f"of {limits.tasks_per_host} worker processes. The automatic resource limitation shares the resources "
+                "of this machine equally between the workers."
             )
-            limits.tasks_per_host = 1
 
         # load necessary modules:
         self.modules: Dict[str, TimeEvalModule] = {}
@@ -303,7 +435,8 @@ class TimeEval:
                                 force_training_type_match=force_training_type_match,
                                 force_dimensionality_match=force_dimensionality_match,
                                 metrics=self.metrics,
-                                experiment_combinations_file=experiment_combinations_file)
+                                experiment_combinations_file=experiment_combinations_file,
+                                scores_format=scores_format or ScoresFormat())
         assert len(self.exps) != 0, "No valid experiments configured! Please check that the input dimensionality and " \
                                     "training type of algorithms and datasets match. You can use the parameters "\
                                     "``skip_invalid_combinations``, ``force_training_type_match``, "\
@@ -318,7 +451,6 @@ class TimeEval:
             self.log.info("TimeEval is running in distributed environment, setting up remoting ...")
             self.remote = Remote(disable_progress_bar=self.disable_progress_bar, remote_config=self.remote_config,
                                  resource_constraints=limits)
-            self.results["future_result"] = np.nan
 
             self.log.info("... registering signal handlers ...")
             orig_handler: Callable[[int, Optional[FrameType]], Any] = signal.getsignal(signal.SIGINT)  # type: ignore
@@ -334,47 +466,161 @@ class TimeEval:
             self.log.info("... remoting setup done.")
 
     def _run(self) -> None:
+        if not self.distributed and self.exps.resource_constraints.tasks_per_host > 1:
+            self._run_parallel()
+            return
+
         desc = "Submitting evaluation tasks" if self.distributed else "Evaluating"
-        for exp in tqdm.tqdm(self.exps, desc=desc, disable=self.disable_progress_bar):
+        max_pending = (len(self.remote_config.worker_hosts) * self.exps.resource_constraints.tasks_per_host
+                       * MAX_PENDING_TASKS_PER_WORKER)
+        experiments = tqdm.tqdm(self.exps, desc=desc, disable=self.disable_progress_bar)
+        for batch in batch_experiments(exp for exp in experiments if not self._record_previous_result(exp)):
+            if len(batch) > 1:
+                self._run_batch(batch, max_pending)
+                continue
+
+            exp = batch[0]
             try:
                 future_result: Optional[Future] = None
                 result: Optional[Dict[str, Any]] = None
 
-                if exp.algorithm.training_type in [TrainingType.SUPERVISED, TrainingType.SEMI_SUPERVISED]:
-                    if exp.resolved_train_dataset_path is None:
-                        # Intentionally raise KeyError here if no training dataset is specified.
-                        # The Error will be caught by the except clause below.
-                        raise KeyError("Path to training dataset not found!")
-
-                    # This check is not necessary for unsupervised algorithms, because they can be executed on all
-                    # datasets.
-                    if exp.algorithm.training_type != exp.dataset.training_type:
-                        raise ValueError(f"Dataset training type ({exp.dataset.training_type}) incompatible to "
-                                         f"algorithm training type ({exp.algorithm.training_type})!")
-
-                if (exp.algorithm.input_dimensionality == InputDimensionality.UNIVARIATE and
-                        exp.dataset.input_dimensionality == InputDimensionality.MULTIVARIATE):
-                    raise ValueError(f"Dataset input dimensionality ({exp.dataset.input_dimensionality}) incompatible "
-                                     f"to algorithm input dimensionality ({exp.algorithm.input_dimensionality})!")
-
+                self._check_experiment(exp)
                 if self.distributed:
+                    self.remote.wait_for_pending(max_pending)
                     future_result = self.remote.add_task(exp.evaluate, key=exp.name)
                 else:
                     result = exp.evaluate()
                 self._record_results(exp, result=result, future_result=future_result)
 
-            except DockerTimeoutError as e:
-                self.log.exception(f"Evaluation of {exp.algorithm.name} on the dataset {exp.dataset} timed out.")
-                result = {m: np.nan for m in self.metric_names}
-                self._record_results(exp, result=result, status=Status.TIMEOUT, error_message=repr(e))
-            except DockerMemoryError as e:
-                self.log.exception(f"Evaluation of {exp.algorithm.name} on the dataset {exp.dataset} exceeded its memory limit (OOM).")
-                result = {m: np.nan for m in self.metric_names}
-                self._record_results(exp, result=result, status=Status.OOM, error_message=repr(e))
             except Exception as e:
-                self.log.exception(f"Exception occurred during the evaluation of {exp.algorithm.name} on the dataset {exp.dataset}.")
-                result = {m: np.nan for m in self.metric_names}
-                self._record_results(exp, result=result, status=Status.ERROR, error_message=repr(e))
+                self._record_exception(exp, e)
+
+    def _checked_experiments(self, batch: List[Experiment]) -> List[Experiment]:
+        # records the experiments that cannot be executed and returns the others
+        experiments = []
+        for exp in batch:
+            try:
+                self._check_experiment(exp)
+                experiments.append(exp)
+            except Exception as e:
+                self._record_exception(exp, e)
+        return experiments
+
+    def _run_batch(self, batch: List[Experiment], max_pending: int) -> None:
+        experiments = self._checked_experiments(batch)
+        if not experiments:
+            return
+
+        experiment_batch = ExperimentBatch(experiments)
+        if self.distributed:
+            self.remote.wait_for_pending(max_pending)
+            future = self.remote.add_task(experiment_batch.evaluate, key=experiment_batch.name)
+            for i, exp in enumerate(experiments):
+                self._record_results(exp, future_result=self.remote.add_task(_batch_outcome, future, i, key=exp.name))
+        else:
+            for exp, (result, error) in zip(experiments, experiment_batch.evaluate()):
+                if error is None:
+                    self._record_results(exp, result=result)
+                else:
+                    self._record_exception(exp, error)
+
+    def _run_parallel(self) -> None:
+        n_workers = self.exps.resource_constraints.tasks_per_host
+        max_pending = n_workers * MAX_PENDING_TASKS_PER_WORKER
+        self.log.debug(f"Evaluating {len(self.exps)} experiments locally using {n_workers} worker processes")
+        executor = get_reusable_executor(max_workers=n_workers)
+        progress_bar = tqdm.tqdm(desc=f"Evaluating ({n_workers} workers)", total=len(self.exps),
+                                 disable=self.disable_progress_bar)
+        # experiments are consumed lazily from the stream and recorded in the same order as in the sequential execution
+        pending: Deque[Tuple[Experiment, ConcurrentFuture]] = deque()
+
+        def record_next() -> None:
+            exp, outcome = pending.popleft()
+            result, error = outcome.result()
+            if error is None:
+                self._record_results(exp, result=result)
+            else:
+                self._record_exception(exp, error)
+
+        def unfinished_experiments() -> Iterator[Experiment]:
+            for exp in self.exps:
+                previous_result = exp.load_previous_result() if self.resume else None
+                if previous_result is None:
+                    yield exp
+                else:
+                    pending.append((exp, _completed_future((previous_result, None))))
+                    progress_bar.update()
+
+        with progress_bar:
+            for batch in batch_experiments(unfinished_experiments()):
+                experiments = []
+                for exp in batch:
+                    try:
+                        self._check_experiment(exp)
+                        experiments.append(exp)
+                    except Exception as e:
+                        pending.append((exp, _completed_future((None, e))))
+                        progress_bar.update()
+
+                if len(experiments) == 1:
+                    futures = [executor.submit(_evaluate_experiment, experiments[0])]
+                elif experiments:
+                    futures = _split_batch_future(executor.submit(_evaluate_batch, ExperimentBatch(experiments)),
+                                                  len(experiments))
+                else:
+                    futures = []
+                for exp, future in zip(experiments, futures):
+                    future.add_done_callback(lambda _: progress_bar.update())
+                    pending.append((exp, future))
+
+                while len(pending) > max_pending or (pending and pending[0][1].done()):
+                    record_next()
+            while pending:
+                record_next()
+
+    def _record_previous_result(self, exp: Experiment) -> bool:
+        if not self.resume:
+            return False
+        result = exp.load_previous_result()
+        if result is None:
+            return False
+        self.log.debug(f"Reusing the result of the previous evaluation of experiment {exp.name}")
+        self._record_results(exp, result=result)
+        return True
+
+    @staticmethod
+    def _check_experiment(exp: Experiment) -> None:
+        if exp.algorithm.training_type in [TrainingType.SUPERVISED, TrainingType.SEMI_SUPERVISED]:
+            if exp.resolved_train_dataset_path is None:
+                # Intentionally raise KeyError here if no training dataset is specified.
+                # The Error will be caught and recorded by the caller.
+                raise KeyError("Path to training dataset not found!")
+
+            # This check is not necessary for unsupervised algorithms, because they can be executed on all
+            # datasets.
+            if exp.algorithm.training_type != exp.dataset.training_type:
+                raise ValueError(f"Dataset training type ({exp.dataset.training_type}) incompatible to "
+                                 f"algorithm training type ({exp.algorithm.training_type})!")
+
+        if (exp.algorithm.input_dimensionality == InputDimensionality.UNIVARIATE and
+                exp.dataset.input_dimensionality == InputDimensionality.MULTIVARIATE):
+            raise ValueError(f"Dataset input dimensionality ({exp.dataset.input_dimensionality}) incompatible "
+                             f"to algorithm input dimensionality ({exp.algorithm.input_dimensionality})!")
+
+    def _record_exception(self, exp: Experiment, e: Exception) -> None:
+        if isinstance(e, DockerTimeoutError):
+            self.log.error(f"Evaluation of {exp.algorithm.name} on the dataset {exp.dataset} timed out.", exc_info=e)
+            status = Status.TIMEOUT
+        elif isinstance(e, DockerMemoryError):
+            self.log.error(f"Evaluation of {exp.algorithm.name} on the dataset {exp.dataset} exceeded its memory "
+                           "limit (OOM).", exc_info=e)
+            status = Status.OOM
+        else:
+            self.log.error(f"Exception occurred during the evaluation of {exp.algorithm.name} on the dataset "
+                           f"{exp.dataset}.", exc_info=e)
+            status = Status.ERROR
+        result = {m: np.nan for m in self.metric_names}
+        self._record_results(exp, result=result, status=status, error_message=repr(e))
 
     def _record_results(self,
                         exp: Experiment,
@@ -399,24 +645,26 @@ class TimeEval:
             new_row["hyper_params"] = dumps_params(exp.params)
         except ValueError:
             pass
+        if self.distributed:
+            new_row["future_result"] = None
         if result is not None and future_result is None:
             new_row.update(result)
         elif result is None and future_result is not None:
             new_row.update({"future_result": future_result})
-        self.results = pd.concat([self.results, pd.DataFrame([new_row])], ignore_index=True)
-        self.results.replace(to_replace=[None], value=np.nan, inplace=True)
+        # rows with pending results are written to disk after the results are resolved
+        self._results.append(new_row, stream=future_result is None)
 
     def _resolve_future_results(self) -> None:
         self.remote.fetch_results()
 
-        result_keys = ["hyper_params"] + self.metric_names + Times.result_keys()
-        status_keys = ["status", "error_message"]
-        keys = result_keys + status_keys
+        result_keys = ["hyper_params"] + self.metric_names + Times.result_keys() + self.metric_time_names
 
-        def get_future_result(f: Future) -> Tuple[Any, ...]:
+        def get_future_result(f: Future) -> Dict[str, Any]:
             try:
                 r = f.result()
-                return tuple(r.get(k, None) for k in result_keys) + (Status.OK, None)
+                # the resource usage is only reported if it was measured
+                usage = {k: r[k] for k in ResourceUsage.result_keys() if k in r}
+                return {**{k: r.get(k, None) for k in result_keys}, **usage, "status": Status.OK, "error_message": None}
             except DockerTimeoutError as e:
                 self.log.exception(f"Exception {repr(e)} occurred remotely.")
                 status = Status.TIMEOUT
@@ -430,10 +678,24 @@ class TimeEval:
                 status = Status.ERROR
                 error_message = repr(e)
 
-            return tuple(np.nan for _ in result_keys) + (status, error_message)
+            return {**{k: np.nan for k in result_keys}, "status": status, "error_message": error_message}
 
-        self.results[keys] = self.results["future_result"].apply(get_future_result).tolist()
-        self.results = self.results.drop(['future_result'], axis=1)
+        for row in self._results.rows():
+            future_result = row.get("future_result", None)
+            # rows without a future already contain the (error) result of a failed submission
+            if future_result is not None:
+                row.update(get_future_result(future_result))
+                self._results.stream(row)
+        self._results.invalidate()
+        self._results.drop_column("future_result")
+
+    @property
+    def results(self) -> pd.DataFrame:
+        """All collected evaluation results as a :obj:`~pandas.DataFrame` (one row per experiment).
+
+        The result rows are recorded incrementally during the evaluation run; the data frame is created on access.
+        """
+        return self._results.to_frame()
 
     def get_results(self, aggregated: bool = True, short: bool = True) -> pd.DataFrame:
         """Return the (aggregated) evaluation results of a previous evaluation run.
@@ -475,7 +737,7 @@ class TimeEval:
             time_names = ["train_main_time", "execute_main_time"]
             group_names = ["algorithm", "collection", "dataset"]
         else:
-            time_names = Times.result_keys()
+            time_names = Times.result_keys() + self.metric_time_names
             group_names = ["algorithm", "collection", "dataset", "hyper_params_id"]
         keys = [key for key in self.metric_names + time_names if key in df.columns]
         grouped_results = df.groupby(group_names)
@@ -555,44 +817,56 @@ class TimeEval:
             self.n_jobs
         )
 
+    def _prepare_steps(self) -> List[Callable[[], None]]:
+        steps = (algorithm.prepare_fn() for algorithm in self.exps.algorithms)
+        # equal steps (e.g., pulling the same Docker image) are executed only once
+        unique_steps = list(dict.fromkeys(step for step in steps if step is not None))
+        self.log.debug(f"Collected {len(unique_steps)} distinct algorithm prepare steps")
+        return unique_steps
+
     def _prepare(self) -> None:
-        self.log.debug(f"Running {len(self.exps.algorithms)} algorithm prepare steps")
-        for algorithm in self.exps.algorithms:
-            algorithm.prepare()
+        steps = self._prepare_steps()
+        self.log.debug(f"Running {len(steps)} algorithm prepare steps")
+        with tqdm.tqdm(total=len(steps), desc="Preparing", disable=self.disable_progress_bar) as progress_bar:
+            durations = _run_prepare_steps(steps, self.n_prepare_jobs, progress_bar)
+        for step, duration in durations.items():
+            self.log.info(f"Prepare step {step} took {duration:.2f} seconds")
         n = len(self.exps)
         self.log.debug(f"Creating {n} result directories")
-        for exp in self.exps:
-            exp.results_path.mkdir(parents=True, exist_ok=True)
+        for path in self.exps.results_paths():
+            path.mkdir(parents=True, exist_ok=True)
 
     def _finalize(self) -> None:
         self.log.debug(f"Running {len(self.exps)} algorithm finalize steps")
         for algorithm in self.exps.algorithms:
             algorithm.finalize()
+        shutil.rmtree(self.results_path / CSV_DATASET_CACHE, ignore_errors=True)
 
     def _distributed_prepare(self) -> None:
-        tasks: List[Tuple[Union[Callable[[List[Path]], None], Callable[[], None]], List[Any], Dict[str, Any]]] = []
-        for algorithm in self.exps.algorithms:
-            prepare_fn = algorithm.prepare_fn()
-            if prepare_fn:
-                tasks.append((prepare_fn, [], {}))
-        self.log.debug(f"Collected {len(tasks)} algorithm prepare steps")
+        tasks: List[Tuple[Callable[..., Any], List[Any], Dict[str, Any]]] = []
+        steps = self._prepare_steps()
+        if steps:
+            # a single task per host that runs all prepare steps concurrently
+            tasks.append((_run_prepare_steps, [steps, self.n_prepare_jobs], {}))
 
         def mkdirs(dirs: List[Path]) -> None:
             for d in dirs:
                 d.mkdir(parents=True, exist_ok=True)
 
-        dir_list = [exp.results_path for exp in self.exps]
+        dir_list = list(self.exps.results_paths())
         tasks.append((mkdirs, [dir_list], {}))
         self.log.debug(f"Collected {len(dir_list)} directories to create on remote nodes")
         self.remote.run_on_all_hosts(tasks, msg="Preparing")
 
     def _distributed_finalize(self) -> None:
-        tasks: List[Tuple[Callable[[], None], List[Any], Dict[str, Any]]] = []
+        tasks: List[Tuple[Callable[..., Any], List[Any], Dict[str, Any]]] = []
         for algorithm in self.exps.algorithms:
             finalize_fn = algorithm.finalize_fn()
             if finalize_fn:
                 tasks.append((finalize_fn, [], {}))
         self.log.debug(f"Collected {len(tasks)} algorithm finalize steps")
+        # the CSV-files of binary datasets are not copied back to the scheduler host
+        tasks.append((shutil.rmtree, [self.results_path / CSV_DATASET_CACHE], {"ignore_errors": True}))
         self.log.info("Running finalize steps on remote hosts")
         self.remote.run_on_all_hosts(tasks, msg="Finalizing")
 
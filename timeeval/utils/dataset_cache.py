@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .datasets import BINARY_DATASET_META, extract_labels, is_binary_dataset, load_dataset, load_labels_only
+from ..resource_constraints import DEFAULT_DATASET_CACHE_SIZE
+
+
+DEFAULT_MAX_SIZE = DEFAULT_DATASET_CACHE_SIZE
+"""Default size limit of a dataset cache in Bytes."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`~timeeval.utils.dataset_cache.DatasetCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class DatasetCache:
+    """Size-bounded LRU cache for parsed datasets and their labels.
+
+    Each dataset is parsed at most once per process as long as it is not evicted from the cache. The entries are keyed
+    by the dataset path and its modification time, so changed dataset files are re-read automatically. The cached
+    label arrays are read-only; the cached data frames must not be modified by the callers.
+
+    Use :func:`~timeeval.utils.dataset_cache.DatasetCache.default` to get the process-level cache instance that is
+    shared by all experiments and heuristics executed in this process. TimeEval sizes it in each worker process
+    according to :func:`~timeeval.ResourceConstraints.get_dataset_cache_size`.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum size of all cached entries in Bytes. Least-recently used entries are evicted if the limit is exceeded.
+        Entries larger than the limit are not cached at all.
+    """
+    _default: Optional[DatasetCache] = None
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Any, int]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def default(max_size: Optional[int] = None) -> DatasetCache:
+        """Returns the process-level dataset cache; it is resized to ``max_size`` if given."""
+        if DatasetCache._default is None:
+            DatasetCache._default = DatasetCache(max_size if max_size is not None else DEFAULT_MAX_SIZE)
+        elif max_size is not None:
+            DatasetCache._default.resize(max_size)
+        return DatasetCache._default
+
+    def load_dataset(self, path: Path) -> pd.DataFrame:
+        """Loads the dataset (see :func:`~timeeval.utils.datasets.load_dataset`) from the cache or from disk."""
+        df: pd.DataFrame = self._get("dataset", path, lambda: load_dataset(path), _frame_size)
+        return df
+
+    def load_labels(self, path: Path) -> np.ndarray:
+        """Loads the read-only labels of the dataset from the cache or from disk.
+
+        If the full dataset is already cached, the labels are extracted from it instead of parsing the file again.
+        """
+        def load() -> np.ndarray:
+            df = self._peek("dataset", path)
+            labels = extract_labels(df) if df is not None else load_labels_only(path)
+            labels.setflags(write=False)
+            return labels
+
+        labels: np.ndarray = self._get("labels", path, load, lambda a: int(a.nbytes))
+        return labels
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._size, self.max_size)
+
+    def resize(self, max_size: int) -> None:
+        """Changes the size limit and evicts least-recently used entries until the cache fits into it."""
+        with self._lock:
+            self.max_size = max_size
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _peek(self, kind: str, path: Path) -> Any:
+        with self._lock:
+            entry = self._entries.get((kind, str(path.resolve())))
+            if entry is not None and entry[0] == _file_stamp(path):
+                return entry[1]
+            return None
+
+    def _get(self, kind: str, path: Path, load: Callable[[], Any], size_of: Callable[[Any], int]) -> Any:
+        key = (kind, str(path.resolve()))
+        stamp = _file_stamp(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self._misses += 1
+            if entry is not None:
+                # dataset file changed on disk
+                self._remove(key)
+
+        value = load()
+        size = size_of(value)
+        if size <= self.max_size:
+            with self._lock:
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = (stamp, value, size)
+                self._size += size
+                while self._size > self.max_size:
+                    self._remove(next(iter(self._entries)))
+                    self._evictions += 1
+        return value
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    if is_binary_dataset(path):
+        # binary datasets are directories, whose metadata file is written last
+        path = path / BINARY_DATASET_META
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _frame_size(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=False).sum())
@@ -1,9 +1,27 @@
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
 
 
+BINARY_DATASET_SUFFIX = ".tsbin"
+"""File name suffix of datasets in the binary columnar format.
+
+A binary dataset is a directory containing a ``meta.json``-file with the column names and one NumPy ``.npy``-file per
+column (timestamp, channels, and labels). The columns can be memory-mapped without parsing the data.
+"""
+BINARY_DATASET_META = "meta.json"
+CSV_DATASET_CACHE = ".csv-datasets"
+"""Name of the folder in the results directory of an evaluation run, where TimeEval stores the CSV copies of binary
+datasets for algorithms that read the dataset from a file (see :func:`~timeeval.utils.datasets.ensure_csv_dataset`).
+"""
+
+
 def extract_labels(df: pd.DataFrame) -> np.ndarray:
     labels: np.ndarray = df.values[:, -1].astype(np.float64)
     return labels
@@ -15,9 +33,125 @@ def extract_features(df: pd.DataFrame) -> np.ndarray:
 
 
 def load_dataset(path: Path) -> pd.DataFrame:
+    if is_binary_dataset(path):
+        return load_binary_dataset(path)
     return pd.read_csv(path, parse_dates=["timestamp"], infer_datetime_format=True)
 
 
 def load_labels_only(path: Path) -> np.ndarray:
-    labels: np.ndarray = pd.read_csv(path, usecols=["is_anomaly"])["is_anomaly"].values.astype(np.float64)
+    if is_binary_dataset(path):
+        labels: np.ndarray = load_binary_dataset(path, columns=["is_anomaly"])["is_anomaly"].values
+        return labels.astype(np.float64, copy=False)
+    labels = pd.read_csv(path, usecols=["is_anomaly"])["is_anomaly"].values.astype(np.float64)
     return labels
+
+
+def is_binary_dataset(path: Path) -> bool:
+    """Checks if the path points to a dataset in the binary columnar format (see
+    :const:`~timeeval.utils.datasets.BINARY_DATASET_SUFFIX`)."""
+    return path.suffix == BINARY_DATASET_SUFFIX and (path / BINARY_DATASET_META).is_file()
+
+
+def save_binary_dataset(df: pd.DataFrame, path: Path) -> None:
+    """Stores a dataset in the binary columnar format.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The dataset in the TimeEval format: timestamp column, one or more channels, and label column.
+    path : Path
+        Path to the output directory; should use the suffix :const:`~timeeval.utils.datasets.BINARY_DATASET_SUFFIX`.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    columns = [str(c) for c in df.columns]
+    for i, column in enumerate(df.columns):
+        np.save(path / f"{i}.npy", _binary_column(df[column]), allow_pickle=False)
+    # the metadata file is written last and marks the dataset as complete
+    with (path / BINARY_DATASET_META).open("w", encoding="utf-8") as fh:
+        json.dump({"columns": columns}, fh)
+
+
+def load_binary_dataset(path: Path, columns: Optional[List[str]] = None, mmap: bool = True) -> pd.DataFrame:
+    """Loads a dataset in the binary columnar format.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the binary dataset directory.
+    columns : List[str], optional
+        Load only the selected columns.
+    mmap : bool
+        If ``True`` (default), the columns are memory-mapped (read-only) instead of being read into memory.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        The dataset. Memory-mapped columns are not copied.
+    """
+    with (path / BINARY_DATASET_META).open("r", encoding="utf-8") as fh:
+        all_columns: List[str] = json.load(fh)["columns"]
+    selected = all_columns if columns is None else columns
+    data = {}
+    for column in selected:
+        data[column] = np.load(path / f"{all_columns.index(column)}.npy", mmap_mode="r" if mmap else None,
+                               allow_pickle=False)
+    return pd.DataFrame(data, columns=selected, copy=False)
+
+
+def _binary_column(series: pd.Series) -> np.ndarray:
+    values: np.ndarray
+    if series.dtype != object:
+        values = series.to_numpy()
+        return values
+    # unparsed timestamps (e.g. integer indices loaded with `parse_dates`)
+    try:
+        values = pd.to_numeric(series).to_numpy()
+        return values
+    except (ValueError, TypeError):
+        pass
+    try:
+        values = pd.to_datetime(series).to_numpy()
+        return values
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Column '{series.name}' can not be stored in the binary format, because it has neither a "
+                         "numeric nor a datetime data type!") from e
+
+
+def ensure_csv_dataset(path: Path, cache_dir: Path) -> Path:
+    """Returns the path to a CSV-file for the dataset.
+
+    CSV datasets are returned as-is. For binary datasets, the CSV-file is created on first use and reused afterward.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the dataset.
+    cache_dir : Path
+        Directory for the CSV-files of binary datasets. Each dataset gets its own subfolder, so that the dataset
+        directories stay untouched (they might be read-only or shared with other users).
+
+    Returns
+    -------
+    csv_path : Path
+        Path to the CSV-file.
+    """
+    if not is_binary_dataset(path):
+        return path
+
+    path = path.resolve()
+    csv_path = cache_dir / hashlib.md5(str(path).encode("utf-8")).hexdigest() / f"{path.stem}.csv"
+    if not csv_path.exists() or csv_path.stat().st_mtime_ns < (path / BINARY_DATASET_META).stat().st_mtime_ns:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that concurrent tasks never see a partially written file
+        fd, tmp_name = tempfile.mkstemp(prefix=".dataset-", suffix=".csv", dir=csv_path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                load_binary_dataset(path).to_csv(fh, index=False)
+            os.replace(tmp_name, csv_path)
+        except BaseException:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            raise
+    return csv_path
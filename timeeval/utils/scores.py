@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+TEXT_SCORES_SUFFIX = ".ts"
+NPY_SCORES_SUFFIX = ".npy"
+NPZ_SCORES_SUFFIX = ".npz"
+SCORES_SUFFIXES = (TEXT_SCORES_SUFFIX, NPY_SCORES_SUFFIX, NPZ_SCORES_SUFFIX)
+NPZ_SCORES_KEY = "scores"
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+@dataclass(frozen=True)
+class ScoresFormat:
+    """Configures the file format that TimeEval uses to persist the (raw) anomaly scores of each experiment.
+
+    Per default, the scores are stored as newline-separated text (``.ts``-files). For long time series, the binary
+    NumPy format is much smaller and faster to read back.
+
+    Parameters
+    ----------
+    binary : bool
+        Store the scores in the binary NumPy format (``.npy``-files) instead of text.
+    dtype : str
+        Floating point precision of binary score files, either ``"float64"`` (default) or ``"float32"``.
+    compressed : bool
+        Compress binary score files (``.npz``-files). Requires ``binary=True``.
+
+    Examples
+    --------
+    >>> from timeeval import ScoresFormat
+    >>> ScoresFormat(binary=True, dtype="float32")
+    """
+    binary: bool = False
+    dtype: str = "float64"
+    compressed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.dtype not in ("float32", "float64"):
+            raise ValueError(f"Unsupported dtype '{self.dtype}' for anomaly scores, use 'float32' or 'float64'!")
+        if self.compressed and not self.binary:
+            raise ValueError("Only binary anomaly scores can be compressed, please also set `binary=True`!")
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix of score files in this format."""
+        if not self.binary:
+            return TEXT_SCORES_SUFFIX
+        return NPZ_SCORES_SUFFIX if self.compressed else NPY_SCORES_SUFFIX
+
+
+def save_scores(scores: np.ndarray, path: Path, scores_format: ScoresFormat = ScoresFormat()) -> Path:
+    """Stores the anomaly scores in the given format.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        The anomaly scores.
+    path : Path
+        Target path. The file name suffix is replaced by the suffix of the ``scores_format``, e.g.
+        ``anomaly_scores.ts`` becomes ``anomaly_scores.npy``.
+    scores_format : ScoresFormat
+        The file format.
+
+    Returns
+    -------
+    path : Path
+        The path of the written file.
+    """
+    path = path.with_suffix(scores_format.suffix)
+    if not scores_format.binary:
+        scores.tofile(str(path), sep="\n")
+        return path
+
+    scores = np.asarray(scores, dtype=scores_format.dtype)
+    if scores_format.compressed:
+        with path.open("wb") as fh:
+            np.savez_compressed(fh, **{NPZ_SCORES_KEY: scores})
+    else:
+        np.save(path, scores, allow_pickle=False)
+    return path
+
+
+def find_scores_file(path: Path) -> Optional[Path]:
+    """Finds the score file for the given path in any of the supported formats.
+
+    The file name suffix of ``path`` is ignored, so that e.g. ``anomaly_scores.ts`` also finds
+    ``anomaly_scores.npy``. Returns ``None`` if no score file exists.
+    """
+    if path.exists():
+        return path
+    for suffix in SCORES_SUFFIXES:
+        candidate = path.with_suffix(suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def load_scores(path: Path, mmap: bool = False) -> np.ndarray:
+    """Loads anomaly scores that were stored with :func:`~timeeval.utils.scores.save_scores`.
+
+    The format is detected automatically (see :func:`~timeeval.utils.scores.find_scores_file`). Files in other formats
+    are read as comma- or newline-separated text. If ``mmap`` is ``True``, uncompressed binary score files are
+    memory-mapped (read-only) instead of being read into memory; this is useful in combination with the streaming
+    metrics (see :class:`~timeeval.metrics.StreamingMetric`).
+    """
+    scores_path = find_scores_file(path)
+    if scores_path is None:
+        raise FileNotFoundError(f"No anomaly scores found at {path}")
+
+    if scores_path.suffix == NPZ_SCORES_SUFFIX:
+        with np.load(scores_path, allow_pickle=False) as data:
+            scores: np.ndarray = data[NPZ_SCORES_KEY]
+        return scores
+    return read_scores_file(scores_path, mmap)
+
+
+def read_scores_file(path: Path, mmap: bool = False) -> np.ndarray:
+    """Reads an anomaly score file that is either in the binary NumPy format (``.npy``) or in a comma- or
+    newline-separated text format.
+
+    The format is detected based on the file content and not on its name. Text files are parsed with the pandas C
+    engine using a fixed floating point data type, which is much faster than :func:`numpy.genfromtxt` (the parsed
+    values may differ from :func:`numpy.genfromtxt` in the last bit). If the file contains malformed values, it falls
+    back to :func:`numpy.genfromtxt`, which replaces them with ``NaN``. Binary files are memory-mapped (read-only) if
+    ``mmap`` is ``True``.
+    """
+    with path.open("rb") as fh:
+        is_npy = fh.read(len(_NPY_MAGIC)) == _NPY_MAGIC
+    if is_npy:
+        scores: np.ndarray = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return scores
+
+    try:
+        df = pd.read_csv(path, header=None, dtype=np.float64, engine="c")
+    except pd.errors.EmptyDataError:
+        return np.array([], dtype=np.float64)
+    except ValueError:
+        scores = np.genfromtxt(path, delimiter=",")
+        return scores
+    scores = df.to_numpy()
+    if 1 in scores.shape:
+        # single column (one score per line) or single row (comma-separated scores)
+        scores = scores.ravel()
+    return scores